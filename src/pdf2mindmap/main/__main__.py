@@ -1,3 +1,8 @@
+# Standard library imports
+import argparse
+import tempfile
+from pathlib import Path
+
 # Third party imports
 from dotenv import load_dotenv
 from colorama import Fore
@@ -6,27 +11,113 @@ from colorama import Fore
 from src.pdf2mindmap.main.lecture_agent import LectureAgent
 from src.pdf2mindmap.utils.pdf_converter import PdfConverter
 from src.pdf2mindmap.utils.directory_reset import directory_reset
+from src.pdf2mindmap.utils.course_graph import add_lecture_to_course
+from src.pdf2mindmap.utils.mock_llm_server import MockLLMServer, MockServerConfig
+from src.pdf2mindmap.utils.memory_budget import create_memory_monitor
+from src.pdf2mindmap.utils.run_planner import RunPlanner
+from src.pdf2mindmap.utils.workspace import Workspace, DEFAULT_WORKSPACE
 from src.pdf2mindmap.utils.constants import (
     LECTURE_PATH,
-    STREAMLIT_HINT
+    NODES_EDGES_PATH,
+    STREAMLIT_HINT,
+    GROUP_CONCURRENCY,
+    IMAGE_DETAIL,
+    PAGE_IMAGE_DPI
 )
 
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog="summarize", description="Turn a lecture PDF into a summary and a mindmap.")
+    parser.add_argument("--mock-llm", action="store_true",
+                        help="start the local OpenAI-compatible mock server and send all model calls to it")
+    parser.add_argument("--mock-latency", type=float, default=0.5,
+                        help="median latency of the mock server in seconds")
+    parser.add_argument("--mock-error-rate", type=float, default=0.0,
+                        help="share of mock requests failing with HTTP 500")
+    parser.add_argument("--llm-base-url", default=None,
+                        help="OpenAI-compatible endpoint to use instead of the default provider")
+    parser.add_argument("--add-to-course", metavar="LECTURE_NAME", default=None,
+                        help="merge the generated mindmap into the course-wide mindmap under this lecture name")
+    parser.add_argument("--plan", action="store_true",
+                        help="only convert and group the slides, then print the estimated tokens, calls, wall time and cost")
+    parser.add_argument("--concurrency", type=int, default=GROUP_CONCURRENCY,
+                        help="number of slide groups summarized concurrently")
+    parser.add_argument("--image-detail", choices=["auto", "low", "high"], default=IMAGE_DETAIL,
+                        help="image detail requested for slide images")
+    parser.add_argument("--dpi", type=int, default=PAGE_IMAGE_DPI,
+                        help="resolution of the rendered slide images")
+    parser.add_argument("--ocr", action="store_true",
+                        help="OCR pages without extractable text, e.g. scanned slides (needs Tesseract)")
+    parser.add_argument("--memory-budget", metavar="MB", type=float, default=None,
+                        help="stream pages and bound encoded images to keep the process RSS below this many MiB")
+    return parser.parse_args()
+
+def plan(args: argparse.Namespace) -> None:
+    """
+    Estimate the run from the grouped slides without calling any model.
+
+    The lecture is converted into a temporary workspace, so the outputs of the previous
+    run in resources/ are kept; only the plan is written there.
+    """
+    with tempfile.TemporaryDirectory() as tmp:
+        workspace = Workspace.at(Path(tmp))
+        directory_reset(workspace)
+        pdf_converter = PdfConverter(LECTURE_PATH, workspace, memory_budget_mb=args.memory_budget,
+                                     dpi=args.dpi, ocr=args.ocr)
+        pdf_converter.convert()
+
+        planner = RunPlanner(workspace, concurrency=args.concurrency, image_detail=args.image_detail)
+        run_plan = planner.plan()
+    planner.print_plan(run_plan)
+    planner.save(run_plan, DEFAULT_WORKSPACE.plan_path)
+    print(f"Plan written to {DEFAULT_WORKSPACE.plan_path}")
+
 def main():
     load_dotenv()
+    args = parse_args()
+
+    # Plan mode: estimate the run without calling any model or touching the previous outputs
+    if args.plan:
+        plan(args)
+        return
+
+    base_url = args.llm_base_url
+    mock_server = None
+    if args.mock_llm:
+        config = MockServerConfig(latency_median_s=args.mock_latency, error_rate=args.mock_error_rate)
+        mock_server = MockLLMServer(config, port=0).start()
+        base_url = mock_server.base_url
+        print(f"Using mock LLM server at {base_url}")
+
+    try:
+        # 1. Reset all files and directory for clean start
+        directory_reset()
 
-    # 1. Reset all files and directory for clean start
-    directory_reset()
+        # 2. Convert PDF file and save it in resources
+        memory_monitor = create_memory_monitor(args.memory_budget)
+        with memory_monitor.stage("convert"):
+            pdf_converter = PdfConverter(LECTURE_PATH, memory_budget_mb=args.memory_budget, dpi=args.dpi, ocr=args.ocr)
+            pdf_converter.convert()
 
-    # 2. Convert PDF file and save it in resources
-    pdf_converter = PdfConverter(LECTURE_PATH)
-    pdf_converter.convert()
+        # 3. Call AI Agent workflow
+        print("Calling the AI workflow...")
+        agent = LectureAgent(base_url=base_url,
+                             memory_budget_mb=args.memory_budget,
+                             memory_monitor=memory_monitor,
+                             group_concurrency=args.concurrency,
+                             image_detail=args.image_detail)
+        agent.run()
+    finally:
+        # The mock server only serves this run
+        if mock_server is not None:
+            mock_server.stop()
 
-    # 3. Call AI Agent workflow
-    print("Calling the AI workflow...")
-    agent = LectureAgent()
-    agent.run()
+    # 4. Optionally merge the lecture mindmap into the course mindmap
+    if args.add_to_course:
+        stats = add_lecture_to_course(args.add_to_course, NODES_EDGES_PATH)
+        print(f"Course mindmap updated: {stats.new_nodes} new, {stats.merged_nodes} merged concepts, "
+              f"{stats.new_edges} new relations")
 
-    # 4. Open MindMap in streamlit hint
+    # 5. Open MindMap in streamlit hint
     print(Fore.CYAN + STREAMLIT_HINT)
 
 if __name__ == "__main__":
@@ -3,8 +3,12 @@ import base64
 import json
 import os
 import shutil
+import time
+from contextlib import nullcontext
 from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
+from typing import Callable
 
 # Third-party imports
 from tqdm import tqdm
@@ -13,21 +17,68 @@ from langchain.chat_models import init_chat_model
 
 # Local application imports
 from src.pdf2mindmap.utils.page_grouper import PageGrouper
-from src.pdf2mindmap.utils.bundle_builder import build_bundles
+from src.pdf2mindmap.utils.lecture_artifact import LectureArtifact, SUMMARY_OUTPUT
+from src.pdf2mindmap.utils.model_router import ModelRouter, stage_model_names, is_openai_model
+from src.pdf2mindmap.utils.run_report import RunReport
+from src.pdf2mindmap.utils.http_pool import get_http_client, http_pool_stats
+from src.pdf2mindmap.utils.memory_budget import MemoryMonitor, ByteBudget, create_memory_monitor
+from src.pdf2mindmap.utils.slide_dedup import SlideDeduplicator, collapse_lecture, split_collapsed
+from src.pdf2mindmap.utils.workspace import Workspace, DEFAULT_WORKSPACE
 from src.pdf2mindmap.utils.constants import (
-    NODES_EDGES_PATH,
-    RESOURCES_JSON_DIR,
-    SUMMARY_PATH,
-    RESOURCES_MARKDOWNS_DIR,
-    RESOURCES_IMAGES_DIR
-)
-from src.pdf2mindmap.utils.prompts import (
-    SINGLE_SLIDE_EXTRACTOR_PROMPT,
-    MULTIPLE_SLIDE_EXTRACTOR_PROMPT,
-    MINDMAP_PROMPT,
-    SUMMARY_PROMPT,
-    SYSTEM_PROMPT
+    MODEL_TEMPERATURE,
+    GROUP_CONCURRENCY,
+    DEDUP_SLIDES,
+    IMAGE_DETAIL,
+    MEMORY_IMAGE_SHARE,
+    IMAGE_REQUEST_MEMORY_FACTOR,
+    GROUP_MULTIMODAL_STAGE,
+    SUMMARY_STAGE,
+    MINDMAP_STAGE
 )
+from src.pdf2mindmap.utils.prompt_builder import PromptBuilder, SINGLE_SLIDE_PREFIX, group_text
+
+def init_stage_models(base_url: str | None = None, models: dict | None = None) -> dict:
+    """
+    Create the chat model of every pipeline stage.
+
+    Stages configured with the same model name share one model instance and all OpenAI
+    models share the process-wide pooled HTTP client (see utils/http_pool.py); models of
+    other providers keep their own clients. The returned
+    mapping can be reused by several LectureAgents (e.g. by the service workers) so
+    that clients and their connections stay warm.
+
+    :param base_url: Optional OpenAI-compatible endpoint for all stages.
+    :type base_url: str | None
+    :param models: Already initialized models for some stages; these are kept as they are.
+    :type models: dict | None
+    :return: Mapping from every stage name to its chat model.
+    :rtype: dict
+    """
+    models = dict(models or {})
+    by_name = {}
+    for stage, model_name in stage_model_names().items():
+        if stage in models:
+            continue
+        if model_name not in by_name:
+            if base_url is None:
+                # Only langchain-openai accepts an httpx client
+                client = {"http_client": get_http_client()} if is_openai_model(model_name) else {}
+                by_name[model_name] = init_chat_model(
+                    model_name,
+                    temperature=MODEL_TEMPERATURE,
+                    **client
+                )
+            else:
+                by_name[model_name] = init_chat_model(
+                    model_name,
+                    model_provider="openai",
+                    temperature=MODEL_TEMPERATURE,
+                    base_url=base_url,
+                    api_key=os.environ.get("OPENAI_API_KEY", "mock"),
+                    http_client=get_http_client()
+                )
+        models[stage] = by_name[model_name]
+    return models
 
 class LectureAgent():
     """
@@ -36,18 +87,90 @@ class LectureAgent():
     1. grouped_slide_summary(): The agent creates summaries for grouped slides
     2. summarize(): Then it summarizes all the single slide summaries in one markdown file
     3. summary_to_mind_map(): At last it creates a json file containing the nodes and edges for the mindmap
+
+    Slides are read from and intermediate results written to the workspace's
+    :class: LectureArtifact; the summary and the mindmap are also written as files.
+
+    Every stage has its own chat model (see STAGE_MODELS). Slide groups are routed by
+    :class: ModelRouter either to a small text-only model or to the multimodal model,
+    and every model call is recorded in a :class: RunReport. Messages are assembled by
+    :class: PromptBuilder with a fixed system prefix per stage so that provider-side
+    prompt caching can reuse it across calls.
+
+    :param models: Optional mapping from stage name to an already initialized chat model,
+                   e.g. fake models for offline measurements. Missing stages are created
+                   with init_chat_model from the configured model names.
+    :type models: dict | None
+    :param base_url: Optional OpenAI-compatible endpoint for all stages, e.g. the local
+                     :class: MockLLMServer for offline load tests.
+    :type base_url: str | None
+    :param workspace: Workspace whose lecture artifact holds the converted slides and which receives all outputs.
+    :type workspace: Workspace
+    :param progress: Optional callback receiving a short progress message per step.
+    :type progress: Callable[[str], None] | None
+    :param memory_budget_mb: Optional memory budget in MiB. Slide images are base64 encoded
+                             only right before their request; with a budget, concurrent
+                             group requests wait until their images fit into
+                             MEMORY_IMAGE_SHARE of it.
+    :type memory_budget_mb: float | None
+    :param memory_monitor: Monitor receiving the peak RSS of every stage, e.g. one that
+                           already measured the PDF conversion. Without one, stages are
+                           only measured if a memory budget is given.
+    :type memory_monitor: MemoryMonitor | None
+    :param group_concurrency: Number of slide groups summarized concurrently.
+    :type group_concurrency: int
+    :param image_detail: Image detail requested for slide images ("auto", "low" or "high").
+    :type image_detail: str
     """
-    def __init__(self) -> None:
-        self.summary_model = init_chat_model("gpt-4.1-mini-2025-04-14", temperature = 0.5)
-        self.bundles = build_bundles(RESOURCES_MARKDOWNS_DIR, RESOURCES_IMAGES_DIR)
+    def __init__(self,
+                 models: dict | None = None,
+                 base_url: str | None = None,
+                 workspace: Workspace = DEFAULT_WORKSPACE,
+                 progress: Callable[[str], None] | None = None,
+                 memory_budget_mb: float | None = None,
+                 memory_monitor: MemoryMonitor | None = None,
+                 group_concurrency: int = GROUP_CONCURRENCY,
+                 image_detail: str = IMAGE_DETAIL) -> None:
+        self.base_url = base_url
+        self.workspace = workspace
+        self.progress = progress or (lambda message: None)
+        self.model_names = stage_model_names()
+        self.models = init_stage_models(base_url, models)
+        self.summary_model = self.models[GROUP_MULTIMODAL_STAGE]
+        self.router = ModelRouter()
+        self.deduplicator = SlideDeduplicator(enabled=DEDUP_SLIDES)
+        self.prompt_builder = PromptBuilder()
+        self.report = RunReport()
+        self.group_concurrency = group_concurrency
+        self.image_detail = image_detail
+        self.memory = memory_monitor or create_memory_monitor(memory_budget_mb)
+        self.image_budget = None
+        if memory_budget_mb is not None:
+            self.image_budget = ByteBudget(int(memory_budget_mb * MEMORY_IMAGE_SHARE * 2**20))
+        self.artifact = LectureArtifact(workspace.artifact_path)
+        if self.artifact.page_count() == 0:
+            self.artifact.close()
+            raise RuntimeError(f"{workspace.artifact_path} contains no converted slides")
 
     def run(self) -> None:
         #self.single_slide_summary() 
-        self.grouped_slides_summary()
-        print("Generating Markdown Summary of your lecture...")
-        self.summarize()
-        print("Generating the nodes and edges of your mindmap...")
-        self.summary_to_mind_map()
+        try:
+            with self.memory.stage("group_summaries"):
+                self.grouped_slides_summary()
+            print("Generating Markdown Summary of your lecture...")
+            self.progress("summary")
+            with self.memory.stage("summary"):
+                self.summarize()
+            print("Generating the nodes and edges of your mindmap...")
+            self.progress("mindmap")
+            with self.memory.stage("mindmap"):
+                self.summary_to_mind_map()
+        finally:
+            self.artifact.close()
+        self.report.http_pool = http_pool_stats()
+        self.report.memory = self.memory.summary()
+        self.report.print_report()
+        self.report.save(self.workspace.run_report_path)
 
     def grouped_slides_summary(self):
         """
@@ -55,180 +178,227 @@ class LectureAgent():
 
         This method performs the following steps:
 
-        1. Ensures that the RESOURCES_JSON_DIR directory is reset by deleting any
-        existing directory and recreating it.
-        2. Uses :class: PageGrouper to cluster slides into groups of semantically
+        1. Uses :class: PageGrouper to cluster slides into groups of semantically
         related pages using HDBSCAN.
-        3. For each slide group, constructs a multimodal prompt consisting of:
+        2. Collapses build-up sequences and repeated slides of the whole lecture in page
+        order with :class: SlideDeduplicator (so sequences crossing a group boundary are
+        collapsed too) and drops the collapsed slides from their groups. Every group is
+        routed with :class: ModelRouter from the slides' markdown and PNG sizes and its
+        prompt is constructed:
             - the combined markdown content of all slides in the group
-            - the corresponding slide images encoded as base64 URLs
-        4. Invokes the summary model with the generated prompt.
-        5. Writes the resulting structured summaries to individual JSON files
-        in RESOURCES_JSON_DIR.
-
-        Each output file contains the summarized content for one slide group.
+            - the corresponding slide images encoded as base64 URLs, only if the
+              group was routed to the multimodal model (only then they are loaded)
+        3. Invokes the model of the routed stage and records the call in the run report.
+        Up to GROUP_CONCURRENCY groups are processed concurrently.
+        4. Stores every group with its pages, collapsed slides and structured summary
+        in the lecture artifact, so later stages can load all groups in one read.
+        Groups whose slides were all collapsed into other groups are stored without a
+        model call and with empty notes.
 
         :return: None
         """
 
         # 1. Use PageGrouper to group slides into semantically related pages
-        page_grouper = PageGrouper()
+        self.progress("grouping")
+        page_grouper = PageGrouper(self.workspace)
         page_grouper.run()
         groups = page_grouper.groups
 
-        # 2. For each slide group construct prompt
-        for group, pages_list in tqdm(groups.items(), desc="Generating JSON summaries"):
-            messages = [
-                {"role": "user", "content": [
-                ]}
+        # 2. Collapse build-up sequences and repeated slides across group boundaries
+        self.progress("deduplicating")
+        collapsed, slide_tokens = collapse_lecture(self.artifact, self.deduplicator, self.image_detail)
+
+        # 3. Summarize the slide groups concurrently, sharing the pooled HTTP connections
+        done = 0
+        with ThreadPoolExecutor(max_workers=self.group_concurrency) as executor:
+            futures = [
+                executor.submit(self._summarize_group, group, pages_list, collapsed, slide_tokens)
+                for group, pages_list in sorted(groups.items())
             ]
+            for future in tqdm(as_completed(futures), total=len(futures), desc="Generating JSON summaries"):
+                future.result()
+                done += 1
+                self.progress(f"group {done}/{len(groups)}")
 
-            group_prompt = MULTIPLE_SLIDE_EXTRACTOR_PROMPT
-            image_prompts = []
-            for page in pages_list:
-                slide_id, md_path, img_path = self.bundles[page-1]
-                md_text = self._load_text(md_path)
-
-                single_slide_text_prompt = f"\n\nSLIDE_ID: {slide_id}\nMARKDOWN:\n{md_text}"
-                group_prompt += single_slide_text_prompt
-                
-                image_dict = {"type": "image_url", "image_url": {"url": self._png_to_base64_url(img_path)}}
-                image_prompts.append(image_dict)
-            
-            text_dict = {"type": "text", "text": group_prompt}
-            messages[0]["content"].append(text_dict)
-            for prompt in image_prompts:
-                messages[0]["content"].append(prompt)
-
-            # 3. Invoke model with created prompt
-            response = self.summary_model.invoke(messages)
-
-            # Write structured response to JSON files in resources/jsons
-            data = json.loads(response.content)
-            all_notes = []
-            all_notes.append(data)
-            with open(RESOURCES_JSON_DIR / f"{slide_id}.json", "w", encoding="utf-8") as f:
-                json.dump(all_notes, f, ensure_ascii=False, indent=2)
+    def _summarize_group(self, group: int, pages_list: list[int], collapsed: dict, slide_tokens: dict) -> dict:
+        """
+        Route, prompt and summarize one slide group and store it in the lecture artifact.
+
+        :param group: Group id from :class: PageGrouper.
+        :type group: int
+        :param pages_list: 1-based page numbers of the group.
+        :type pages_list: list[int]
+        :param collapsed: Dropped slide ids of the lecture mapped to the kept slide ids
+                          covering them (see :func: collapse_lecture).
+        :type collapsed: dict[str, str]
+        :param slide_tokens: Estimated (text, image) input tokens of every slide.
+        :type slide_tokens: dict[str, tuple[int, int]]
+        :return: The stored group (group_id, pages, collapsed, notes).
+        :rtype: dict
+        """
+        # Markdown and PNG sizes are enough for routing, images are only loaded for the multimodal model
+        page_numbers = sorted(set(pages_list))
+        all_pages = self.artifact.page_sizes(page_numbers)
+
+        # Drop the slides collapsed by the lecture-wide dedup pass
+        group_pages, group_collapsed = split_collapsed(all_pages, collapsed)
+        if not group_pages:
+            self.artifact.put_group(group, list(pages_list), group_collapsed, [])
+            return {"group_id": group, "pages": list(pages_list), "collapsed": group_collapsed, "notes": []}
+        kept_numbers = [number for number, page in zip(page_numbers, all_pages) if page[0] not in collapsed]
+
+        # Route the group to a model stage and construct the prompt
+        decision = self.router.route_sizes(group_pages)
+        use_images = decision.stage == GROUP_MULTIMODAL_STAGE
+
+        # Slides collapsed into this group's slides are accounted here, where their final frame is sent
+        kept_ids = {page[0] for page in group_pages}
+        dropped_ids = [slide_id for slide_id, target_id in collapsed.items() if target_id in kept_ids]
+        dedup_saved_tokens = 0
+        for slide_id in dropped_ids:
+            text_tokens, image_tokens = slide_tokens[slide_id]
+            dedup_saved_tokens += text_tokens + (image_tokens if use_images else 0)
+
+        # The stage instructions are the fixed system prefix, the slides are the variable part
+        group_prompt = group_text(group_pages)
+        images_sent = len(group_pages) if use_images else 0
+        saved_image_tokens = 0
+        if not use_images:
+            saved_image_tokens = sum(slide_tokens[page[0]][1] for page in group_pages)
+
+        # Load and encode the images only for the duration of the request and release them with it
+        images_size = sum(png_size for _, _, png_size, _, _ in group_pages) if use_images else 0
+        with self._reserve_image_memory(images_size):
+            images = self.artifact.images(kept_numbers) if use_images else []
+            image_urls = [self._png_to_base64_url(png) for png in images]
+            del images
+            messages = self.prompt_builder.build(decision.stage, group_prompt, image_urls, self.image_detail)
+            del image_urls
+
+            # Invoke the routed model with created prompt
+            response = self._invoke(
+                decision.stage,
+                messages,
+                images_sent=images_sent,
+                images_skipped=len(group_pages) - images_sent,
+                saved_image_tokens=saved_image_tokens,
+                pages_deduplicated=len(dropped_ids),
+                dedup_images_saved=len(dropped_ids) if use_images else 0,
+                dedup_saved_tokens=dedup_saved_tokens
+            )
+            del messages
+
+        # Store the structured response in the lecture artifact, keyed by group id
+        data = json.loads(response.content)
+        all_notes = []
+        all_notes.append(data)
+        self.artifact.put_group(group, list(pages_list), group_collapsed, all_notes)
+
+        return {
+            "group_id": group,
+            "pages": list(pages_list),
+            "collapsed": group_collapsed,
+            "notes": all_notes
+        }
 
     def summarize(self):
         """
         Generate a consolidated Markdown summary for the entire lecture.
 
-        This method reads all JSON summary files located in RESOURCES_JSON_DIR,
-        each representing a summarized slide group, and combines their contents
-        into a single prompt. The prompt is then passed to the summary model to
+        This method reads the notes of all summarized slide groups from the lecture
+        artifact in one read, ordered by group id, so the combined
+        prompt is byte-identical across runs with the same group outputs. The prompt is then passed to the summary model to
         generate a comprehensive Markdown summary of the full lecture.
 
-        The resulting summary is written to SUMMARY_PATH.
+        The resulting summary is stored in the lecture artifact and written to SUMMARY_PATH.
 
         :return: None
         """
-        slides = []
-        
-        # Loop through resources/jsons, convert JSONs to dictionaries and append them to the slides list
-        directory = RESOURCES_JSON_DIR
-        for filename in os.listdir(directory):
-            with open(os.path.join(directory, filename)) as json_slide: 
-                slide = json.load(json_slide)
-            slides.append(slide)
-        
+        # Load all group notes in group id order, groups collapsed into others have none
+        slides = [entry["notes"] for entry in self.artifact.groups() if entry["notes"]]
+
         # Construct a summarization prompt with the slides list
-        messages = [
-            {
-                "role": "system",
-                "content": SUMMARY_PROMPT
-            },
-            {
-                "role": "user",
-                "content": [
-                    {"type": "text",
-                        "text": (
-                            "Below is a list of JSON objects. "
-                            "Each object represents a summary of a semantically related group of lecture slides.\n\n"
-                            "Use this information to generate a coherent, well-structured summary of the entire lecture.\n\n"
-                            f"{json.dumps(slides, ensure_ascii=False, indent=2)}")
-                    }
-                ]
-            }
-        ]
+        messages = self.prompt_builder.build(
+            SUMMARY_STAGE,
+            json.dumps(slides, ensure_ascii=False, indent=2)
+        )
         # invoke the model with the message
-        response = self.summary_model.invoke(messages)
+        response = self._invoke(SUMMARY_STAGE, messages)
     
-        # Store response in resources/summary.md 
-        with open(SUMMARY_PATH, "w", encoding="utf-8") as f:
+        # Store response in the lecture artifact and resources/summary.md
+        self.artifact.put_output(SUMMARY_OUTPUT, response.content)
+        with open(self.workspace.summary_path, "w", encoding="utf-8") as f:
             f.write(response.content)
     
     def summary_to_mind_map(self):
         """
         Generate a mind map representation from the lecture summary.
 
-        This method reads the consolidated lecture summary from SUMMARY_PATH
+        This method reads the consolidated lecture summary from the lecture artifact
         and uses it to construct a prompt for the mind map generation model.
         The model response is expected to describe nodes and edges (including labels)
         that represent the conceptual structure of the lecture.
 
         The generated nodes and edges are written as a JSON file to
         NODES_EDGES_PATH and can be used later to build a visual mind map.
+        They are stored in the lecture artifact together with their precomputed
+        hierarchical layout for the Streamlit viewer.
 
         :return: None
         """
-        with open(SUMMARY_PATH, "r") as f:
-            md_summary = f.read()
+        md_summary = self.artifact.output(SUMMARY_OUTPUT)
 
         # Construct a prompt with the resources/summary.md
-        messages = [
-            {
-                "role": "system",
-                "content": MINDMAP_PROMPT
-            },
-            {
-                "role": "user",
-                "content": [
-                    {
-                        "type": "text",
-                        "text": md_summary
-                    }
-                ]
-            }
-        ]
+        messages = self.prompt_builder.build(MINDMAP_STAGE, md_summary)
 
         # Invoke the model and store the node_edges.json in resources directory
-        response = self.summary_model.invoke(messages)
-        with open(NODES_EDGES_PATH, "w", encoding="utf-8") as f:
+        response = self._invoke(MINDMAP_STAGE, messages)
+        with open(self.workspace.nodes_edges_path, "w", encoding="utf-8") as f:
             f.write(response.content)
+        self.artifact.put_mindmap(response.content)
 
-    def _load_text(self, path: Path) -> str:
+    def _invoke(self, stage: str, messages: list, prefix: str | None = None, **report_fields):
         """
-        Load the textual content of a markdown file.
+        Invoke the chat model of a stage and record latency and token usage in the run report.
+
+        :param stage: Name of the pipeline stage (see STAGE_MODELS).
+        :type stage: str
+        :param messages: Chat messages passed to the model.
+        :type messages: list
+        :param prefix: Name of the messages' system prefix if it is not the stage's own (see :class: PromptBuilder).
+        :type prefix: str | None
+        :param report_fields: Additional fields for the run report (e.g. images_skipped).
+        :return: The model response.
+        """
+        start = time.perf_counter()
+        response = self.models[stage].invoke(messages)
+        latency = time.perf_counter() - start
 
-        This helper method reads a slide's markdown representation and returns
-        its contents as a plain string. The returned text is used as input for downstream
-        processing (e.g., building prompts for grouped_slides_summary and
-        single_slide_summary).
+        self.report.record(stage, self.model_names[stage], response, latency,
+                           prefix_cacheable=self.prompt_builder.cacheable(prefix or stage), **report_fields)
+        return response
 
-        :param path: Path to the markdown file.
-        :type path: pathlib.Path
-        :return: Markdown file contents as a single string.
-        :rtype: str
-        """
-        return path.read_text(encoding="utf-8", errors="ignore")
+    def _reserve_image_memory(self, size: int):
+        """Wait until images of size PNG bytes, loaded and encoded, fit into the image memory budget (no-op without a budget)."""
+        if self.image_budget is None or not size:
+            return nullcontext()
+        return self.image_budget.reserve(size * IMAGE_REQUEST_MEMORY_FACTOR)
 
-    def _png_to_base64_url(self, png_path: Path) -> str:
+    def _png_to_base64_url(self, png: bytes) -> str:
         """
         Encode a PNG image as a base64 data URL.
 
-        This helper method reads a PNG image from disk, encodes it in base64,
+        This helper method encodes a PNG image from the lecture artifact in base64,
         and returns a data URL string that can be embedded directly into
         multimodal prompts (e.g., for grouped_slides_summary or
         single_slide_summary).
 
-        :param png_path: Path to the PNG image file.
-        :type png_path: pathlib.Path
+        :param png: The PNG image.
+        :type png: bytes
         :return: Base64-encoded PNG image as a data URL.
         :rtype: str
         """
-        data = png_path.read_bytes()
-        b64 = base64.b64encode(data).decode()
+        b64 = base64.b64encode(png).decode()
         return f"data:image/png;base64,{b64}"
 
     def single_slide_summary(self):
@@ -242,14 +412,13 @@ class LectureAgent():
 
         The method performs the following steps:
 
-        1. Ensures that the RESOURCES_JSON_DIR directory is reset by deleting any
-        existing directory and recreating it.
-        2. Iterates over all slide bundles.
-        3. For each slide, constructs a multimodal prompt containing:
+        1. Iterates over all slides of the lecture artifact.
+        2. For each slide, constructs a multimodal prompt containing:
             - the slide's markdown content
             - the corresponding slide image encoded as a base64 URL
-        4. Invokes the summary model for each slide individually.
-        5. Writes one JSON summary file per slide to RESOURCES_JSON_DIR.
+        3. Invokes the multimodal group model for each slide individually and records
+        the call in the run report.
+        4. Stores one JSON summary per slide in the lecture artifact, named by its slide id.
 
         This method is kept for experimentation or comparison with grouped summaries.
 
@@ -257,24 +426,19 @@ class LectureAgent():
         """
         
         # Create 
-        for slide_id, md_path, img_path in self.bundles:
-            md_text = self._load_text(md_path)
-
-            messages = [
-                {"role": "user", "content": [
-                    {"type": "text", "text": f"SLIDE_ID: {slide_id}\n\nMARKDOWN:\n{md_text}\n\n{SINGLE_SLIDE_EXTRACTOR_PROMPT}"},
-                    {"type": "image_url", "image_url": {"url": self._png_to_base64_url(img_path)}},
-                ]}
-            ]
+        for slide_id, md_text, png in self.artifact.pages():
+            messages = self.prompt_builder.build(
+                SINGLE_SLIDE_PREFIX,
+                f"SLIDE_ID: {slide_id}\n\nMARKDOWN:\n{md_text}",
+                [self._png_to_base64_url(png)]
+            )
 
-            response = self.summary_model.invoke(messages)
+            response = self._invoke(GROUP_MULTIMODAL_STAGE, messages, prefix=SINGLE_SLIDE_PREFIX, images_sent=1)
 
-            print(response.usage_metadata)
             data = json.loads(response.content)
 
             all_notes = []
 
             all_notes.append(data)
 
-            with open(RESOURCES_JSON_DIR / f"{slide_id}.json", "w", encoding="utf-8") as f:
-                json.dump(all_notes, f, ensure_ascii=False, indent=2)
\ No newline at end of file
+            self.artifact.put_output(slide_id, json.dumps(all_notes, ensure_ascii=False))
\ No newline at end of file
@@ -0,0 +1,213 @@
+# Standard library imports
+import argparse
+import asyncio
+import json
+import threading
+
+# Third party imports
+from dotenv import load_dotenv
+
+# Local application imports
+from src.pdf2mindmap.main.lecture_agent import LectureAgent, init_stage_models
+from src.pdf2mindmap.utils.pdf_converter import PdfConverter
+from src.pdf2mindmap.utils.directory_reset import directory_reset
+from src.pdf2mindmap.utils.page_grouper import load_embedding_model
+from src.pdf2mindmap.utils.job_queue import Job, JobQueue, QueueFullError
+from src.pdf2mindmap.utils.constants import (
+    SERVICE_HOST,
+    SERVICE_PORT,
+    SERVICE_JOBS_DIR,
+    SERVICE_WORKERS,
+    SERVICE_MAX_QUEUED_JOBS,
+    SERVICE_MAX_UPLOAD_BYTES
+)
+
+
+class LectureService():
+    """
+    Long-running HTTP service (ASGI) around the lecture pipeline.
+
+    Endpoints:
+
+    - ``POST /jobs`` with the raw PDF as body: enqueue a job, 202 with its id,
+      503 with Retry-After if the queue is full (backpressure), 413 if too large
+    - ``GET /jobs/{id}``: status and current pipeline step of a job
+    - ``GET /jobs/{id}/summary`` and ``GET /jobs/{id}/mindmap``: results of a finished job
+    - ``GET /health``: worker and queue utilization
+
+    The chat models are created once and shared by all jobs, the embedding model is
+    loaded at startup, so workers start every job with warm models and connections.
+    Startup runs in the ASGI lifespan; until it has completed, job requests are answered
+    with 503. Model loading, upload writes and result reads run in worker threads so
+    they never block the event loop.
+
+    :param base_url: Optional OpenAI-compatible endpoint for all model calls.
+    :type base_url: str | None
+    :param workers: Number of concurrent jobs.
+    :type workers: int
+    :param max_queued: Number of jobs that may wait for a worker.
+    :type max_queued: int
+    """
+    def __init__(self,
+                 base_url: str | None = None,
+                 workers: int = SERVICE_WORKERS,
+                 max_queued: int = SERVICE_MAX_QUEUED_JOBS) -> None:
+        self.base_url = base_url
+        self.models = None
+        self.queue = JobQueue(self.run_job, SERVICE_JOBS_DIR, workers, max_queued)
+        self.started = False
+        self.start_lock = threading.Lock()
+        # PyMuPDF is not thread-safe: conversions run one at a time, the LLM stages concurrently
+        self.conversion_lock = threading.Lock()
+
+    def start(self) -> None:
+        """Warm up the models and start the worker pool (idempotent)."""
+        with self.start_lock:
+            if self.started:
+                return
+            self.models = init_stage_models(self.base_url)
+            load_embedding_model()
+            self.queue.start()
+            self.started = True
+
+    def run_job(self, job: Job, progress) -> None:
+        """Run the full pipeline for one job inside its own workspace."""
+        workspace = job.workspace
+        progress("converting")
+        directory_reset(workspace)
+        with self.conversion_lock:
+            pdf_converter = PdfConverter(workspace.lecture_path, workspace)
+            pdf_converter.convert()
+
+        agent = LectureAgent(models=self.models, workspace=workspace, progress=progress)
+        agent.run()
+        progress("finished")
+
+    async def __call__(self, scope, receive, send) -> None:
+        if scope["type"] == "lifespan":
+            await self._lifespan(receive, send)
+            return
+        if scope["type"] != "http":
+            return
+
+        method = scope["method"]
+        parts = [part for part in scope["path"].split("/") if part]
+
+        if method == "GET" and parts == ["health"]:
+            await self._send_json(send, 200, self.queue.stats())
+        elif method == "POST" and parts == ["jobs"]:
+            await self._create_job(scope, receive, send)
+        elif method == "GET" and len(parts) in (2, 3) and parts[0] == "jobs":
+            await self._get_job(send, parts[1], parts[2] if len(parts) == 3 else None)
+        else:
+            await self._send_json(send, 404, {"error": "Not found"})
+
+    async def _lifespan(self, receive, send) -> None:
+        while True:
+            message = await receive()
+            if message["type"] == "lifespan.startup":
+                try:
+                    await asyncio.to_thread(self.start)
+                except Exception as e:
+                    await send({"type": "lifespan.startup.failed", "message": f"{type(e).__name__}: {e}"})
+                    return
+                await send({"type": "lifespan.startup.complete"})
+            elif message["type"] == "lifespan.shutdown":
+                await send({"type": "lifespan.shutdown.complete"})
+                return
+
+    async def _create_job(self, scope, receive, send) -> None:
+        if not self.started:
+            await self._send_json(send, 503, {"error": "Service is not started (ASGI lifespan required)"},
+                                  {"Retry-After": "30"})
+            return
+        # Reject before reading the body if the queue is already full
+        if self.queue.pending.full():
+            await self._send_json(send, 503, {"error": "Job queue is full"}, {"Retry-After": "30"})
+            return
+
+        body = bytearray()
+        more_body = True
+        while more_body:
+            message = await receive()
+            body += message.get("body", b"")
+            more_body = message.get("more_body", False)
+            if len(body) > SERVICE_MAX_UPLOAD_BYTES:
+                await self._send_json(send, 413, {"error": "PDF is too large"})
+                return
+
+        if not body.startswith(b"%PDF"):
+            await self._send_json(send, 400, {"error": "Request body must be a PDF file"})
+            return
+
+        try:
+            job = await asyncio.to_thread(self.queue.submit, bytes(body))
+        except QueueFullError as e:
+            await self._send_json(send, 503, {"error": str(e)}, {"Retry-After": "30"})
+            return
+        await self._send_json(send, 202, job.to_dict(), {"Location": f"/jobs/{job.id}"})
+
+    async def _get_job(self, send, job_id: str, result: str | None) -> None:
+        job = self.queue.get(job_id)
+        if job is None:
+            await self._send_json(send, 404, {"error": "Unknown job"})
+            return
+        if result is None:
+            await self._send_json(send, 200, job.to_dict())
+            return
+        if job.status != "done":
+            await self._send_json(send, 409, job.to_dict())
+            return
+
+        results = {
+            "summary": (job.workspace.summary_path, "text/markdown; charset=utf-8"),
+            "mindmap": (job.workspace.nodes_edges_path, "application/json")
+        }
+        if result not in results:
+            await self._send_json(send, 404, {"error": "Not found"})
+            return
+        path, content_type = results[result]
+        try:
+            content = await asyncio.to_thread(path.read_bytes)
+        except FileNotFoundError:
+            # The job expired and its workspace was deleted
+            await self._send_json(send, 404, {"error": "Unknown job"})
+            return
+        await self._send(send, 200, content, content_type)
+
+    async def _send_json(self, send, status: int, data: dict, headers: dict | None = None) -> None:
+        body = json.dumps(data, ensure_ascii=False).encode("utf-8")
+        await self._send(send, status, body, "application/json", headers)
+
+    async def _send(self, send, status: int, body: bytes, content_type: str, headers: dict | None = None) -> None:
+        raw_headers = [(b"content-type", content_type.encode()), (b"content-length", str(len(body)).encode())]
+        for key, value in (headers or {}).items():
+            raw_headers.append((key.lower().encode(), value.encode()))
+        await send({"type": "http.response.start", "status": status, "headers": raw_headers})
+        await send({"type": "http.response.body", "body": body})
+
+
+load_dotenv()
+app = LectureService()
+
+
+def main():
+    parser = argparse.ArgumentParser(prog="pdf2mindmap-service", description="Run the PDF2Mindmap HTTP service.")
+    parser.add_argument("--host", default=SERVICE_HOST)
+    parser.add_argument("--port", type=int, default=SERVICE_PORT)
+    parser.add_argument("--workers", type=int, default=SERVICE_WORKERS, help="number of concurrent jobs")
+    parser.add_argument("--max-queued", type=int, default=SERVICE_MAX_QUEUED_JOBS, help="jobs waiting before requests are rejected")
+    parser.add_argument("--llm-base-url", default=None, help="OpenAI-compatible endpoint to use instead of the default provider")
+    args = parser.parse_args()
+
+    try:
+        import uvicorn
+    except ImportError:
+        raise SystemExit("The service needs uvicorn: pip install '.[service]'")
+
+    service = LectureService(args.llm_base_url, args.workers, args.max_queued)
+    uvicorn.run(service, host=args.host, port=args.port, lifespan="on")
+
+
+if __name__ == "__main__":
+    main()
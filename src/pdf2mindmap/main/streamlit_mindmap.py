@@ -1,36 +1,90 @@
 import os
-import json
+from pathlib import Path
 
 # Third-party imports
 import streamlit as st
-from yfiles_graphs_for_streamlit import StreamlitGraphWidget, Node, Edge
+from yfiles_graphs_for_streamlit import StreamlitGraphWidget, Node, Edge, Layout
 
 # Local application imports
-from src.pdf2mindmap.utils.constants import NODES_EDGES_PATH
+from src.pdf2mindmap.utils.lecture_artifact import LectureArtifact
+from src.pdf2mindmap.utils.mindmap_layout import load_mindmap, visible_subgraph
+from src.pdf2mindmap.utils.constants import (
+    ARTIFACT_PATH,
+    COURSE_NODES_EDGES_PATH,
+    COURSE_LAYOUT_PATH
+)
 
 st.set_page_config(
     page_title="Lecture Mindmap",
     layout="wide"
 )
 
+@st.cache_data
+def load_cached_mindmap(source: str, path: str, mtime_ns: int, size: int) -> tuple[dict, dict]:
+    """
+    Load a mindmap and its precomputed layout once per version of the file holding it.
+
+    The lecture mindmap is read from the lecture artifact, opened read-only so the viewer
+    never writes while a pipeline run holds it, the course mindmap from its
+    nodes_edges.json. The file's mtime and size are part of the cache key, so Streamlit
+    reruns reuse the parsed graph and the layout until the file changes.
+    """
+    if source == "Lecture":
+        with LectureArtifact(Path(path), read_only=True) as artifact:
+            return artifact.mindmap()
+    return load_mindmap(Path(path), COURSE_LAYOUT_PATH)
+
 st.markdown("---")
 st.title("Lecture Mindmap")
 
-with open(NODES_EDGES_PATH, "r", encoding="utf-8") as f:
-    nodes_and_edges = f.read()
+# The course-wide mindmap is only offered once a lecture was added to it
+sources = {"Lecture": ARTIFACT_PATH}
+if os.path.exists(COURSE_NODES_EDGES_PATH):
+    sources["Course"] = COURSE_NODES_EDGES_PATH
+
+with st.sidebar:
+    source = st.radio("Mindmap", options=list(sources), horizontal=True)
+path = sources[source]
+
+# Writes to the artifact land in its WAL file until SQLite checkpoints them, so the WAL is part of the version
+versions = [os.stat(file) for file in (path, f"{path}-wal") if os.path.exists(file)]
+try:
+    if not versions:
+        raise RuntimeError(f"{path} does not exist")
+    data, layout = load_cached_mindmap(source, str(path), max(v.st_mtime_ns for v in versions),
+                                       sum(v.st_size for v in versions))
+except RuntimeError:
+    # No run has produced a mindmap yet (or the current run has not reached the mindmap stage)
+    st.info("No mindmap yet — run the pipeline first")
+    st.stop()
 
-# Serialize the string as a dictionary
-data = json.loads(nodes_and_edges)
+# Collapsed view: only the first levels plus explicitly expanded branches are sent to the widget
+labels = {node["id"]: node["label"] for node in data["nodes"]}
+branches = [node_id for node_id, children in layout["children"].items() if children]
+max_depth = max(layout["depth"].values(), default=0)
+
+with st.sidebar:
+    depth = st.slider("Expanded levels", min_value=0, max_value=max(1, max_depth), value=min(1, max_depth))
+    expanded = st.multiselect("Expand branches", options=branches, format_func=lambda node_id: labels[node_id])
+
+visible_nodes, visible_edges = visible_subgraph(data, layout, set(expanded), depth)
 
 nodes = []
 edges = []
 
-for node in data["nodes"]:
-    nodes.append(Node(id=node["id"], properties={"label": node["label"]}))
-for edge in data["edges"]:    
+for node in visible_nodes:
+    x, y = layout["positions"][node["id"]]
+    nodes.append(Node(id=node["id"], properties={"label": node["label"], "x": x, "y": y}))
+for edge in visible_edges:
     edges.append(Edge(start=edge["from"], end=edge["to"])) #, properties={"label": edge["label"]}))
 
-# initialize and render the component
-StreamlitGraphWidget(nodes, edges).show()
+st.caption(f"Showing {len(nodes)} of {len(data['nodes'])} nodes")
 
-st.markdown("---")
\ No newline at end of file
+# initialize and render the component with the precomputed positions
+StreamlitGraphWidget(
+    nodes,
+    edges,
+    node_position_mapping=lambda node: (node["properties"]["x"], node["properties"]["y"])
+).show(graph_layout=Layout.NO_LAYOUT)
+
+st.markdown("---")
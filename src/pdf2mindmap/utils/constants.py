@@ -4,12 +4,142 @@ from pathlib import Path
 
 LECTURE_PATH = Path("src/pdf2mindmap/resources/lecture.pdf")
 
-RESOURCES_JSON_DIR = Path("src/pdf2mindmap/resources/jsons/")
-RESOURCES_IMAGES_DIR = Path("src/pdf2mindmap/resources/images/")
-RESOURCES_MARKDOWNS_DIR = Path("src/pdf2mindmap/resources/markdowns/")
+# Single-file store of all intermediate results of a run (page markdown and PNGs,
+# embeddings, slide groups, summary and mindmap), see utils/lecture_artifact.py
+ARTIFACT_PATH = Path("src/pdf2mindmap/resources/lecture.sqlite")
 
 SUMMARY_PATH = Path("src/pdf2mindmap/resources/summary.md")
 NODES_EDGES_PATH = Path("src/pdf2mindmap/resources/nodes_edges.json")
+RUN_REPORT_PATH = Path("src/pdf2mindmap/resources/run_report.json")
+OCR_REPORT_PATH = Path("src/pdf2mindmap/resources/ocr_report.json")
+PLAN_PATH = Path("src/pdf2mindmap/resources/plan.json")
+
+# Stage names used to configure and route the chat models of the LectureAgent
+GROUP_TEXT_STAGE = "group_text"
+GROUP_MULTIMODAL_STAGE = "group_multimodal"
+SUMMARY_STAGE = "summary"
+MINDMAP_STAGE = "mindmap"
+
+# Default chat model per stage. Each entry can be overridden with an environment
+# variable named PDF2MINDMAP_<STAGE>_MODEL (e.g. PDF2MINDMAP_GROUP_TEXT_MODEL).
+STAGE_MODELS = {
+    GROUP_TEXT_STAGE: "gpt-4.1-nano-2025-04-14",
+    GROUP_MULTIMODAL_STAGE: "gpt-4.1-mini-2025-04-14",
+    SUMMARY_STAGE: "gpt-4.1-mini-2025-04-14",
+    MINDMAP_STAGE: "gpt-4.1-mini-2025-04-14",
+}
+MODEL_TEMPERATURE = 0.5
+# Model names served by OpenAI when no "provider:" prefix is given; only these models use the shared HTTP pool
+OPENAI_MODEL_PREFIXES = ("gpt-", "o1", "o3", "o4", "chatgpt", "text-davinci", "ft:gpt-")
+
+# Providers only cache prompt prefixes of at least this many tokens (OpenAI: 1024)
+PROMPT_CACHE_MIN_TOKENS = 1024
+
+# Routing heuristics: a slide is treated as visual (diagram, photo, chart) if it has
+# less extracted text than ROUTER_MIN_TEXT_CHARS or if its rendered PNG compresses
+# worse than ROUTER_MAX_PNG_DENSITY bytes per pixel. Plain text slides compress well.
+ROUTER_MIN_TEXT_CHARS = 200
+ROUTER_MAX_PNG_DENSITY = 0.2
+
+# Run planning (summarize --plan): expected output tokens per call, a simple latency
+# model per call (fixed overhead + prefill + generation) and USD prices per 1M
+# (input, output) tokens. Models without a price are planned without cost.
+PLAN_OUTPUT_TOKENS = {
+    GROUP_TEXT_STAGE: 500,
+    GROUP_MULTIMODAL_STAGE: 500,
+    SUMMARY_STAGE: 2500,
+    MINDMAP_STAGE: 1500,
+}
+PLAN_LATENCY_BASE_S = 0.8
+PLAN_INPUT_TOKENS_PER_S = 10000
+PLAN_OUTPUT_TOKENS_PER_S = 80
+PLAN_CONCURRENCY_LEVELS = [1, 2, 4, 8, 16]
+MODEL_PRICES_PER_1M = {
+    "gpt-4.1-nano-2025-04-14": (0.10, 0.40),
+    "gpt-4.1-mini-2025-04-14": (0.40, 1.60),
+}
+
+# Near-duplicate slide detection (utils/slide_dedup.py): build-up sequences and repeated
+# slides of a group are collapsed before prompting. Two slides look alike if the dHash
+# distance of their PNGs (DEDUP_HASH_SIZE² bits) is at most DEDUP_MAX_HASH_DISTANCE, or
+# DEDUP_MAX_HASH_DISTANCE_NO_TEXT for slides without text, and share at least
+# DEDUP_MIN_TEXT_OVERLAP of their DEDUP_SHINGLE_SIZE-word shingles.
+DEDUP_SLIDES = True
+DEDUP_HASH_SIZE = 8
+DEDUP_SHINGLE_SIZE = 3
+DEDUP_MAX_HASH_DISTANCE = 10
+DEDUP_MAX_HASH_DISTANCE_NO_TEXT = 4
+DEDUP_MIN_TEXT_OVERLAP = 0.9
+
+# Optional OCR of pages without extractable text (summarize --ocr, needs Tesseract).
+# Results are cached by page image hash in OCR_CACHE_DIR, which is kept between runs.
+OCR_LANGUAGE = "deu+eng"
+OCR_DPI = 300
+OCR_WORKERS = None  # None: one process per CPU
+# With a memory budget, one OCR process is started per OCR_WORKER_MEMORY_MB of the budget left
+# above the current RSS (at most OCR_WORKERS), pages are OCRed serially if not even one fits
+OCR_WORKER_MEMORY_MB = 200
+OCR_CACHE_DIR = Path("src/pdf2mindmap/resources/ocr_cache/")
+
+# Number of slide groups summarized concurrently
+GROUP_CONCURRENCY = 4
+
+# Shared HTTP connection pool of all chat model clients (see utils/http_pool.py)
+HTTP_MAX_CONNECTIONS = 20
+HTTP_MAX_KEEPALIVE_CONNECTIONS = 10
+HTTP_KEEPALIVE_EXPIRY_S = 60.0
+HTTP_TIMEOUT_S = 120.0
+# gzip request bodies above HTTP_COMPRESS_MIN_BYTES (only for endpoints accepting Content-Encoding: gzip)
+HTTP_COMPRESS_REQUESTS = False
+HTTP_COMPRESS_MIN_BYTES = 64 * 1024
+
+# Rendering resolution of the slide PNGs and the image detail requested from the
+# provider ("auto", "low": fixed 85 tokens per image, "high": 512px tiles)
+PAGE_IMAGE_DPI = 72
+IMAGE_DETAIL = "auto"
+# Memory-budgeted conversion (summarize --memory-budget MB, see utils/memory_budget.py):
+# the PyMuPDF store is emptied after every page and the document is reopened when the
+# process RSS exceeds MEMORY_REOPEN_RATIO of the budget. Encoded images of concurrent
+# group requests may use MEMORY_IMAGE_SHARE of the budget; every image is counted
+# IMAGE_REQUEST_MEMORY_FACTOR times its PNG size (base64 string + JSON request body).
+MEMORY_REOPEN_RATIO = 0.8
+MEMORY_IMAGE_SHARE = 0.25
+IMAGE_REQUEST_MEMORY_FACTOR = 3
+MEMORY_SAMPLE_INTERVAL_S = 0.05
+
+# Reads of the lecture artifact are served from a memory map of up to ARTIFACT_MMAP_BYTES;
+# the streaming conversion commits every ARTIFACT_COMMIT_PAGES pages
+ARTIFACT_MMAP_BYTES = 256 * 2**20
+ARTIFACT_COMMIT_PAGES = 50
+
+# Sentence embedding model used to group slides and to merge course mindmaps
+EMBEDDING_MODEL_NAME = "sentence-transformers/distiluse-base-multilingual-cased-v1"
+
+# Course-wide mindmap store. Lives outside the per-run directories so that
+# directory_reset() keeps it between lectures.
+COURSE_DIR = Path("src/pdf2mindmap/resources/course/")
+COURSE_GRAPH_PATH = COURSE_DIR / "course_graph.json"
+COURSE_EMBEDDINGS_PATH = COURSE_DIR / "course_embeddings.npy"
+COURSE_NODES_EDGES_PATH = COURSE_DIR / "nodes_edges.json"
+COURSE_LAYOUT_PATH = COURSE_DIR / "nodes_edges_layout.json"
+# Minimum cosine similarity of two concept labels to be merged into one node
+COURSE_MERGE_THRESHOLD = 0.85
+
+# Local OpenAI-compatible mock server (summarize --mock-llm) for offline load tests
+MOCK_LLM_HOST = "127.0.0.1"
+MOCK_LLM_PORT = 8765
+
+# HTTP service mode (pdf2mindmap-service): one isolated workspace per job below SERVICE_JOBS_DIR
+SERVICE_HOST = "127.0.0.1"
+SERVICE_PORT = 8000
+SERVICE_JOBS_DIR = Path("src/pdf2mindmap/resources/jobs/")
+SERVICE_WORKERS = 2
+SERVICE_MAX_QUEUED_JOBS = 8
+SERVICE_MAX_UPLOAD_BYTES = 100 * 1024 * 1024
+# Finished jobs and their workspaces are deleted after SERVICE_JOB_TTL_SECONDS or once more
+# than SERVICE_MAX_FINISHED_JOBS jobs have finished (oldest first)
+SERVICE_JOB_TTL_SECONDS = 60 * 60
+SERVICE_MAX_FINISHED_JOBS = 100
 
 STREAMLIT_HINT = (
     "\nThe mind map has been generated successfully.\n"
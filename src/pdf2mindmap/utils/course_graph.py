@@ -0,0 +1,243 @@
+# Standard library imports
+import json
+import os
+import re
+from dataclasses import dataclass, field
+from pathlib import Path
+
+# Third-party imports
+import numpy as np
+
+# Local application imports
+from src.pdf2mindmap.utils.mindmap_layout import write_layout
+from src.pdf2mindmap.utils.constants import (
+    COURSE_GRAPH_PATH,
+    COURSE_EMBEDDINGS_PATH,
+    COURSE_NODES_EDGES_PATH,
+    COURSE_LAYOUT_PATH,
+    COURSE_MERGE_THRESHOLD
+)
+
+
+class VectorIndex():
+    """
+    Minimal in-memory vector index over normalized embeddings.
+
+    Vectors are stored row-wise in one matrix, a search is a single matrix-vector
+    product (cosine similarity for normalized vectors).
+    """
+    def __init__(self, vectors: np.ndarray | None = None) -> None:
+        self.vectors = vectors if vectors is not None else np.zeros((0, 0), dtype=np.float32)
+
+    def __len__(self) -> int:
+        return self.vectors.shape[0]
+
+    def add(self, vector: np.ndarray) -> int:
+        """Append one vector and return its row index."""
+        vector = np.asarray(vector, dtype=np.float32).reshape(1, -1)
+        if len(self) == 0:
+            self.vectors = vector
+        else:
+            self.vectors = np.vstack([self.vectors, vector])
+        return len(self) - 1
+
+    def search(self, vector: np.ndarray, limit: int | None = None) -> tuple[int, float]:
+        """
+        Find the most similar stored vector.
+
+        :param vector: Normalized query vector.
+        :type vector: numpy.ndarray
+        :param limit: Only search the first limit rows, None for all rows.
+        :type limit: int | None
+        :return: (row index, cosine similarity) or (-1, -1.0) if there is nothing to search.
+        :rtype: tuple[int, float]
+        """
+        rows = len(self) if limit is None else min(limit, len(self))
+        if rows == 0:
+            return -1, -1.0
+        scores = self.vectors[:rows] @ np.asarray(vector, dtype=np.float32)
+        best = int(np.argmax(scores))
+        return best, float(scores[best])
+
+
+@dataclass
+class MergeStats:
+    """Outcome of merging one lecture into the course graph."""
+    lecture: str
+    new_nodes: int = 0
+    merged_nodes: int = 0
+    new_edges: int = 0
+    merged: dict = field(default_factory=dict)
+
+
+class CourseGraph():
+    """
+    Course-wide mindmap built incrementally from per-lecture mindmaps.
+
+    Every concept node keeps the lectures it appears in. When a lecture is added, each
+    of its node labels is embedded with the shared PageGrouper embedding model and
+    matched against the in-memory :class:`VectorIndex` of all course concepts: labels
+    above the merge threshold are deduplicated into the existing node, all others
+    become new nodes. Only the new lecture's labels are embedded, no LLM call is needed.
+    Labels are only matched against the concepts that were in the course before the
+    lecture was added, so two nodes of the same lecture are never merged with each other.
+
+    The graph is stored as JSON plus the concept embeddings (.npy); both files are
+    replaced atomically. If the embeddings are missing or do not match the nodes (e.g.
+    after an interrupted save), they are recomputed from the node labels on load.
+
+    :param threshold: Minimum cosine similarity for two labels to be merged.
+    :type threshold: float
+    :param embed: Function mapping a list of labels to normalized embeddings. Defaults
+                  to the shared SentenceTransformer of :func:`load_embedding_model`.
+    """
+    def __init__(self, threshold: float = COURSE_MERGE_THRESHOLD, embed=None) -> None:
+        self.threshold = threshold
+        self.embed = embed or self._embed_labels
+        self.lectures = []
+        self.nodes = []
+        self.edges = []
+        self.index = VectorIndex()
+
+    @classmethod
+    def load(cls, graph_path: Path = COURSE_GRAPH_PATH,
+             embeddings_path: Path = COURSE_EMBEDDINGS_PATH, **kwargs) -> "CourseGraph":
+        """Load a stored course graph, or return an empty one if none exists yet."""
+        graph = cls(**kwargs)
+        if not os.path.exists(graph_path):
+            return graph
+
+        with open(graph_path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        graph.lectures = data["lectures"]
+        graph.nodes = data["nodes"]
+        graph.edges = data["edges"]
+
+        vectors = np.load(embeddings_path) if os.path.exists(embeddings_path) else None
+        if vectors is None or vectors.ndim != 2 or vectors.shape[0] != len(graph.nodes):
+            labels = [node["label"] for node in graph.nodes]
+            vectors = np.asarray(graph.embed(labels), dtype=np.float32) if labels else None
+        graph.index = VectorIndex(vectors)
+        return graph
+
+    def save(self, graph_path: Path = COURSE_GRAPH_PATH,
+             embeddings_path: Path = COURSE_EMBEDDINGS_PATH) -> None:
+        """Store the course graph (JSON) and its concept embeddings (.npy), each file atomically."""
+        os.makedirs(os.path.dirname(graph_path), exist_ok=True)
+        # Write to temporary files first so an interrupted save never leaves a partial file
+        tmp_embeddings_path = f"{embeddings_path}.{os.getpid()}.tmp"
+        with open(tmp_embeddings_path, "wb") as f:
+            np.save(f, self.index.vectors)
+        os.replace(tmp_embeddings_path, embeddings_path)
+
+        tmp_graph_path = f"{graph_path}.{os.getpid()}.tmp"
+        with open(tmp_graph_path, "w", encoding="utf-8") as f:
+            json.dump({"lectures": self.lectures, "nodes": self.nodes, "edges": self.edges},
+                      f, ensure_ascii=False)
+        os.replace(tmp_graph_path, graph_path)
+
+    def add_lecture(self, lecture: str, mindmap: dict) -> MergeStats:
+        """
+        Merge the mindmap of one lecture into the course graph.
+
+        :param lecture: Name of the lecture, e.g. "lecture-14".
+        :type lecture: str
+        :param mindmap: Mindmap with "nodes" ({"id", "label"}) and "edges" ({"from", "to", "label"}).
+        :type mindmap: dict
+        :return: Number of new and merged nodes and new edges.
+        :rtype: MergeStats
+        """
+        stats = MergeStats(lecture)
+        if lecture not in self.lectures:
+            self.lectures.append(lecture)
+
+        labels = [node["label"] for node in mindmap["nodes"]]
+        vectors = self.embed(labels) if labels else []
+
+        # Map every lecture node id to a course node id, only concepts from before this lecture can be merged
+        existing_nodes = len(self.nodes)
+        id_map = {}
+        for node, vector in zip(mindmap["nodes"], vectors):
+            row, score = self.index.search(vector, limit=existing_nodes)
+            if row >= 0 and score >= self.threshold:
+                course_node = self.nodes[row]
+                stats.merged_nodes += 1
+                stats.merged[node["label"]] = course_node["label"]
+            else:
+                course_node = {"id": self._unique_id(node["id"]), "label": node["label"], "lectures": []}
+                self.nodes.append(course_node)
+                self.index.add(vector)
+                stats.new_nodes += 1
+            if lecture not in course_node["lectures"]:
+                course_node["lectures"].append(lecture)
+            id_map[node["id"]] = course_node["id"]
+
+        # Add edges between course nodes, deduplicated by (from, to, label)
+        edge_keys = {(edge["from"], edge["to"], edge["label"]): edge for edge in self.edges}
+        for edge in mindmap["edges"]:
+            if edge["from"] not in id_map or edge["to"] not in id_map:
+                continue
+            key = (id_map[edge["from"]], id_map[edge["to"]], edge.get("label", ""))
+            if key[0] == key[1]:
+                continue
+            if key not in edge_keys:
+                edge_keys[key] = {"from": key[0], "to": key[1], "label": key[2], "lectures": []}
+                self.edges.append(edge_keys[key])
+                stats.new_edges += 1
+            if lecture not in edge_keys[key]["lectures"]:
+                edge_keys[key]["lectures"].append(lecture)
+
+        return stats
+
+    def to_mindmap(self) -> dict:
+        """Return the course graph in the nodes_edges.json format of a single lecture."""
+        return {
+            "nodes": [{"id": node["id"], "label": node["label"]} for node in self.nodes],
+            "edges": [{"from": edge["from"], "to": edge["to"], "label": edge["label"]} for edge in self.edges]
+        }
+
+    def write_mindmap(self, nodes_edges_path: Path = COURSE_NODES_EDGES_PATH,
+                      layout_path: Path = COURSE_LAYOUT_PATH) -> None:
+        """Write the course mindmap and its layout for the Streamlit viewer."""
+        os.makedirs(os.path.dirname(nodes_edges_path), exist_ok=True)
+        with open(nodes_edges_path, "w", encoding="utf-8") as f:
+            json.dump(self.to_mindmap(), f, ensure_ascii=False)
+        write_layout(Path(nodes_edges_path), Path(layout_path))
+
+    def _unique_id(self, node_id: str) -> str:
+        """Return node_id, suffixed with a counter if another course node already uses it."""
+        existing = {node["id"] for node in self.nodes}
+        base = re.sub(r'[^a-z0-9_]', '_', node_id.lower()) or "node"
+        candidate = base
+        counter = 2
+        while candidate in existing:
+            candidate = f"{base}_{counter}"
+            counter += 1
+        return candidate
+
+    @staticmethod
+    def _embed_labels(labels: list[str]) -> np.ndarray:
+        # Imported lazily so loading and viewing a course graph does not load the model
+        from src.pdf2mindmap.utils.page_grouper import load_embedding_model
+        return load_embedding_model().encode(labels, normalize_embeddings=True)
+
+
+def add_lecture_to_course(lecture: str, nodes_edges_path: Path) -> MergeStats:
+    """
+    Merge a generated lecture mindmap into the stored course graph and refresh the course mindmap.
+
+    :param lecture: Name of the lecture.
+    :type lecture: str
+    :param nodes_edges_path: Path to the lecture's nodes_edges.json.
+    :type nodes_edges_path: pathlib.Path
+    :return: The merge statistics.
+    :rtype: MergeStats
+    """
+    with open(nodes_edges_path, "r", encoding="utf-8") as f:
+        mindmap = json.load(f)
+
+    graph = CourseGraph.load()
+    stats = graph.add_lecture(lecture, mindmap)
+    graph.save()
+    graph.write_mindmap()
+    return stats
@@ -1,33 +1,30 @@
 import os
-import shutil
 
-from .constants import (
-    SUMMARY_PATH,
-    NODES_EDGES_PATH,
-    RESOURCES_IMAGES_DIR,
-    RESOURCES_JSON_DIR,
-    RESOURCES_MARKDOWNS_DIR    
-    )
+from .workspace import Workspace, DEFAULT_WORKSPACE
 
 
-def directory_reset() -> None:
+def directory_reset(workspace: Workspace = DEFAULT_WORKSPACE) -> None:
     """
     Reset the working directory structure before the program starts.
 
-    This function removes all files and directories generated during a previous
-    program run to ensure a clean state. Specifically, it deletes existing
-    summary and data files and recreates the required resource directories
-    to prevent conflicts or unexpected behavior caused by leftover artifacts.
+    This function removes all files generated during a previous program run to
+    ensure a clean state. Specifically, it deletes the lecture artifact holding the
+    intermediate results and the existing summary and data files, and creates the
+    workspace directory to prevent conflicts or unexpected behavior caused by
+    leftover artifacts.
+
+    :param workspace: Workspace to reset, the resources directory by default.
+    :type workspace: Workspace
     """
-    # 1. Delete summary.md and nodes_edges.json in /resources
-    files = [SUMMARY_PATH, NODES_EDGES_PATH]
+    # 1. Delete the lecture artifact (and its leftover SQLite journal, WAL and shared-memory files),
+    # summary.md, nodes_edges.json, the run and OCR reports and the plan in /resources
+    artifact_files = [workspace.artifact_path.with_name(workspace.artifact_path.name + suffix)
+                      for suffix in ("", "-journal", "-wal", "-shm")]
+    files = [*artifact_files, workspace.summary_path, workspace.nodes_edges_path,
+             workspace.run_report_path, workspace.ocr_report_path, workspace.plan_path]
     for file_path in files:
         if os.path.exists(file_path):
             os.remove(file_path)
 
-    # 2. Recreate images, jsons and markdowns directories in /resources
-    directories = [RESOURCES_IMAGES_DIR, RESOURCES_JSON_DIR, RESOURCES_MARKDOWNS_DIR]
-    for dir_path in directories:
-        if os.path.exists(dir_path):
-            shutil.rmtree(dir_path)
-        os.mkdir(dir_path)
\ No newline at end of file
+    # 2. Create the workspace directory
+    os.makedirs(workspace.artifact_path.parent, exist_ok=True)
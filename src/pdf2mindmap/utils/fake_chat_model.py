@@ -0,0 +1,154 @@
+# Standard library imports
+import json
+import re
+import time
+from typing import Any
+
+# Third-party imports
+from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.messages import AIMessage, BaseMessage
+from langchain_core.outputs import ChatGeneration, ChatResult
+from pydantic import PrivateAttr
+
+# Local application imports
+from src.pdf2mindmap.utils.token_estimates import estimate_text_tokens
+from src.pdf2mindmap.utils.prompts import (
+    MINDMAP_PROMPT,
+    SUMMARY_PROMPT
+)
+from src.pdf2mindmap.utils.constants import PROMPT_CACHE_MIN_TOKENS
+
+RE_SLIDE_ID = re.compile(r'SLIDE_ID: (\S+)')
+
+
+def fake_completion(prompt_text: str) -> str:
+    """
+    Build a deterministic, schema-valid answer for one of the prompts in utils/prompts.py.
+
+    The prompt is recognised by the instruction block it contains, so the answer
+    only depends on the prompt text and is identical across runs.
+
+    :param prompt_text: All text parts of the request concatenated.
+    :type prompt_text: str
+    :return: The answer content (JSON for extraction and mindmap prompts, Markdown for the summary prompt).
+    :rtype: str
+    """
+    if MINDMAP_PROMPT.strip() in prompt_text:
+        return json.dumps({
+            "nodes": [
+                {"id": "vorlesung", "label": "Vorlesung"},
+                {"id": "grundlagen", "label": "Grundlagen"},
+                {"id": "anwendungen", "label": "Anwendungen"},
+            ],
+            "edges": [
+                {"from": "vorlesung", "to": "grundlagen", "label": "besteht aus"},
+                {"from": "grundlagen", "to": "anwendungen", "label": "führt zu"},
+            ],
+        }, ensure_ascii=False)
+
+    if SUMMARY_PROMPT.strip() in prompt_text:
+        return "# Vorlesung\n\n## Grundlagen\n\n- Zusammenfassung der Foliengruppen\n"
+
+    slide_ids = RE_SLIDE_ID.findall(prompt_text)
+    notes = {
+        "summary_bullets": [f"Inhalt von {slide_id}" for slide_id in slide_ids] or ["Inhalt"],
+        "topics": ["Thema"],
+        "connections": [],
+        "uncertainties": [],
+    }
+    if len(slide_ids) == 1:
+        return json.dumps({"slide_id": slide_ids[0], **notes}, ensure_ascii=False)
+    return json.dumps({"slide_ids": slide_ids, **notes}, ensure_ascii=False)
+
+
+def analyze_messages(messages: list[tuple[str, Any]],
+                     seen_prefixes: set,
+                     cache_min_prefix_tokens: int = PROMPT_CACHE_MIN_TOKENS) -> tuple[str, int, int]:
+    """
+    Collect the text, image count and simulated prompt cache hits of a chat request.
+
+    A system message counts as cache hit if the same prefix was seen before and it is
+    long enough for provider-side caching. seen_prefixes is updated in place.
+
+    :param messages: List of (role, content) where content is a string or a list of OpenAI content parts.
+    :type messages: list[tuple[str, Any]]
+    :param seen_prefixes: System prefixes seen by previous requests.
+    :type seen_prefixes: set
+    :param cache_min_prefix_tokens: Minimum prefix length that is cached.
+    :type cache_min_prefix_tokens: int
+    :return: (all text parts joined, number of images, cached prompt tokens)
+    :rtype: tuple[str, int, int]
+    """
+    texts = []
+    images = 0
+    cached_tokens = 0
+    for role, content in messages:
+        if role == "system" and isinstance(content, str):
+            prefix_tokens = estimate_text_tokens(content)
+            if content in seen_prefixes and prefix_tokens >= cache_min_prefix_tokens:
+                cached_tokens += prefix_tokens
+            seen_prefixes.add(content)
+        if isinstance(content, str):
+            texts.append(content)
+            continue
+        for part in content:
+            if part.get("type") == "text":
+                texts.append(part["text"])
+            elif part.get("type") == "image_url":
+                images += 1
+    return "\n".join(texts), images, cached_tokens
+
+
+class FakeChatModel(BaseChatModel):
+    """
+    Offline stand-in for a chat model.
+
+    Answers every prompt from utils/prompts.py with deterministic, schema-valid content,
+    reports usage_metadata like a real provider (including prompt cache hits for system
+    prefixes it has seen before and that reach ``cache_min_prefix_tokens``) and sleeps
+    for a simulated latency of
+    ``base_latency_s + input_tokens / 1000 * latency_per_1k_tokens_s + images * latency_per_image_s``.
+    Use it to compare model configurations and routing offline, e.g.
+    ``LectureAgent(models={stage: FakeChatModel() for stage in STAGE_MODELS})``.
+    """
+    base_latency_s: float = 0.2
+    latency_per_1k_tokens_s: float = 0.05
+    latency_per_image_s: float = 0.3
+    image_tokens: int = 765
+    cache_min_prefix_tokens: int = PROMPT_CACHE_MIN_TOKENS
+
+    _seen_prefixes: set = PrivateAttr(default_factory=set)
+
+    @property
+    def _llm_type(self) -> str:
+        return "pdf2mindmap-fake"
+
+    def _generate(self,
+                  messages: list[BaseMessage],
+                  stop: list[str] | None = None,
+                  run_manager: Any = None,
+                  **kwargs: Any) -> ChatResult:
+        prompt_text, images, cached_tokens = analyze_messages(
+            [(message.type, message.content) for message in messages],
+            self._seen_prefixes,
+            self.cache_min_prefix_tokens
+        )
+
+        content = fake_completion(prompt_text)
+        input_tokens = estimate_text_tokens(prompt_text) + images * self.image_tokens
+        output_tokens = estimate_text_tokens(content)
+
+        time.sleep(self.base_latency_s
+                   + input_tokens / 1000 * self.latency_per_1k_tokens_s
+                   + images * self.latency_per_image_s)
+
+        message = AIMessage(
+            content=content,
+            usage_metadata={
+                "input_tokens": input_tokens,
+                "output_tokens": output_tokens,
+                "total_tokens": input_tokens + output_tokens,
+                "input_token_details": {"cache_read": cached_tokens},
+            }
+        )
+        return ChatResult(generations=[ChatGeneration(message=message)])
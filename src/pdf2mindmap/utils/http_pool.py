@@ -0,0 +1,166 @@
+# Standard library imports
+import gzip
+import threading
+
+# Third-party imports
+import httpx
+
+# Local application imports
+from src.pdf2mindmap.utils.constants import (
+    HTTP_MAX_CONNECTIONS,
+    HTTP_MAX_KEEPALIVE_CONNECTIONS,
+    HTTP_KEEPALIVE_EXPIRY_S,
+    HTTP_TIMEOUT_S,
+    HTTP_COMPRESS_REQUESTS,
+    HTTP_COMPRESS_MIN_BYTES
+)
+
+"""
+Shared, tuned HTTP connection pool for all chat model clients of the process.
+
+All LectureAgents (CLI runs, service workers, several lectures) reuse one httpx
+client, so keep-alive connections are shared instead of every model opening its own.
+"""
+
+try:
+    import h2  # noqa: F401  (HTTP/2 support of httpx is optional)
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+
+class PooledTransport(httpx.HTTPTransport):
+    """
+    HTTP transport that records pool utilization and optionally gzips large request bodies.
+
+    Requests and newly opened connections are counted through httpcore's public
+    ``trace`` request extension, the HTTP version of every response (HTTP/2 is only
+    negotiated if ``h2`` is installed and the server supports it) from the response. The number of open and idle connections is read from
+    the underlying httpcore pool if it exposes them and reported as None otherwise.
+
+    Multimodal requests carry base64 encoded slide images that compress well. Request
+    compression is off by default because not every OpenAI-compatible endpoint accepts
+    ``Content-Encoding: gzip`` request bodies (the bundled mock server does).
+    """
+    def __init__(self, compress: bool = HTTP_COMPRESS_REQUESTS,
+                 compress_min_bytes: int = HTTP_COMPRESS_MIN_BYTES, **kwargs) -> None:
+        super().__init__(**kwargs)
+        self.compress = compress
+        self.compress_min_bytes = compress_min_bytes
+        self.lock = threading.Lock()
+        self.requests = 0
+        self.in_flight = 0
+        self.peak_in_flight = 0
+        self.connections_opened = 0
+        self.http_versions = {}
+        self.bytes_before_compression = 0
+        self.bytes_sent = 0
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        request = self._maybe_compress(request)
+        request.extensions = {**request.extensions, "trace": self._tracer(request.extensions.get("trace"))}
+        with self.lock:
+            self.requests += 1
+            self.in_flight += 1
+            self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+        try:
+            response = super().handle_request(request)
+        finally:
+            with self.lock:
+                self.in_flight -= 1
+        with self.lock:
+            self.http_versions[response.http_version] = self.http_versions.get(response.http_version, 0) + 1
+        return response
+
+    def stats(self) -> dict:
+        """
+        Return pool utilization since the transport was created.
+
+        :return: Requests, responses per HTTP version, in-flight and connection counts and bytes saved by compression.
+        :rtype: dict
+        """
+        open_connections, idle_connections = self._pool_connections()
+        with self.lock:
+            return {
+                "http2_available": HTTP2_AVAILABLE,
+                "http_versions": dict(self.http_versions),
+                "requests": self.requests,
+                "in_flight": self.in_flight,
+                "peak_in_flight": self.peak_in_flight,
+                "connections_opened": self.connections_opened,
+                "open_connections": open_connections,
+                "idle_connections": idle_connections,
+                "max_connections": HTTP_MAX_CONNECTIONS,
+                "compressed_bytes_saved": self.bytes_before_compression - self.bytes_sent
+            }
+
+    def _tracer(self, trace):
+        """Return a trace callback counting new connections that also calls the request's own trace callback."""
+        def on_event(event_name: str, info: dict) -> None:
+            if event_name == "connection.connect_tcp.complete":
+                with self.lock:
+                    self.connections_opened += 1
+            if trace is not None:
+                trace(event_name, info)
+        return on_event
+
+    def _pool_connections(self) -> tuple[int | None, int | None]:
+        """Return (open, idle) connections of the httpcore pool, (None, None) if it does not expose them."""
+        try:
+            connections = list(getattr(self._pool, "connections"))
+            return len(connections), sum(1 for c in connections if c.is_idle())
+        except (AttributeError, TypeError):
+            return None, None
+
+    def _maybe_compress(self, request: httpx.Request) -> httpx.Request:
+        if not self.compress or "content-encoding" in request.headers:
+            return request
+        body = request.read()
+        if len(body) < self.compress_min_bytes:
+            return request
+
+        compressed = gzip.compress(body, compresslevel=5)
+        with self.lock:
+            self.bytes_before_compression += len(body)
+            self.bytes_sent += len(compressed)
+
+        headers = httpx.Headers(request.headers)
+        headers["content-encoding"] = "gzip"
+        headers["content-length"] = str(len(compressed))
+        return httpx.Request(request.method, request.url, headers=headers,
+                             content=compressed, extensions=request.extensions)
+
+
+_client = None
+_transport = None
+_client_lock = threading.Lock()
+
+
+def get_http_client() -> httpx.Client:
+    """
+    Return the process-wide HTTP client used by all chat models.
+
+    The client is created on first use with the limits from constants.py and uses
+    HTTP/2 if the optional ``h2`` package is installed.
+
+    :return: The shared client.
+    :rtype: httpx.Client
+    """
+    global _client, _transport
+    with _client_lock:
+        if _client is None:
+            limits = httpx.Limits(
+                max_connections=HTTP_MAX_CONNECTIONS,
+                max_keepalive_connections=HTTP_MAX_KEEPALIVE_CONNECTIONS,
+                keepalive_expiry=HTTP_KEEPALIVE_EXPIRY_S
+            )
+            _transport = PooledTransport(limits=limits, http2=HTTP2_AVAILABLE)
+            _client = httpx.Client(transport=_transport, timeout=HTTP_TIMEOUT_S)
+    return _client
+
+
+def http_pool_stats() -> dict:
+    """Return the utilization of the shared pool, or an empty dict if it was never used."""
+    if _transport is None:
+        return {}
+    return _transport.stats()
@@ -0,0 +1,48 @@
+# Third-party imports
+import numpy as np
+import pymupdf
+
+# Local application imports
+from src.pdf2mindmap.utils.constants import DEDUP_HASH_SIZE
+
+"""
+Perceptual image hashes of slides.
+
+The hashes decode PNGs with PyMuPDF, which is not thread-safe. They are computed while
+a page is stored in the lecture artifact, i.e. during the PDF conversion (serialized in
+the service), and later stages only compare the stored hashes.
+"""
+
+
+def image_dhash(png: bytes, hash_size: int = DEDUP_HASH_SIZE) -> int:
+    """
+    Perceptual difference hash (dHash) of a slide image.
+
+    The image is converted to grayscale and area-averaged down to hash_size rows of
+    hash_size+1 cells; every bit tells whether a cell is brighter than its left
+    neighbour. Similar looking slides get hashes with a small Hamming distance.
+
+    :param png: Rendered PNG of the slide.
+    :type png: bytes
+    :param hash_size: Number of rows and bits per row of the hash.
+    :type hash_size: int
+    :return: The hash as an integer of hash_size² bits.
+    :rtype: int
+    """
+    pix = pymupdf.Pixmap(png)
+    if pix.alpha:
+        pix = pymupdf.Pixmap(pix, 0)
+    if pix.n != 1:
+        pix = pymupdf.Pixmap(pymupdf.csGRAY, pix)
+    gray = np.frombuffer(pix.samples, dtype=np.uint8).reshape(pix.height, pix.width).astype(np.float32)
+
+    cells = np.array([
+        [block.mean() for block in np.array_split(band, hash_size + 1, axis=1)]
+        for band in np.array_split(gray, hash_size, axis=0)
+    ])
+    bits = cells[:, 1:] > cells[:, :-1]
+    return int.from_bytes(np.packbits(bits).tobytes(), "big")
+
+
+def hamming_distance(a: int, b: int) -> int:
+    return (a ^ b).bit_count()
@@ -0,0 +1,177 @@
+# Standard library imports
+import queue
+import shutil
+import threading
+import time
+import traceback
+import uuid
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable
+
+# Local application imports
+from src.pdf2mindmap.utils.workspace import Workspace
+from src.pdf2mindmap.utils.constants import SERVICE_JOB_TTL_SECONDS, SERVICE_MAX_FINISHED_JOBS
+
+
+class QueueFullError(RuntimeError):
+    """Raised when a job is submitted while the job queue is full."""
+
+
+@dataclass
+class Job:
+    """State of one pipeline job of the service."""
+    id: str
+    workspace: Workspace
+    status: str = "queued"  # queued, running, done, failed
+    progress: str = ""
+    error: str | None = None
+    created_at: float = field(default_factory=time.time)
+    started_at: float | None = None
+    finished_at: float | None = None
+
+    def to_dict(self) -> dict:
+        return {
+            "job_id": self.id,
+            "status": self.status,
+            "progress": self.progress,
+            "error": self.error,
+            "created_at": self.created_at,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at
+        }
+
+
+class JobQueue():
+    """
+    Bounded job queue served by a fixed pool of worker threads.
+
+    Every job gets its own workspace below jobs_dir. Submitting to a full queue raises
+    :class:`QueueFullError` immediately, so callers can apply backpressure instead of
+    piling up work. Workers are threads so they share warm resources of the process
+    (embedding model, chat model clients and their connection pools).
+
+    Finished jobs are kept for ttl seconds, at most max_finished of them; older ones are
+    forgotten and their workspaces deleted whenever a job is submitted or finishes.
+
+    :param handler: Function running one job; it receives the job and a progress callback.
+    :type handler: Callable[[Job, Callable[[str], None]], None]
+    :param jobs_dir: Directory holding one workspace per job.
+    :type jobs_dir: pathlib.Path
+    :param workers: Number of worker threads.
+    :type workers: int
+    :param max_queued: Maximum number of jobs waiting for a worker.
+    :type max_queued: int
+    :param ttl: Seconds a finished job and its results are kept.
+    :type ttl: float
+    :param max_finished: Maximum number of finished jobs that are kept.
+    :type max_finished: int
+    """
+    def __init__(self, handler: Callable, jobs_dir: Path, workers: int, max_queued: int,
+                 ttl: float = SERVICE_JOB_TTL_SECONDS, max_finished: int = SERVICE_MAX_FINISHED_JOBS) -> None:
+        self.handler = handler
+        self.jobs_dir = Path(jobs_dir)
+        self.workers = workers
+        self.ttl = ttl
+        self.max_finished = max_finished
+        self.pending = queue.Queue(maxsize=max_queued)
+        self.jobs = {}
+        self.lock = threading.Lock()
+        self.threads = []
+
+    def start(self) -> None:
+        """Start the worker threads."""
+        for number in range(self.workers):
+            thread = threading.Thread(target=self._work, name=f"pdf2mindmap-worker-{number}", daemon=True)
+            thread.start()
+            self.threads.append(thread)
+
+    def submit(self, pdf_bytes: bytes) -> Job:
+        """
+        Store an uploaded PDF in a new job workspace and enqueue the job.
+
+        :param pdf_bytes: Content of the lecture PDF.
+        :type pdf_bytes: bytes
+        :return: The queued job.
+        :rtype: Job
+        :raises QueueFullError: If the queue is full.
+        """
+        self.prune()
+        if self.pending.full():
+            raise QueueFullError("Job queue is full")
+
+        job_id = uuid.uuid4().hex
+        job_dir = self.jobs_dir / job_id
+        job = Job(job_id, Workspace.at(job_dir))
+        job_dir.mkdir(parents=True)
+        job.workspace.lecture_path.write_bytes(pdf_bytes)
+        with self.lock:
+            self.jobs[job_id] = job
+
+        try:
+            self.pending.put_nowait(job)
+        except queue.Full:
+            with self.lock:
+                del self.jobs[job_id]
+            shutil.rmtree(job_dir, ignore_errors=True)
+            raise QueueFullError("Job queue is full")
+        return job
+
+    def get(self, job_id: str) -> Job | None:
+        with self.lock:
+            return self.jobs.get(job_id)
+
+    def prune(self, now: float | None = None) -> list[str]:
+        """
+        Forget expired finished jobs and delete their workspaces.
+
+        :param now: Current time, defaults to time.time().
+        :type now: float | None
+        :return: Ids of the removed jobs.
+        :rtype: list[str]
+        """
+        now = time.time() if now is None else now
+        with self.lock:
+            finished = sorted((job for job in self.jobs.values() if job.finished_at is not None),
+                              key=lambda job: job.finished_at)
+            excess = max(0, len(finished) - self.max_finished)
+            expired = [job for number, job in enumerate(finished)
+                       if number < excess or now - job.finished_at >= self.ttl]
+            for job in expired:
+                del self.jobs[job.id]
+
+        for job in expired:
+            shutil.rmtree(job.workspace.lecture_path.parent, ignore_errors=True)
+        return [job.id for job in expired]
+
+    def stats(self) -> dict:
+        """Return queue and worker utilization."""
+        with self.lock:
+            running = sum(1 for job in self.jobs.values() if job.status == "running")
+        return {
+            "workers": self.workers,
+            "running": running,
+            "queued": self.pending.qsize(),
+            "max_queued": self.pending.maxsize
+        }
+
+    def _work(self) -> None:
+        while True:
+            job = self.pending.get()
+            job.status = "running"
+            job.started_at = time.time()
+
+            def progress(message: str) -> None:
+                job.progress = message
+
+            try:
+                self.handler(job, progress)
+                job.status = "done"
+            except Exception as e:
+                job.status = "failed"
+                job.error = f"{type(e).__name__}: {e}"
+                traceback.print_exc()
+            finally:
+                job.finished_at = time.time()
+                self.pending.task_done()
+            self.prune()
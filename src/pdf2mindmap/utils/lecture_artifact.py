@@ -0,0 +1,377 @@
+# Standard library imports
+import argparse
+import json
+import os
+import sqlite3
+import threading
+from pathlib import Path
+
+# Third-party imports
+import numpy as np
+
+# Local application imports
+from src.pdf2mindmap.utils.image_hash import image_dhash
+from src.pdf2mindmap.utils.mindmap_layout import build_layout, graph_hash
+from src.pdf2mindmap.utils.token_estimates import png_dimensions
+from src.pdf2mindmap.utils.constants import ARTIFACT_PATH, ARTIFACT_MMAP_BYTES
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS pages (
+    page INTEGER PRIMARY KEY,
+    slide_id TEXT NOT NULL,
+    markdown TEXT
+);
+CREATE TABLE IF NOT EXISTS images (
+    page INTEGER PRIMARY KEY,
+    png BLOB NOT NULL,
+    width INTEGER NOT NULL,
+    height INTEGER NOT NULL,
+    dhash TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS embeddings (
+    page INTEGER PRIMARY KEY,
+    vector BLOB NOT NULL
+);
+CREATE TABLE IF NOT EXISTS groups (
+    group_id INTEGER PRIMARY KEY,
+    pages TEXT NOT NULL,
+    collapsed TEXT NOT NULL,
+    notes TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS outputs (
+    name TEXT PRIMARY KEY,
+    content TEXT NOT NULL
+);
+"""
+
+# Names of the stored stage outputs
+SUMMARY_OUTPUT = "summary"
+NODES_EDGES_OUTPUT = "nodes_edges"
+LAYOUT_OUTPUT = "layout"
+
+
+class LectureArtifact():
+    """
+    Single-file store of all intermediate results of one lecture run.
+
+    Instead of one markdown and one PNG file per page plus one JSON file per slide
+    group, a run keeps everything in one SQLite database: page markdown and PNG (in two
+    tables keyed by 1-based page number, so every page is one primary key lookup), the
+    page embeddings, the summarized slide groups and the stage outputs (summary, mindmap
+    and its layout). The converter writes each page once; later stages, the planner
+    and the Streamlit viewer read it through SQLite's memory map (ARTIFACT_MMAP_BYTES),
+    so reads come from the page cache without copying whole files.
+
+    Routing and planning only need the markdown and the size of every PNG:
+    :meth:`page_sizes` returns them without reading the images (SQLite's length() does
+    not load a blob), :meth:`images` loads the PNGs of the pages actually sent to the
+    multimodal model and :meth:`pages` returns both. The slide dedup compares the
+    perceptual hashes stored with every PNG (:meth:`page_hashes`).
+
+    The database runs in WAL mode, so readers (e.g. the Streamlit viewer, which opens it
+    with read_only=True) neither block nor are blocked by a running pipeline. One
+    connection is shared by all threads of a process, every access holds a lock.
+
+    :param path: Path of the artifact, created if it does not exist (unless read_only).
+    :type path: pathlib.Path
+    :param mmap_bytes: Size of the memory map used for reads.
+    :type mmap_bytes: int
+    :param read_only: Open an existing artifact read-only: neither the schema nor a
+                      recomputed mindmap layout is written.
+    :type read_only: bool
+    """
+    def __init__(self, path: Path = ARTIFACT_PATH, mmap_bytes: int = ARTIFACT_MMAP_BYTES,
+                 read_only: bool = False) -> None:
+        self.path = Path(path)
+        self.read_only = read_only
+        self.lock = threading.Lock()
+        if read_only:
+            self.connection = sqlite3.connect(f"{self.path.resolve().as_uri()}?mode=ro", uri=True,
+                                              check_same_thread=False)
+        else:
+            self.connection = sqlite3.connect(self.path, check_same_thread=False)
+            self.connection.execute("PRAGMA journal_mode = WAL")
+        self.connection.execute(f"PRAGMA mmap_size = {int(mmap_bytes)}")
+        if not read_only:
+            self.connection.executescript(SCHEMA)
+
+    def __enter__(self) -> "LectureArtifact":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        with self.lock:
+            self.connection.commit()
+            self.connection.close()
+
+    def commit(self) -> None:
+        with self.lock:
+            self.connection.commit()
+
+    # --- Pages ---
+
+    def put_page(self, page: int, slide_id: str, markdown: str | None = None, png: bytes | None = None) -> None:
+        """
+        Store the markdown and/or the PNG of a page; values passed as None are kept.
+
+        Writes are committed by :meth:`commit` (or when the artifact is closed). Together
+        with a PNG its dimensions and its dHash (see :func:`image_dhash`) are stored. The
+        hash is computed with PyMuPDF, so images are only stored during the PDF conversion,
+        which the service serializes.
+
+        :param page: 1-based page number.
+        :type page: int
+        :param slide_id: Name of the slide, e.g. page-07.
+        :type slide_id: str
+        :param markdown: Cleaned markdown of the page.
+        :type markdown: str | None
+        :param png: Rendered page image.
+        :type png: bytes | None
+        """
+        with self.lock:
+            self.connection.execute(
+                "INSERT INTO pages (page, slide_id, markdown) VALUES (?, ?, ?) "
+                "ON CONFLICT (page) DO UPDATE SET slide_id = excluded.slide_id, "
+                "markdown = COALESCE(excluded.markdown, markdown)",
+                (page, slide_id, markdown)
+            )
+            # PNGs have their own table: SQLite rewrites whole rows, a markdown update must not copy the image
+            if png is not None:
+                width, height = png_dimensions(png)
+                self.connection.execute(
+                    "INSERT OR REPLACE INTO images (page, png, width, height, dhash) VALUES (?, ?, ?, ?, ?)",
+                    (page, png, width, height, format(image_dhash(png), "x"))
+                )
+
+    def page_count(self) -> int:
+        with self.lock:
+            return self.connection.execute("SELECT COUNT(*) FROM pages").fetchone()[0]
+
+    def page(self, page: int) -> tuple[str, str, bytes]:
+        """
+        Random access to one page.
+
+        :param page: 1-based page number.
+        :type page: int
+        :return: (slide_id, markdown_text, png_bytes)
+        :rtype: tuple[str, str, bytes]
+        :raises RuntimeError: If the page or its markdown or PNG is missing.
+        """
+        return self.pages([page])[0]
+
+    def pages(self, pages: list[int] | None = None) -> list[tuple[str, str, bytes]]:
+        """
+        Load pages in page order.
+
+        :param pages: 1-based page numbers, None for all pages.
+        :type pages: list[int] | None
+        :return: List of (slide_id, markdown_text, png_bytes).
+        :rtype: list[tuple[str, str, bytes]]
+        :raises RuntimeError: If a page or its markdown or PNG is missing.
+        """
+        rows = self._select_pages("png", pages)
+        return [(slide_id, markdown, png) for slide_id, markdown, png in rows]
+
+    def page_sizes(self, pages: list[int] | None = None) -> list[tuple[str, str, int, int, int]]:
+        """
+        Load pages in page order without their images.
+
+        :param pages: 1-based page numbers, None for all pages.
+        :type pages: list[int] | None
+        :return: List of (slide_id, markdown_text, png_size, width, height), the PNG size in bytes.
+        :rtype: list[tuple[str, str, int, int, int]]
+        :raises RuntimeError: If a page or its markdown or PNG is missing.
+        """
+        rows = self._select_pages("length(png), width, height", pages)
+        return [(slide_id, markdown, size, width, height) for slide_id, markdown, size, width, height in rows]
+
+    def page_hashes(self, pages: list[int] | None = None) -> list[tuple[str, str, int, int, int]]:
+        """
+        Load pages in page order with the dHash of their images instead of the images.
+
+        :param pages: 1-based page numbers, None for all pages.
+        :type pages: list[int] | None
+        :return: List of (slide_id, markdown_text, image_hash, width, height).
+        :rtype: list[tuple[str, str, int, int, int]]
+        :raises RuntimeError: If a page or its markdown or PNG is missing.
+        """
+        rows = self._select_pages("dhash, width, height", pages)
+        return [(slide_id, markdown, int(dhash, 16), width, height) for slide_id, markdown, dhash, width, height in rows]
+
+    def images(self, pages: list[int]) -> list[bytes]:
+        """
+        Load the PNGs of pages in page order.
+
+        :param pages: 1-based page numbers.
+        :type pages: list[int]
+        :return: The rendered page images.
+        :rtype: list[bytes]
+        :raises RuntimeError: If a page or its markdown or PNG is missing.
+        """
+        return [png for _, _, png in self._select_pages("png", pages)]
+
+    def _select_pages(self, image_columns: str, pages: list[int] | None) -> list[tuple]:
+        """Select slide_id, markdown and image_columns of pages in page order and check that all of them are complete."""
+        if pages is not None and not pages:
+            return []
+        query = (f"SELECT pages.page, slide_id, markdown, images.page, {image_columns} "
+                 "FROM pages LEFT JOIN images ON images.page = pages.page")
+        with self.lock:
+            if pages is None:
+                rows = self.connection.execute(query + " ORDER BY pages.page").fetchall()
+            else:
+                placeholders = ", ".join("?" * len(pages))
+                rows = self.connection.execute(f"{query} WHERE pages.page IN ({placeholders}) ORDER BY pages.page",
+                                               list(pages)).fetchall()
+
+        if not rows:
+            raise RuntimeError(f"{self.path} contains no pages")
+        if pages is not None and len(rows) != len(set(pages)):
+            missing = sorted(set(pages) - {row[0] for row in rows})
+            raise RuntimeError(f"{self.path} is missing pages {missing}")
+        incomplete = [row[1] for row in rows if row[2] is None or row[3] is None]
+        if incomplete:
+            raise RuntimeError(f"{self.path} has no markdown or image for {', '.join(incomplete)}")
+        return [(row[1], row[2], *row[4:]) for row in rows]
+
+    def markdowns(self) -> dict[int, str]:
+        """
+        :return: Markdown text of every page by 1-based page number.
+        :rtype: dict[int, str]
+        """
+        with self.lock:
+            rows = self.connection.execute("SELECT page, markdown FROM pages ORDER BY page").fetchall()
+        return {page: markdown or "" for page, markdown in rows}
+
+    # --- Embeddings ---
+
+    def put_embeddings(self, embeddings: np.ndarray) -> None:
+        """Store one float32 embedding per page; row 0 belongs to page 1."""
+        vectors = np.asarray(embeddings, dtype=np.float32)
+        with self.lock:
+            self.connection.execute("DELETE FROM embeddings")
+            self.connection.executemany(
+                "INSERT INTO embeddings (page, vector) VALUES (?, ?)",
+                ((page, vector.tobytes()) for page, vector in enumerate(vectors, start=1))
+            )
+            self.connection.commit()
+
+    def embeddings(self) -> np.ndarray | None:
+        """
+        :return: Page embeddings in page order, None if none are stored.
+        :rtype: numpy.ndarray | None
+        """
+        with self.lock:
+            rows = self.connection.execute("SELECT vector FROM embeddings ORDER BY page").fetchall()
+        if not rows:
+            return None
+        return np.stack([np.frombuffer(vector, dtype=np.float32) for vector, in rows])
+
+    # --- Slide groups ---
+
+    def put_group(self, group_id: int, pages: list[int], collapsed: dict, notes: list) -> None:
+        """Store a summarized slide group (its pages, collapsed slides and notes)."""
+        with self.lock:
+            self.connection.execute(
+                "INSERT OR REPLACE INTO groups (group_id, pages, collapsed, notes) VALUES (?, ?, ?, ?)",
+                (group_id, json.dumps(pages), json.dumps(collapsed, ensure_ascii=False),
+                 json.dumps(notes, ensure_ascii=False))
+            )
+            self.connection.commit()
+
+    def groups(self) -> list[dict]:
+        """
+        :return: All slide groups ordered by group id (group_id, pages, collapsed, notes).
+        :rtype: list[dict]
+        """
+        with self.lock:
+            rows = self.connection.execute(
+                "SELECT group_id, pages, collapsed, notes FROM groups ORDER BY group_id"
+            ).fetchall()
+        return [
+            {"group_id": group_id, "pages": json.loads(pages), "collapsed": json.loads(collapsed),
+             "notes": json.loads(notes)}
+            for group_id, pages, collapsed, notes in rows
+        ]
+
+    # --- Stage outputs ---
+
+    def put_output(self, name: str, content: str) -> None:
+        with self.lock:
+            self.connection.execute("INSERT OR REPLACE INTO outputs (name, content) VALUES (?, ?)", (name, content))
+            self.connection.commit()
+
+    def output(self, name: str) -> str | None:
+        with self.lock:
+            row = self.connection.execute("SELECT content FROM outputs WHERE name = ?", (name,)).fetchone()
+        return None if row is None else row[0]
+
+    def put_mindmap(self, nodes_edges: str) -> dict:
+        """
+        Store the generated mindmap together with its precomputed layout.
+
+        :param nodes_edges: Raw nodes and edges JSON of the mindmap model.
+        :type nodes_edges: str
+        :return: The layout.
+        :rtype: dict
+        """
+        layout = build_layout(nodes_edges.encode("utf-8"))
+        self.put_output(NODES_EDGES_OUTPUT, nodes_edges)
+        self.put_output(LAYOUT_OUTPUT, json.dumps(layout, ensure_ascii=False))
+        return layout
+
+    def mindmap(self) -> tuple[dict, dict]:
+        """
+        Load the mindmap together with its precomputed layout.
+
+        The layout is recomputed and stored again if it is missing or was computed for
+        a different version of the graph; a read-only artifact only recomputes it in memory.
+
+        :return: (mindmap data, layout)
+        :rtype: tuple[dict, dict]
+        :raises RuntimeError: If no mindmap was generated yet.
+        """
+        nodes_edges = self.output(NODES_EDGES_OUTPUT)
+        if nodes_edges is None:
+            raise RuntimeError(f"{self.path} contains no mindmap")
+        layout = self.output(LAYOUT_OUTPUT)
+        layout = None if layout is None else json.loads(layout)
+        if layout is None or layout.get("graph_hash") != graph_hash(nodes_edges.encode("utf-8")):
+            if self.read_only:
+                layout = build_layout(nodes_edges.encode("utf-8"))
+            else:
+                layout = self.put_mindmap(nodes_edges)
+        return json.loads(nodes_edges), layout
+
+    def export(self, directory: Path) -> None:
+        """Write every page as <slide_id>.md and <slide_id>.png and the stage outputs to directory, e.g. for inspection."""
+        directory = Path(directory)
+        os.makedirs(directory, exist_ok=True)
+        for slide_id, markdown, png in self.pages():
+            (directory / f"{slide_id}.md").write_text(markdown, encoding="utf-8")
+            (directory / f"{slide_id}.png").write_bytes(png)
+        with open(directory / "groups.json", "w", encoding="utf-8") as f:
+            json.dump(self.groups(), f, ensure_ascii=False, indent=2)
+        for name, suffix in ((SUMMARY_OUTPUT, ".md"), (NODES_EDGES_OUTPUT, ".json"), (LAYOUT_OUTPUT, ".json")):
+            content = self.output(name)
+            if content is not None:
+                (directory / f"{name}{suffix}").write_text(content, encoding="utf-8")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Export the pages and outputs of a lecture artifact as files.")
+    parser.add_argument("directory", type=Path, help="Output directory")
+    parser.add_argument("--artifact", type=Path, default=ARTIFACT_PATH, help="Path of the lecture artifact")
+    args = parser.parse_args()
+
+    if not args.artifact.exists():
+        parser.error(f"{args.artifact} does not exist")
+    with LectureArtifact(args.artifact, read_only=True) as artifact:
+        artifact.export(args.directory)
+    print(f"Exported {args.artifact} to {args.directory}")
+
+
+if __name__ == "__main__":
+    main()
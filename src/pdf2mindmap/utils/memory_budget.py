@@ -0,0 +1,264 @@
+# Standard library imports
+import argparse
+import os
+import random
+import sys
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, asdict
+from pathlib import Path
+
+# Local application imports
+from src.pdf2mindmap.utils.constants import MEMORY_SAMPLE_INTERVAL_S
+
+"""
+Memory accounting for large lectures: per-stage peak RSS and a byte budget for image payloads.
+
+Run ``python -m src.pdf2mindmap.utils.memory_budget --pages 1000 --budget 400`` to convert
+a synthetic scanned PDF in memory-budgeted mode and check that the budget is respected.
+"""
+
+
+def current_rss_mb() -> float:
+    """
+    Return the resident set size of the process in MiB.
+
+    Falls back to the peak RSS where /proc is unavailable (macOS) and to 0.0 where
+    neither is available (Windows).
+    """
+    try:
+        with open("/proc/self/statm", "r") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / 2**20
+    except (OSError, ValueError):
+        return _max_rss_mb()
+
+
+def _max_rss_mb() -> float:
+    try:
+        import resource  # Unix only
+    except ImportError:
+        return 0.0
+    # ru_maxrss is reported in KiB on Linux and in bytes on macOS
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return max_rss / 2**20 if sys.platform == "darwin" else max_rss / 2**10
+
+
+def _reset_peak_rss() -> bool:
+    """Reset the kernel's peak RSS counter (VmHWM) of the process, if the platform allows it."""
+    try:
+        with open("/proc/self/clear_refs", "w") as f:
+            f.write("5")
+        return True
+    except OSError:
+        return False
+
+
+def _read_peak_rss_mb() -> float | None:
+    try:
+        with open("/proc/self/status", "r") as f:
+            for line in f:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1]) / 2**10
+    except OSError:
+        pass
+    return None
+
+
+@dataclass
+class StageMemory:
+    """Resident memory of the process during one pipeline stage, in MiB."""
+    stage: str
+    start_rss_mb: float
+    peak_rss_mb: float
+    end_rss_mb: float
+    duration_s: float
+
+
+class MemoryMonitor():
+    """
+    Records the peak RSS of the process per pipeline stage.
+
+    On Linux the kernel's peak counter is reset at the start of every stage and read at
+    its end, so short spikes are not missed. Elsewhere a background thread samples the
+    RSS every MEMORY_SAMPLE_INTERVAL_S seconds. Stages are expected to run one after
+    another; the numbers are process-wide and resetting the peak counter affects the
+    whole process, so it is only used for memory-budgeted runs (see
+    :func:`create_memory_monitor`), never in the service.
+
+    :param budget_mb: Optional memory budget the stages are compared against.
+    :type budget_mb: float | None
+    """
+    def __init__(self, budget_mb: float | None = None) -> None:
+        self.budget_mb = budget_mb
+        self.stages = []
+
+    @contextmanager
+    def stage(self, name: str):
+        """Context manager measuring the stage called name."""
+        start = time.perf_counter()
+        start_rss = current_rss_mb()
+        kernel_peak = _reset_peak_rss()
+        peak = [start_rss]
+        stop = threading.Event()
+
+        def sample() -> None:
+            while not stop.wait(MEMORY_SAMPLE_INTERVAL_S):
+                peak[0] = max(peak[0], current_rss_mb())
+
+        sampler = None
+        if not kernel_peak:
+            sampler = threading.Thread(target=sample, name="pdf2mindmap-memory-sampler", daemon=True)
+            sampler.start()
+        try:
+            yield
+        finally:
+            stop.set()
+            if sampler is not None:
+                sampler.join()
+            end_rss = current_rss_mb()
+            peak_rss = max(peak[0], end_rss, (_read_peak_rss_mb() if kernel_peak else None) or 0.0)
+            self.stages.append(StageMemory(name, start_rss, peak_rss, end_rss, time.perf_counter() - start))
+
+    @property
+    def peak_rss_mb(self) -> float:
+        return max((s.peak_rss_mb for s in self.stages), default=0.0)
+
+    def within_budget(self) -> bool:
+        return self.budget_mb is None or self.peak_rss_mb <= self.budget_mb
+
+    def summary(self) -> dict:
+        """
+        :return: Budget, overall peak and one entry per measured stage.
+        :rtype: dict
+        """
+        return {
+            "budget_mb": self.budget_mb,
+            "peak_rss_mb": self.peak_rss_mb,
+            "within_budget": self.within_budget(),
+            "stages": [asdict(s) for s in self.stages]
+        }
+
+
+class NullMemoryMonitor():
+    """Monitor used without a memory budget: stages are not measured and nothing is reported."""
+    budget_mb = None
+
+    @contextmanager
+    def stage(self, name: str):
+        yield
+
+    def within_budget(self) -> bool:
+        return True
+
+    def summary(self) -> dict:
+        return {}
+
+
+def create_memory_monitor(budget_mb: float | None) -> MemoryMonitor | NullMemoryMonitor:
+    """
+    Return a :class:`MemoryMonitor` for a memory-budgeted run, otherwise a :class:`NullMemoryMonitor`.
+
+    :param budget_mb: Memory budget in MiB or None.
+    :type budget_mb: float | None
+    """
+    return MemoryMonitor(budget_mb) if budget_mb is not None else NullMemoryMonitor()
+
+
+class ByteBudget():
+    """
+    Counting budget for bytes held by concurrent workers, e.g. encoded slide images.
+
+    :meth:`reserve` blocks until the requested bytes fit into the budget. A single
+    reservation larger than the whole budget is admitted once nothing else is reserved,
+    so oversized groups are serialized instead of deadlocking.
+
+    :param capacity: Number of bytes that may be reserved at the same time.
+    :type capacity: int
+    """
+    def __init__(self, capacity: int) -> None:
+        self.capacity = capacity
+        self.reserved = 0
+        self.peak_reserved = 0
+        self.condition = threading.Condition()
+
+    @contextmanager
+    def reserve(self, size: int):
+        with self.condition:
+            self.condition.wait_for(lambda: self.reserved == 0 or self.reserved + size <= self.capacity)
+            self.reserved += size
+            self.peak_reserved = max(self.peak_reserved, self.reserved)
+        try:
+            yield
+        finally:
+            with self.condition:
+                self.reserved -= size
+                self.condition.notify_all()
+
+
+def write_synthetic_scan(path: Path, pages: int, width: int = 1200, height: int = 900, seed: int = 0) -> None:
+    """
+    Write a PDF whose pages are distinct full-page grayscale "scans" without a text layer.
+
+    :param path: Output PDF path.
+    :type path: pathlib.Path
+    :param pages: Number of pages.
+    :type pages: int
+    :param width: Width of each page image in pixels.
+    :type width: int
+    :param height: Height of each page image in pixels.
+    :type height: int
+    :param seed: Seed of the image noise.
+    :type seed: int
+    """
+    import pymupdf
+
+    noise = random.Random(seed).randbytes(width * height)
+    doc = pymupdf.open()
+    for number in range(pages):
+        # Rotate the noise per page so that no two page images are identical
+        offset = (number * 7919) % len(noise)
+        pixmap = pymupdf.Pixmap(pymupdf.csGRAY, width, height, noise[offset:] + noise[:offset], False)
+        page = doc.new_page(width=960, height=720)
+        page.insert_image(page.rect, stream=pixmap.tobytes("jpg", jpg_quality=30))
+    doc.save(path)
+    doc.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Check that a large scanned PDF converts within a memory budget.")
+    parser.add_argument("--pages", type=int, default=1000)
+    parser.add_argument("--budget", type=float, default=400, help="memory budget in MiB (process RSS)")
+    parser.add_argument("--pdf", type=Path, default=None, help="convert this PDF instead of a synthetic one")
+    parser.add_argument("--eager", action="store_true",
+                        help="convert without the streaming mode, for comparison (the budget is only checked)")
+    args = parser.parse_args()
+
+    from src.pdf2mindmap.utils.pdf_converter import PdfConverter
+    from src.pdf2mindmap.utils.directory_reset import directory_reset
+    from src.pdf2mindmap.utils.workspace import Workspace
+
+    with tempfile.TemporaryDirectory() as tmp:
+        pdf_path = args.pdf
+        if pdf_path is None:
+            pdf_path = Path(tmp) / "synthetic.pdf"
+            print(f"Writing synthetic {args.pages}-page scanned PDF...")
+            write_synthetic_scan(pdf_path, args.pages)
+
+        workspace = Workspace.at(Path(tmp) / "workspace")
+        directory_reset(workspace)
+        monitor = MemoryMonitor(args.budget)
+        with monitor.stage("convert"):
+            PdfConverter(pdf_path, workspace, memory_budget_mb=None if args.eager else args.budget).convert()
+
+    for stage in monitor.stages:
+        print(f"{stage.stage}: peak {stage.peak_rss_mb:.0f} MiB (start {stage.start_rss_mb:.0f}, "
+              f"end {stage.end_rss_mb:.0f}) in {stage.duration_s:.1f}s")
+    if not monitor.within_budget():
+        raise SystemExit(f"Memory budget of {args.budget:.0f} MiB exceeded: peak {monitor.peak_rss_mb:.0f} MiB")
+    print(f"Within the memory budget of {args.budget:.0f} MiB")
+
+
+if __name__ == "__main__":
+    main()
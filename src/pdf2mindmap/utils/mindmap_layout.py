@@ -0,0 +1,174 @@
+# Standard library imports
+import hashlib
+import json
+from collections import deque
+from pathlib import Path
+
+"""
+Server-side hierarchical layout for the mindmap viewer.
+
+The layout is computed once after the mindmap has been generated and stored next to
+its nodes and edges (in the lecture artifact or next to nodes_edges.json), so the Streamlit viewer neither re-parses the graph structure nor
+lets the widget lay out hundreds of nodes on every rerun.
+"""
+
+LEVEL_SPACING = 320.0
+SIBLING_SPACING = 90.0
+
+
+def graph_hash(raw: bytes) -> str:
+    """Return the sha256 hex digest of the raw nodes_edges.json content."""
+    return hashlib.sha256(raw).hexdigest()
+
+
+def compute_layout(data: dict) -> dict:
+    """
+    Compute a left-to-right tree layout of a mindmap.
+
+    Roots are the nodes without incoming edges (or the first node if every node has
+    one). The tree is the breadth-first spanning tree from the roots; nodes that are
+    not reachable become additional roots. Leaves are stacked vertically and every
+    parent is centered on its children, the x coordinate is given by the depth.
+
+    :param data: Mindmap with "nodes" ({"id", "label"}) and "edges" ({"from", "to"}).
+    :type data: dict
+    :return: Layout with "roots", "children", "parent", "depth" and "positions" per node id.
+    :rtype: dict
+    """
+    node_ids = [node["id"] for node in data["nodes"]]
+    known = set(node_ids)
+    successors = {node_id: [] for node_id in node_ids}
+    has_incoming = set()
+    for edge in data["edges"]:
+        if edge["from"] in known and edge["to"] in known and edge["from"] != edge["to"]:
+            successors[edge["from"]].append(edge["to"])
+            has_incoming.add(edge["to"])
+
+    roots = [node_id for node_id in node_ids if node_id not in has_incoming] or node_ids[:1]
+
+    # Breadth-first spanning tree, unreached nodes start a new tree
+    parent = {}
+    depth = {}
+    children = {node_id: [] for node_id in node_ids}
+    for start in roots + node_ids:
+        if start in depth:
+            continue
+        if start not in roots:
+            roots.append(start)
+        depth[start] = 0
+        parent[start] = None
+        queue = deque([start])
+        while queue:
+            current = queue.popleft()
+            for successor in successors[current]:
+                if successor not in depth:
+                    depth[successor] = depth[current] + 1
+                    parent[successor] = current
+                    children[current].append(successor)
+                    queue.append(successor)
+
+    # Leaves get consecutive rows, parents are centered on their children
+    positions = {}
+    next_row = 0
+    for root in roots:
+        stack = [(root, False)]
+        while stack:
+            node_id, visited = stack.pop()
+            if not children[node_id]:
+                positions[node_id] = [depth[node_id] * LEVEL_SPACING, next_row * SIBLING_SPACING]
+                next_row += 1
+            elif visited:
+                ys = [positions[child][1] for child in children[node_id]]
+                positions[node_id] = [depth[node_id] * LEVEL_SPACING, (min(ys) + max(ys)) / 2]
+            else:
+                stack.append((node_id, True))
+                for child in reversed(children[node_id]):
+                    stack.append((child, False))
+
+    return {
+        "roots": roots,
+        "children": children,
+        "parent": parent,
+        "depth": depth,
+        "positions": positions
+    }
+
+
+def build_layout(raw: bytes) -> dict:
+    """
+    Compute the layout of a raw nodes_edges.json content, tagged with the hash of the graph it was computed for.
+
+    :return: The layout.
+    :rtype: dict
+    """
+    layout = compute_layout(json.loads(raw))
+    layout["graph_hash"] = graph_hash(raw)
+    return layout
+
+
+def write_layout(nodes_edges_path: Path, layout_path: Path) -> dict:
+    """
+    Compute the layout of nodes_edges_path and store it at layout_path.
+
+    The stored layout carries the hash of the graph it was computed for.
+
+    :return: The layout.
+    :rtype: dict
+    """
+    layout = build_layout(nodes_edges_path.read_bytes())
+    with open(layout_path, "w", encoding="utf-8") as f:
+        json.dump(layout, f, ensure_ascii=False)
+    return layout
+
+
+def load_mindmap(nodes_edges_path: Path, layout_path: Path) -> tuple[dict, dict]:
+    """
+    Load a mindmap together with its precomputed layout.
+
+    The layout is recomputed and stored again if it is missing or was computed for
+    a different version of the graph.
+
+    :return: (mindmap data, layout)
+    :rtype: tuple[dict, dict]
+    """
+    raw = nodes_edges_path.read_bytes()
+    data = json.loads(raw)
+
+    layout = None
+    if layout_path.exists():
+        with open(layout_path, "r", encoding="utf-8") as f:
+            layout = json.load(f)
+    if layout is None or layout.get("graph_hash") != graph_hash(raw):
+        layout = write_layout(nodes_edges_path, layout_path)
+    return data, layout
+
+
+def visible_subgraph(data: dict, layout: dict, expanded: set, depth: int) -> tuple[list[dict], list[dict]]:
+    """
+    Select the nodes and edges of a collapsed mindmap view.
+
+    A node is visible if its tree parent is visible and either lies above the depth
+    limit or was expanded explicitly. Only visible branches are sent to the widget.
+
+    :param data: Mindmap data.
+    :type data: dict
+    :param layout: Layout from :func:`compute_layout`.
+    :type layout: dict
+    :param expanded: Node ids whose children are shown regardless of the depth limit.
+    :type expanded: set
+    :param depth: Number of levels below the roots that are shown expanded.
+    :type depth: int
+    :return: (visible nodes, visible edges) in the order of data.
+    :rtype: tuple[list[dict], list[dict]]
+    """
+    visible = set()
+    stack = list(layout["roots"])
+    while stack:
+        node_id = stack.pop()
+        visible.add(node_id)
+        if layout["depth"][node_id] < depth or node_id in expanded:
+            stack.extend(layout["children"][node_id])
+
+    nodes = [node for node in data["nodes"] if node["id"] in visible]
+    edges = [edge for edge in data["edges"] if edge["from"] in visible and edge["to"] in visible]
+    return nodes, edges
@@ -0,0 +1,218 @@
+# Standard library imports
+import argparse
+import gzip
+import json
+import random
+import threading
+import time
+import uuid
+from collections import deque
+from dataclasses import dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# Local application imports
+from src.pdf2mindmap.utils.token_estimates import estimate_text_tokens
+from src.pdf2mindmap.utils.fake_chat_model import analyze_messages, fake_completion
+from src.pdf2mindmap.utils.constants import (
+    MOCK_LLM_HOST,
+    MOCK_LLM_PORT,
+    PROMPT_CACHE_MIN_TOKENS
+)
+
+
+@dataclass
+class MockServerConfig:
+    """
+    Behaviour of the mock LLM server.
+
+    Latency is drawn from a log-normal distribution with the given median and sigma,
+    plus latency_per_image_s for every attached image. A request fails with HTTP 500
+    with probability error_rate and with HTTP 429 once more than rate_limit_rpm
+    requests arrived within the last 60 seconds (0 disables the limit).
+    """
+    latency_median_s: float = 0.5
+    latency_sigma: float = 0.4
+    latency_per_image_s: float = 0.1
+    error_rate: float = 0.0
+    rate_limit_rpm: int = 0
+    image_tokens: int = 765
+    cache_min_prefix_tokens: int = PROMPT_CACHE_MIN_TOKENS
+    seed: int = 0
+
+
+class MockLLMServer(ThreadingHTTPServer):
+    """
+    Local OpenAI chat-completions compatible server for offline load tests.
+
+    Answers every prompt from utils/prompts.py with deterministic, schema-valid content
+    (see :func:`fake_completion`) and reports OpenAI-style usage including cached tokens.
+    Start it with :meth:`start` (background thread) or via
+    ``python -m src.pdf2mindmap.utils.mock_llm_server``.
+    """
+    daemon_threads = True
+
+    def __init__(self, config: MockServerConfig | None = None,
+                 host: str = MOCK_LLM_HOST, port: int = MOCK_LLM_PORT) -> None:
+        super().__init__((host, port), MockLLMHandler)
+        self.config = config or MockServerConfig()
+        self.random = random.Random(self.config.seed)
+        self.lock = threading.Lock()
+        self.request_times = deque()
+        self.seen_prefixes = set()
+        self.thread = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}/v1"
+
+    def start(self) -> "MockLLMServer":
+        """Serve requests in a daemon thread and return the server."""
+        self.thread = threading.Thread(target=self.serve_forever, daemon=True)
+        self.thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Stop serving, wait for the serving thread and close the socket."""
+        if self.thread is not None:
+            self.shutdown()
+            self.thread.join()
+            self.thread = None
+        self.server_close()
+
+    def admit(self) -> int | None:
+        """
+        Apply rate limit and error injection to an incoming request.
+
+        :return: HTTP status code to fail the request with, or None if it is served.
+        :rtype: int | None
+        """
+        with self.lock:
+            now = time.monotonic()
+            while self.request_times and now - self.request_times[0] > 60:
+                self.request_times.popleft()
+            if self.config.rate_limit_rpm and len(self.request_times) >= self.config.rate_limit_rpm:
+                return 429
+            self.request_times.append(now)
+            if self.random.random() < self.config.error_rate:
+                return 500
+        return None
+
+    def sample_latency(self, images: int) -> float:
+        """Draw the simulated latency of one request in seconds."""
+        with self.lock:
+            latency = self.config.latency_median_s * self.random.lognormvariate(0, self.config.latency_sigma)
+        return latency + images * self.config.latency_per_image_s
+
+    def complete(self, request: dict) -> dict:
+        """
+        Build the chat completion response for a request body.
+
+        :param request: Parsed OpenAI chat-completions request.
+        :type request: dict
+        :return: OpenAI chat-completions response body.
+        :rtype: dict
+        """
+        with self.lock:
+            prompt_text, images, cached_tokens = analyze_messages(
+                [(m.get("role"), m.get("content", "")) for m in request.get("messages", [])],
+                self.seen_prefixes,
+                self.config.cache_min_prefix_tokens
+            )
+        time.sleep(self.sample_latency(images))
+
+        content = fake_completion(prompt_text)
+        prompt_tokens = estimate_text_tokens(prompt_text) + images * self.config.image_tokens
+        completion_tokens = estimate_text_tokens(content)
+        return {
+            "id": f"chatcmpl-mock-{uuid.uuid4().hex[:12]}",
+            "object": "chat.completion",
+            "created": int(time.time()),
+            "model": request.get("model", "mock"),
+            "choices": [{
+                "index": 0,
+                "message": {"role": "assistant", "content": content},
+                "finish_reason": "stop"
+            }],
+            "usage": {
+                "prompt_tokens": prompt_tokens,
+                "completion_tokens": completion_tokens,
+                "total_tokens": prompt_tokens + completion_tokens,
+                "prompt_tokens_details": {"cached_tokens": cached_tokens}
+            }
+        }
+
+
+class MockLLMHandler(BaseHTTPRequestHandler):
+    """Request handler of :class:`MockLLMServer` for /v1/chat/completions and /v1/models."""
+    server: MockLLMServer
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self) -> None:
+        if self.path.rstrip("/") == "/v1/models":
+            self._send_json(200, {"object": "list", "data": [{"id": "mock", "object": "model"}]})
+        else:
+            self._send_error(404, "Not found")
+
+    def do_POST(self) -> None:
+        body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        if self.headers.get("Content-Encoding", "").lower() == "gzip":
+            body = gzip.decompress(body)
+        if self.path.rstrip("/") != "/v1/chat/completions":
+            self._send_error(404, "Not found")
+            return
+
+        status = self.server.admit()
+        if status == 429:
+            self._send_error(429, "Rate limit reached", {"Retry-After": "1"})
+            return
+        if status == 500:
+            self._send_error(500, "Injected server error")
+            return
+
+        try:
+            request = json.loads(body)
+        except json.JSONDecodeError:
+            self._send_error(400, "Invalid JSON body")
+            return
+        self._send_json(200, self.server.complete(request))
+
+    def log_message(self, format: str, *args) -> None:
+        # Keep benchmark output clean
+        pass
+
+    def _send_error(self, status: int, message: str, headers: dict | None = None) -> None:
+        self._send_json(status, {"error": {"message": message, "type": "mock_error", "code": status}}, headers)
+
+    def _send_json(self, status: int, data: dict, headers: dict | None = None) -> None:
+        payload = json.dumps(data, ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.end_headers()
+        self.wfile.write(payload)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Run the local OpenAI-compatible mock LLM server.")
+    parser.add_argument("--host", default=MOCK_LLM_HOST)
+    parser.add_argument("--port", type=int, default=MOCK_LLM_PORT)
+    parser.add_argument("--latency", type=float, default=0.5, help="median latency in seconds")
+    parser.add_argument("--sigma", type=float, default=0.4, help="log-normal sigma of the latency")
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--rate-limit", type=int, default=0, help="requests per minute, 0 = unlimited")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    config = MockServerConfig(
+        latency_median_s=args.latency,
+        latency_sigma=args.sigma,
+        error_rate=args.error_rate,
+        rate_limit_rpm=args.rate_limit,
+        seed=args.seed
+    )
+    server = MockLLMServer(config, args.host, args.port)
+    print(f"Mock LLM server listening on {server.base_url}")
+    server.serve_forever()
@@ -0,0 +1,141 @@
+# Standard library imports
+import os
+from dataclasses import dataclass, field
+
+# Local application imports
+from src.pdf2mindmap.utils.token_estimates import png_dimensions
+from src.pdf2mindmap.utils.constants import (
+    STAGE_MODELS,
+    OPENAI_MODEL_PREFIXES,
+    GROUP_TEXT_STAGE,
+    GROUP_MULTIMODAL_STAGE,
+    ROUTER_MIN_TEXT_CHARS,
+    ROUTER_MAX_PNG_DENSITY
+)
+
+
+def stage_model_names() -> dict[str, str]:
+    """
+    Resolve the chat model name of every pipeline stage.
+
+    Defaults come from STAGE_MODELS and can be overridden per stage with an
+    environment variable named PDF2MINDMAP_<STAGE>_MODEL, e.g.
+    PDF2MINDMAP_GROUP_TEXT_MODEL=gpt-4.1-nano-2025-04-14.
+
+    :return: Mapping from stage name to model name.
+    :rtype: dict[str, str]
+    """
+    names = {}
+    for stage, default in STAGE_MODELS.items():
+        names[stage] = os.environ.get(f"PDF2MINDMAP_{stage.upper()}_MODEL", default)
+    return names
+
+
+def is_openai_model(model_name: str) -> bool:
+    """
+    Check whether init_chat_model resolves a model name to the OpenAI provider.
+
+    Names may carry an explicit provider prefix ("openai:gpt-4.1", "anthropic:claude-...");
+    without one the provider is inferred from the name like langchain does.
+
+    :param model_name: Configured model name.
+    :type model_name: str
+    :return: True if the model is served by langchain-openai.
+    :rtype: bool
+    """
+    name = model_name.lower()
+    return name.startswith("openai:") or name.startswith(OPENAI_MODEL_PREFIXES)
+
+
+@dataclass
+class RouteDecision:
+    """Result of routing one slide group to a model stage."""
+    stage: str
+    visual_pages: list[str] = field(default_factory=list)
+    reason: str = ""
+
+
+class ModelRouter():
+    """
+    Routes slide groups either to the small text-only model or to the multimodal model.
+
+    A group is sent to the multimodal model (with images) as soon as one of its slides
+    looks visual: little extractable text or a rendered PNG that compresses badly,
+    which is typical for diagrams, charts and photos. All other groups are text-only
+    slides whose markdown already carries the content, so they are sent to the cheaper
+    text model without images.
+    """
+    def __init__(self,
+                 min_text_chars: int = ROUTER_MIN_TEXT_CHARS,
+                 max_png_density: float = ROUTER_MAX_PNG_DENSITY,
+                 enabled: bool = True) -> None:
+        self.min_text_chars = min_text_chars
+        self.max_png_density = max_png_density
+        self.enabled = enabled
+
+    def route(self, pages: list[tuple[str, str, bytes]]) -> RouteDecision:
+        """
+        Decide which model stage handles a slide group.
+
+        :param pages: List of (slide_id, markdown_text, png_bytes) for every slide of the group.
+        :type pages: list[tuple[str, str, bytes]]
+        :return: The routing decision including the slides that triggered the multimodal model.
+        :rtype: RouteDecision
+        """
+        if not self.enabled:
+            return RouteDecision(GROUP_MULTIMODAL_STAGE, reason="routing disabled")
+        return self.route_sizes([(slide_id, md_text, len(png), *png_dimensions(png)) for slide_id, md_text, png in pages])
+
+    def route_sizes(self, pages: list[tuple[str, str, int, int, int]]) -> RouteDecision:
+        """
+        Decide which model stage handles a slide group without looking at the image data.
+
+        :param pages: List of (slide_id, markdown_text, png_size, width, height) for every
+                      slide of the group (see :meth:`LectureArtifact.page_sizes`).
+        :type pages: list[tuple[str, str, int, int, int]]
+        :return: The routing decision including the slides that triggered the multimodal model.
+        :rtype: RouteDecision
+        """
+        if not self.enabled:
+            return RouteDecision(GROUP_MULTIMODAL_STAGE, reason="routing disabled")
+
+        visual_pages = []
+        for slide_id, md_text, png_size, width, height in pages:
+            if self._is_visual(md_text, self.density(png_size, width, height)):
+                visual_pages.append(slide_id)
+
+        if visual_pages:
+            return RouteDecision(GROUP_MULTIMODAL_STAGE, visual_pages, "image-heavy slides")
+        return RouteDecision(GROUP_TEXT_STAGE, reason="text-only slides")
+
+    def is_visual_page(self, md_text: str, png: bytes) -> bool:
+        """
+        Check whether a slide needs its image to be understood.
+
+        :param md_text: Extracted markdown of the slide.
+        :type md_text: str
+        :param png: Rendered PNG of the slide.
+        :type png: bytes
+        :return: True if the slide has little text or a visually complex image.
+        :rtype: bool
+        """
+        return self._is_visual(md_text, self.png_density(png))
+
+    def _is_visual(self, md_text: str, density: float) -> bool:
+        return len(md_text.strip()) < self.min_text_chars or density > self.max_png_density
+
+    def png_density(self, png: bytes) -> float:
+        """
+        Compressed PNG bytes per pixel, a cheap proxy for the visual complexity of a slide.
+
+        :param png: The PNG image.
+        :type png: bytes
+        :return: Image size in bytes divided by the number of pixels.
+        :rtype: float
+        """
+        return self.density(len(png), *png_dimensions(png))
+
+    @staticmethod
+    def density(png_size: int, width: int, height: int) -> float:
+        """Compressed PNG bytes per pixel from the PNG size in bytes and its dimensions (see :meth:`png_density`)."""
+        return png_size / max(1, width * height)
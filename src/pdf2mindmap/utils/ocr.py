@@ -0,0 +1,208 @@
+# Standard library imports
+import hashlib
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, asdict
+from pathlib import Path
+
+# Third-party imports
+import pymupdf
+
+# Local application imports
+from src.pdf2mindmap.utils.constants import (
+    OCR_LANGUAGE,
+    OCR_DPI,
+    OCR_WORKERS,
+    OCR_WORKER_MEMORY_MB,
+    OCR_CACHE_DIR
+)
+from src.pdf2mindmap.utils.memory_budget import current_rss_mb
+
+
+@dataclass
+class OcrPageResult:
+    """OCR outcome of one page."""
+    page: int
+    image_hash: str
+    seconds: float
+    chars: int
+    cached: bool
+
+
+def page_image_hash(page: pymupdf.Page, dpi: int) -> str:
+    """
+    Hash of the rendered page image, used as OCR cache key.
+
+    :param page: The PDF page.
+    :type page: pymupdf.Page
+    :param dpi: Resolution the page is rendered at.
+    :type dpi: int
+    :return: Hex SHA-256 of the page pixels.
+    :rtype: str
+    """
+    pix = page.get_pixmap(dpi=dpi)
+    return hashlib.sha256(pix.samples).hexdigest()
+
+
+def _ocr_page(pdf_path: str, page_index: int, language: str, dpi: int) -> tuple[str, float]:
+    """Runs in a worker process: OCR one page and return its text and the OCR time."""
+    start = time.perf_counter()
+    with pymupdf.open(pdf_path) as doc:
+        page = doc[page_index]
+        textpage = page.get_textpage_ocr(language=language, dpi=dpi, full=True)
+        text = page.get_text("text", textpage=textpage)
+    return text, time.perf_counter() - start
+
+
+class OcrStage():
+    """
+    Optional OCR for pages without extractable text, e.g. scanned lecture slides.
+
+    Only the pages passed to :meth:`run` are processed. Every page is identified by
+    the hash of its rendered image; results are cached per hash (and language and
+    resolution) in cache_dir, so unchanged pages are never OCRed twice, also across
+    lectures. Cache misses are OCRed in a process pool with PyMuPDF's Tesseract
+    integration; every worker opens the PDF itself. With a memory budget the pool only
+    gets as many processes as fit into the budget left above the current RSS
+    (OCR_WORKER_MEMORY_MB each); if none fits, pages are OCRed one by one in-process.
+
+    :param pdf_path: Path to the lecture PDF.
+    :type pdf_path: pathlib.Path
+    :param cache_dir: Directory of the OCR cache.
+    :type cache_dir: pathlib.Path
+    :param language: Tesseract language(s), e.g. "deu+eng".
+    :type language: str
+    :param dpi: Resolution used for OCR.
+    :type dpi: int
+    :param workers: Number of OCR processes, None for one per CPU.
+    :type workers: int | None
+    :param memory_budget_mb: Optional memory budget in MiB limiting the number of OCR processes.
+    :type memory_budget_mb: float | None
+    """
+    def __init__(self,
+                 pdf_path: Path,
+                 cache_dir: Path = OCR_CACHE_DIR,
+                 language: str = OCR_LANGUAGE,
+                 dpi: int = OCR_DPI,
+                 workers: int | None = OCR_WORKERS,
+                 memory_budget_mb: float | None = None) -> None:
+        self.pdf_path = Path(pdf_path)
+        self.cache_dir = Path(cache_dir)
+        self.language = language
+        self.dpi = dpi
+        self.workers = workers
+        self.memory_budget_mb = memory_budget_mb
+        self.results = []
+
+    def worker_count(self, pages: int) -> int:
+        """
+        Number of OCR processes for the given number of cache misses, 0 to OCR them in-process.
+
+        :param pages: Number of pages to OCR.
+        :type pages: int
+        :rtype: int
+        """
+        workers = min(self.workers or os.cpu_count() or 1, pages)
+        if self.memory_budget_mb is not None:
+            free_mb = self.memory_budget_mb - current_rss_mb()
+            workers = min(workers, int(free_mb // OCR_WORKER_MEMORY_MB))
+        return max(workers, 0)
+
+    def run(self, image_hashes: dict[int, str]) -> dict[int, str]:
+        """
+        OCR the given pages, serving cached pages from the cache.
+
+        :param image_hashes: Mapping from 0-based page index to the hash of its rendered image.
+        :type image_hashes: dict[int, str]
+        :return: Mapping from 0-based page index to the recognized text.
+        :rtype: dict[int, str]
+        :raises RuntimeError: If pages need OCR and Tesseract is not installed.
+        """
+        texts = {}
+        misses = {}
+        for page_index, image_hash in sorted(image_hashes.items()):
+            cached = self._read_cache(image_hash)
+            if cached is None:
+                misses[page_index] = image_hash
+                continue
+            texts[page_index] = cached
+            self.results.append(OcrPageResult(page_index + 1, image_hash, 0.0, len(cached), True))
+
+        if misses:
+            self._check_tesseract()
+            workers = self.worker_count(len(misses))
+            if workers == 0:
+                ocr_results = ((page_index, _ocr_page(str(self.pdf_path), page_index, self.language, self.dpi))
+                               for page_index in misses)
+                self._store_results(ocr_results, misses, texts)
+            else:
+                with ProcessPoolExecutor(max_workers=workers) as executor:
+                    futures = {
+                        page_index: executor.submit(_ocr_page, str(self.pdf_path), page_index, self.language, self.dpi)
+                        for page_index in misses
+                    }
+                    self._store_results(((page_index, future.result()) for page_index, future in futures.items()),
+                                        misses, texts)
+
+        self.results.sort(key=lambda result: result.page)
+        return texts
+
+    def _store_results(self, ocr_results, misses: dict[int, str], texts: dict[int, str]) -> None:
+        """Cache and record (page_index, (text, seconds)) results as they arrive."""
+        for page_index, (text, seconds) in ocr_results:
+            texts[page_index] = text
+            self._write_cache(misses[page_index], text)
+            self.results.append(OcrPageResult(page_index + 1, misses[page_index], seconds, len(text), False))
+
+    def summary(self) -> dict:
+        """
+        :return: Totals and the per-page OCR results.
+        :rtype: dict
+        """
+        ocr_seconds = [r.seconds for r in self.results if not r.cached]
+        return {
+            "pages": len(self.results),
+            "cache_hits": sum(1 for r in self.results if r.cached),
+            "ocr_seconds": sum(ocr_seconds),
+            "max_page_seconds": max(ocr_seconds, default=0.0),
+            "results": [asdict(r) for r in self.results]
+        }
+
+    def print_report(self) -> None:
+        summary = self.summary()
+        ocred = summary["pages"] - summary["cache_hits"]
+        average = summary["ocr_seconds"] / ocred if ocred else 0.0
+        print(f"OCR: {summary['pages']} pages without text, {summary['cache_hits']} from cache, "
+              f"{ocred} OCRed ({summary['ocr_seconds']:.1f}s in total, "
+              f"avg {average:.2f}s, max {summary['max_page_seconds']:.2f}s per page)")
+
+    def save(self, path: Path) -> None:
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.summary(), f, ensure_ascii=False, indent=2)
+
+    def _cache_path(self, image_hash: str) -> Path:
+        key = hashlib.sha256(f"{image_hash}:{self.language}:{self.dpi}".encode()).hexdigest()
+        return self.cache_dir / f"{key}.txt"
+
+    def _read_cache(self, image_hash: str) -> str | None:
+        path = self._cache_path(image_hash)
+        if not path.exists():
+            return None
+        return path.read_text(encoding="utf-8")
+
+    def _write_cache(self, image_hash: str, text: str) -> None:
+        os.makedirs(self.cache_dir, exist_ok=True)
+        path = self._cache_path(image_hash)
+        # Write to a temporary file first so concurrent runs never read a partial entry
+        tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        tmp_path.write_text(text, encoding="utf-8")
+        os.replace(tmp_path, path)
+
+    @staticmethod
+    def _check_tesseract() -> None:
+        try:
+            pymupdf.get_tessdata()
+        except RuntimeError as e:
+            raise RuntimeError(f"OCR needs an installed Tesseract: {e}") from e
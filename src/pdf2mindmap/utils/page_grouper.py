@@ -1,16 +1,34 @@
 # Standard library imports
-import os
+import threading
 
 # Third-party imports
 import hdbscan
 from sentence_transformers import SentenceTransformer
 
 # Local application imports
-from src.pdf2mindmap.utils.constants import RESOURCES_MARKDOWNS_DIR
+from src.pdf2mindmap.utils.constants import EMBEDDING_MODEL_NAME
+from src.pdf2mindmap.utils.lecture_artifact import LectureArtifact
+from src.pdf2mindmap.utils.workspace import Workspace, DEFAULT_WORKSPACE
+
+_embedding_model = None
+_embedding_model_lock = threading.Lock()
+
+def load_embedding_model() -> SentenceTransformer:
+    """
+    Return the shared SentenceTransformer used for slide and concept embeddings.
+
+    The model is loaded on first use and kept for the lifetime of the process, so
+    concurrent runs (e.g. service workers) share one warm model.
+    """
+    global _embedding_model
+    with _embedding_model_lock:
+        if _embedding_model is None:
+            _embedding_model = SentenceTransformer(EMBEDDING_MODEL_NAME)
+    return _embedding_model
 
 class PageGrouper():
-    def __init__(self):
-        self.md_dir_path = RESOURCES_MARKDOWNS_DIR
+    def __init__(self, workspace: Workspace = DEFAULT_WORKSPACE):
+        self.artifact_path = workspace.artifact_path
         self.texts = None
         self.contextualized_text = None
         self.embeddings = None
@@ -21,6 +39,8 @@ class PageGrouper():
         self.contextualized_text = self.contextualize_pages(self.texts)
         
         self.embeddings = self.generate_embeddings(self.contextualized_text)
+        with LectureArtifact(self.artifact_path) as artifact:
+            artifact.put_embeddings(self.embeddings)
         self.cluster_list = self.cluster_embeddings(self.embeddings)
         # print("Cluster List:")
         # print(self.cluster_list)
@@ -31,16 +51,15 @@ class PageGrouper():
     
     def page_line_to_dict(self, lines_to_consider: int) -> dict:
         """
-        Extract the first lines of each markdown file and map them to their page number.
+        Extract the first lines of each page's markdown and map them to their page number.
 
-        This function iterates over all files in 'markdown_directory_path', reads the
-        first 'lines_to_consider' lines from each file, and stores them in a dictionary
+        This function iterates over all pages stored in the lecture artifact, takes the
+        first 'lines_to_consider' lines of each page, and stores them in a dictionary
         keyed by page number.
 
-        The page number is extracted from the filename using 'file_name[5:7]' and is
-        returned as a string.
+        The page number is returned as a string.
 
-        :param lines_to_consider: Number of lines to read from the beginning of each file.
+        :param lines_to_consider: Number of lines to take from the beginning of each page.
         :type lines_to_consider: int
         
         :return: Mapping from page number (string) to the concatenated first lines of that page.
@@ -50,17 +69,11 @@ class PageGrouper():
         """
         page_line_pairs = {}
 
-        for file_name in os.listdir(self.md_dir_path):
-            file_path = os.path.join(self.md_dir_path, file_name)
-            page_number = file_name[5:7]
-            first_lines = ""
-            with open(file_path, "r", encoding="utf-8") as f:
-                for _ in range(lines_to_consider):
-                    try:
-                        first_lines += next(f)
-                    except StopIteration:
-                        break
-            page_line_pairs.update({page_number: first_lines})
+        with LectureArtifact(self.artifact_path) as artifact:
+            markdowns = artifact.markdowns()
+        for page_number, md_text in markdowns.items():
+            first_lines = "".join(md_text.splitlines(keepends=True)[:lines_to_consider])
+            page_line_pairs.update({str(page_number): first_lines})
         
         return page_line_pairs
 
@@ -124,7 +137,7 @@ class PageGrouper():
 
         :return: Embeddings of these pages/strings
         """
-        model = SentenceTransformer("sentence-transformers/distiluse-base-multilingual-cased-v1")
+        model = load_embedding_model()
 
         embeddings = model.encode(texts, normalize_embeddings=True)
 
@@ -1,4 +1,5 @@
 # Standard library imports
+import gc
 import os
 import re
 import shutil
@@ -12,64 +13,161 @@ import pymupdf.layout
 import pymupdf4llm
 
 # Local application imports
-from src.pdf2mindmap.utils.constants import (
-    LECTURE_PATH,
-    RESOURCES_MARKDOWNS_DIR,
-    RESOURCES_IMAGES_DIR
-    )
+from src.pdf2mindmap.utils.constants import LECTURE_PATH, PAGE_IMAGE_DPI, MEMORY_REOPEN_RATIO, ARTIFACT_COMMIT_PAGES
+from src.pdf2mindmap.utils.lecture_artifact import LectureArtifact
+from src.pdf2mindmap.utils.memory_budget import current_rss_mb
+from src.pdf2mindmap.utils.ocr import OcrStage, page_image_hash
+from src.pdf2mindmap.utils.workspace import Workspace, DEFAULT_WORKSPACE
 
 class PdfConverter():
-    def __init__(self, file_path: Path) -> None:
+    """
+    Converts a lecture PDF into the markdown and PNG of every page, stored in the
+    workspace's :class: LectureArtifact.
+
+    Slides are named page-01, page-02, ... with as many digits as the page count
+    needs, so that they sort in page order.
+
+    With a memory budget the PDF is converted in a single streaming pass: every page is
+    rendered to markdown and PNG and written before the next one, its pixmap is released
+    and the PyMuPDF store is emptied right away, and the document is reopened whenever
+    the process RSS exceeds MEMORY_REOPEN_RATIO of the budget. Only the page markdown
+    (needed for the header/footer dedup) is kept in memory; the artifact is committed
+    every ARTIFACT_COMMIT_PAGES pages.
+
+    With ocr=True, pages without extractable text are passed to :class: OcrStage before
+    the header/footer dedup. Born-digital PDFs never reach it, so their conversion is
+    unchanged.
+
+    :param file_path: Path to the lecture PDF.
+    :type file_path: pathlib.Path
+    :param workspace: Workspace whose lecture artifact receives the pages.
+    :type workspace: Workspace
+    :param memory_budget_mb: Optional memory budget in MiB enabling the streaming mode.
+    :type memory_budget_mb: float | None
+    :param dpi: Resolution of the rendered PNGs.
+    :type dpi: int
+    :param ocr: OCR pages without extractable text (needs Tesseract).
+    :type ocr: bool
+    """
+    def __init__(self,
+                 file_path: Path,
+                 workspace: Workspace = DEFAULT_WORKSPACE,
+                 memory_budget_mb: float | None = None,
+                 dpi: int = PAGE_IMAGE_DPI,
+                 ocr: bool = False) -> None:
+        self.file_path = file_path
         self.doc = pymupdf.open(file_path)
+        self.workspace = workspace
+        self.memory_budget_mb = memory_budget_mb
+        self.dpi = dpi
+        self.page_digits = max(2, len(str(self.doc.page_count)))
+        self.ocr_stage = OcrStage(file_path, memory_budget_mb=memory_budget_mb) if ocr else None
+        self.artifact = LectureArtifact(workspace.artifact_path)
 
     def pdf_to_markdown(self):
-        """Saves markdowns of every single slide of a PDF and saves them in a folder in the resources directory"""
-        markdown_output_dir = RESOURCES_MARKDOWNS_DIR
-
+        """Saves markdowns of every single slide of a PDF in the lecture artifact"""
         md_pages = {}
+        ocr_hashes = {}
 
         # Converting single slides to markdown text with initial cleaning of md_text
         for page in self.doc:
-            md_text = pymupdf4llm.to_markdown(doc=self.doc,
-                                              pages=[page.number],
-                                              footer=False,
-                                              header=False,
-                                              use_ocr=False,
-                                              write_images=False,
-                                              force_text=True
-                                              )
-            md_text = self._clean_markdown(md_text)
             page_number = page.number+1
-            md_pages[page_number] = md_text
+            md_pages[page_number] = self._page_markdown(page.number)
+            if self.ocr_stage and not md_pages[page_number].strip():
+                ocr_hashes[page.number] = page_image_hash(page, self.dpi)
+
+        # OCR of pages without extractable text (only if enabled)
+        md_pages.update(self._ocr_pages(ocr_hashes))
 
         # Dedup of all markdown pages
         md_pages = self.dedup(md_pages)
 
-        # Writing preprocessed markdown pages to .md files in output directory
-        for page_num, md in md_pages.items():
-            page_num_str = f"{page_num:02d}"
-
-            md_file = markdown_output_dir / f"page-{page_num_str}.md"
-            md_file.write_text(md, encoding="utf-8")
+        # Writing preprocessed markdown pages to the lecture artifact
+        self._write_markdowns(md_pages)
 
     def pdf_to_png(self):
-        """Saves screenshots of every single slide of a PDF and saves them in a folder in the resources directory"""
-        png_output_dir = RESOURCES_IMAGES_DIR
-
+        """Saves screenshots of every single slide of a PDF in the lecture artifact"""
         for page in self.doc:
-            pix = page.get_pixmap()  # Renders page to an image
+            pix = page.get_pixmap(dpi=self.dpi)  # Renders page to an image
             page_number = page.number+1
-            page_number_str = f"{page_number:02d}"
-            png_file = png_output_dir / f"page-{page_number_str}.png"
-            pix.save(png_file)
-    
+            self.artifact.put_page(page_number, self._page_stem(page_number), png=pix.tobytes("png"))
+        self.artifact.commit()
+
+    def pdf_to_markdown_and_png_streaming(self):
+        """Saves markdown and PNG of every slide in one pass, keeping memory within self.memory_budget_mb"""
+        md_pages = {}
+        ocr_hashes = {}
+
+        for page_index in range(self.doc.page_count):
+            page_number = page_index+1
+            md_pages[page_number] = self._page_markdown(page_index)
+            if self.ocr_stage and not md_pages[page_number].strip():
+                ocr_hashes[page_index] = page_image_hash(self.doc[page_index], self.dpi)
+
+            pix = self.doc[page_index].get_pixmap(dpi=self.dpi)
+            self.artifact.put_page(page_number, self._page_stem(page_number), png=pix.tobytes("png"))
+            del pix
+            if page_number % ARTIFACT_COMMIT_PAGES == 0:
+                self.artifact.commit()
+
+            # Drop fonts, images and display lists MuPDF cached for this page
+            pymupdf.TOOLS.store_shrink(100)
+            if current_rss_mb() > self.memory_budget_mb * MEMORY_REOPEN_RATIO:
+                self._reopen()
+
+        md_pages.update(self._ocr_pages(ocr_hashes))
+        md_pages = self.dedup(md_pages)
+        self._write_markdowns(md_pages)
+
     def convert(self):
         print("Converting pdf to markdown and pngs...")
-        self.pdf_to_markdown()
-        self.pdf_to_png()
+        try:
+            if self.memory_budget_mb is not None:
+                self.pdf_to_markdown_and_png_streaming()
+                return
+            self.pdf_to_markdown()
+            self.pdf_to_png()
+        finally:
+            self.doc.close()
+            self.artifact.close()
 
     # --- Only helper functions from here on ---
 
+    def _page_stem(self, page_number: int) -> str:
+        """File name without extension of a 1-based page number, e.g. page-07 or page-0107."""
+        return f"page-{page_number:0{self.page_digits}d}"
+
+    def _page_markdown(self, page_index: int) -> str:
+        md_text = pymupdf4llm.to_markdown(doc=self.doc,
+                                          pages=[page_index],
+                                          footer=False,
+                                          header=False,
+                                          use_ocr=False,
+                                          write_images=False,
+                                          force_text=True
+                                          )
+        return self._clean_markdown(md_text)
+
+    def _write_markdowns(self, md_pages: dict[int, str]) -> None:
+        for page_num, md in md_pages.items():
+            self.artifact.put_page(page_num, self._page_stem(page_num), markdown=md)
+        self.artifact.commit()
+
+    def _ocr_pages(self, ocr_hashes: dict[int, str]) -> dict[int, str]:
+        """Runs the OCR stage for the given 0-based pages and returns their cleaned markdown by 1-based page number"""
+        if not ocr_hashes:
+            return {}
+        texts = self.ocr_stage.run(ocr_hashes)
+        self.ocr_stage.print_report()
+        self.ocr_stage.save(self.workspace.ocr_report_path)
+        return {page_index+1: self._clean_markdown(text) for page_index, text in texts.items()}
+
+    def _reopen(self) -> None:
+        """Closes and reopens the document to release everything PyMuPDF keeps per open document."""
+        self.doc.close()
+        gc.collect()
+        self.doc = pymupdf.open(self.file_path)
+
     def _clean_markdown(self, md_text: str) -> str:
         """Function to clean Markdown output by removing PyMuPDF “picture intentionally omitted” placeholders, reducing noise and token usage in Markdown generated from PDF slides."""
         # REGEX Constants used to clean the pymupdf4llm to_markdown() output
@@ -0,0 +1,127 @@
+# Local application imports
+from src.pdf2mindmap.utils.token_estimates import estimate_text_tokens
+from src.pdf2mindmap.utils.constants import (
+    GROUP_TEXT_STAGE,
+    GROUP_MULTIMODAL_STAGE,
+    SUMMARY_STAGE,
+    MINDMAP_STAGE,
+    IMAGE_DETAIL,
+    PROMPT_CACHE_MIN_TOKENS
+)
+from src.pdf2mindmap.utils.prompts import (
+    SYSTEM_PROMPT,
+    SINGLE_SLIDE_EXTRACTOR_PROMPT,
+    MULTIPLE_SLIDE_EXTRACTOR_PROMPT,
+    MULTIPLE_SLIDE_TEXT_EXTRACTOR_PROMPT,
+    SUMMARY_PROMPT,
+    SUMMARY_INSTRUCTION,
+    MINDMAP_PROMPT
+)
+
+"""
+Prompt assembly with stable, cacheable prefixes.
+
+Providers cache the longest previously seen prefix of a request, but only from
+PROMPT_CACHE_MIN_TOKENS tokens on (OpenAI: 1024). Every request starts with a fixed
+system message that only depends on the stage, followed by the variable user content
+(slides, summaries).
+
+The current stage prefixes are about 400 tokens, below that minimum, so prompt
+caching does not apply to them; :meth:`PromptBuilder.cacheable` tells which prefixes
+are long enough and the run report shows "n/a" instead of a cache ratio for the others.
+"""
+
+SINGLE_SLIDE_PREFIX = "single_slide"
+
+
+def slide_text(slide_id: str, md_text: str) -> str:
+    """Text block of one slide in a group request."""
+    return f"SLIDE_ID: {slide_id}\nMARKDOWN:\n{md_text}\n\n"
+
+
+def group_text(pages: list[tuple]) -> str:
+    """
+    Variable text content of a slide group request.
+
+    :param pages: Tuples starting with (slide_id, markdown_text, ...) of the slides sent, in page order,
+                  e.g. from :meth:`LectureArtifact.pages` or :meth:`LectureArtifact.page_sizes`.
+    :type pages: list[tuple]
+    :return: The slide blocks concatenated.
+    :rtype: str
+    """
+    return "".join(slide_text(slide_id, md_text) for slide_id, md_text, *_ in pages)
+
+
+def _compose(*parts: str) -> str:
+    """Join prompt parts into one normalized prefix (stripped parts, blank line separated)."""
+    return "\n\n".join(part.strip() for part in parts) + "\n"
+
+
+PREFIXES = {
+    SINGLE_SLIDE_PREFIX: _compose(SYSTEM_PROMPT, SINGLE_SLIDE_EXTRACTOR_PROMPT),
+    GROUP_MULTIMODAL_STAGE: _compose(SYSTEM_PROMPT, MULTIPLE_SLIDE_EXTRACTOR_PROMPT),
+    GROUP_TEXT_STAGE: _compose(SYSTEM_PROMPT, MULTIPLE_SLIDE_TEXT_EXTRACTOR_PROMPT),
+    SUMMARY_STAGE: _compose(SUMMARY_PROMPT, SUMMARY_INSTRUCTION),
+    MINDMAP_STAGE: _compose(MINDMAP_PROMPT),
+}
+
+
+class PromptBuilder():
+    """
+    Builds chat messages as ``[fixed system prefix, variable user content]``.
+    """
+    def __init__(self, prefixes: dict[str, str] | None = None) -> None:
+        self.prefixes = dict(prefixes or PREFIXES)
+
+    def cacheable(self, name: str) -> bool:
+        """True if the prefix is long enough (PROMPT_CACHE_MIN_TOKENS) for provider-side prompt caching."""
+        return estimate_text_tokens(self.prefixes[name]) >= PROMPT_CACHE_MIN_TOKENS
+
+    def build(self, name: str, text: str, image_urls: list[str] | None = None,
+              image_detail: str = IMAGE_DETAIL) -> list[dict]:
+        """
+        Assemble the messages of one request.
+
+        :param name: Prefix name, usually the pipeline stage.
+        :type name: str
+        :param text: Variable text content of the request.
+        :type text: str
+        :param image_urls: Optional image (data) URLs appended after the text.
+        :type image_urls: list[str] | None
+        :param image_detail: Image detail requested from the provider ("auto", "low" or "high").
+        :type image_detail: str
+        :return: Chat messages with the fixed system prefix first.
+        :rtype: list[dict]
+        """
+        prefix = self.prefixes[name]
+
+        content = [{"type": "text", "text": text}]
+        for url in image_urls or []:
+            image_url = {"url": url}
+            if image_detail != "auto":
+                image_url["detail"] = image_detail
+            content.append({"type": "image_url", "image_url": image_url})
+
+        return [
+            {"role": "system", "content": prefix},
+            {"role": "user", "content": content}
+        ]
+
+    @staticmethod
+    def text_tokens(messages: list[dict]) -> int:
+        """
+        Estimate the text input tokens of built messages (all text parts, images excluded).
+
+        :param messages: Messages from :meth:`build`.
+        :type messages: list[dict]
+        :return: Estimated token count.
+        :rtype: int
+        """
+        texts = []
+        for message in messages:
+            content = message["content"]
+            if isinstance(content, str):
+                texts.append(content)
+            else:
+                texts.extend(part["text"] for part in content if part["type"] == "text")
+        return estimate_text_tokens("\n".join(texts))
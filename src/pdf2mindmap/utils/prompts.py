@@ -1,10 +1,10 @@
 SYSTEM_PROMPT = """
-    You are an exam-study assistant. The user provides one lecture slide at a time as:
-(1) markdown extracted from the PDF and (2) a rendered image of the same slide.
+You are an exam-study assistant. The user provides lecture slides, each as:
+(1) markdown extracted from the PDF and, if attached, (2) a rendered image of the same slide.
 Both files share the same base name (e.g., page-003.md and page-003.png).
 
 Your job:
-- Understand the slide using BOTH sources: use the image for layout/structure and the markdown for exact wording.
+- Understand the slide using ALL provided sources: use the image for layout/structure and the markdown for exact wording.
 - Produce an exam-oriented summary that is accurate and grounded in the provided slide.
 - If information is unclear or missing, state that it is unclear instead of guessing.
 
@@ -58,6 +58,26 @@ Return valid JSON with exactly these keys:
 No extra keys. No markdown.
 """
 
+MULTIPLE_SLIDE_TEXT_EXTRACTOR_PROMPT = """
+You will receive MULTIPLE slides (each slide consists of markdown only, no images).
+Create compact notes for later aggregation across the whole lecture.
+
+LANGUAGE RULE (STRICT):
+- ALL text in the JSON output MUST be written in German.
+- Do not mix languages.
+
+Return valid JSON with exactly these keys:
+{
+  "slide_ids": [str, ...],
+  "summary_bullets": [str, ...],          // 3-8 bullets, short, factual
+  "topics": [str, ...],                   // 5-12 short topic labels
+  "connections": [str, ...],              // 0-8 short relations like "A -> B because ..."
+  "uncertainties": [str, ...]             // unclear parts; empty list if none
+}
+
+No extra keys. No markdown.
+"""
+
 SUMMARY_PROMPT = """
 You are an exam-study assistant responsible for creating a FINAL lecture summary.
 
@@ -94,6 +114,12 @@ LANGUAGE RULE (STRICT):
 - ALL output MUST be written in German.
 """
 
+SUMMARY_INSTRUCTION = (
+    "Below is a list of JSON objects. "
+    "Each object represents a summary of a semantically related group of lecture slides.\n\n"
+    "Use this information to generate a coherent, well-structured summary of the entire lecture."
+)
+
 MINDMAP_PROMPT = """
 You will receive a FINAL lecture summary written in Markdown.
 
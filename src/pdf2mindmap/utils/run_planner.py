@@ -0,0 +1,235 @@
+# Standard library imports
+import heapq
+import json
+from dataclasses import dataclass, asdict
+from pathlib import Path
+
+# Local application imports
+from src.pdf2mindmap.utils.lecture_artifact import LectureArtifact
+from src.pdf2mindmap.utils.model_router import ModelRouter, stage_model_names
+from src.pdf2mindmap.utils.page_grouper import PageGrouper
+from src.pdf2mindmap.utils.prompt_builder import PromptBuilder, group_text
+from src.pdf2mindmap.utils.slide_dedup import SlideDeduplicator, collapse_lecture, split_collapsed
+from src.pdf2mindmap.utils.token_estimates import estimate_image_tokens
+from src.pdf2mindmap.utils.workspace import Workspace, DEFAULT_WORKSPACE
+from src.pdf2mindmap.utils.constants import (
+    GROUP_MULTIMODAL_STAGE,
+    SUMMARY_STAGE,
+    MINDMAP_STAGE,
+    GROUP_CONCURRENCY,
+    IMAGE_DETAIL,
+    DEDUP_SLIDES,
+    PLAN_OUTPUT_TOKENS,
+    PLAN_LATENCY_BASE_S,
+    PLAN_INPUT_TOKENS_PER_S,
+    PLAN_OUTPUT_TOKENS_PER_S,
+    PLAN_CONCURRENCY_LEVELS,
+    MODEL_PRICES_PER_1M
+)
+
+
+@dataclass
+class CallPlan:
+    """Estimated tokens, latency and cost of one model call."""
+    stage: str
+    model: str
+    group_id: int | None
+    pages: int
+    images: int
+    text_tokens: int
+    image_tokens: int
+    output_tokens: int
+    latency_s: float
+    cost_usd: float | None
+
+    @property
+    def input_tokens(self) -> int:
+        return self.text_tokens + self.image_tokens
+
+
+class RunPlanner():
+    """
+    Estimates a LectureAgent run from the converted slides without calling any model.
+
+    The slides are grouped, deduplicated and routed exactly like in a real run, and the
+    group messages are built by the same :class: PromptBuilder calls as in
+    LectureAgent (without encoding the images). For
+    every call the input tokens (prompt prefix, slide text and image tiles), the
+    expected output tokens (PLAN_OUTPUT_TOKENS), the latency (PLAN_LATENCY_* model)
+    and the cost (MODEL_PRICES_PER_1M) are estimated. The wall time of the group stage
+    is the makespan of the group calls on `concurrency` workers in group order; summary
+    and mindmap follow sequentially.
+
+    :param workspace: Workspace with the converted slides.
+    :type workspace: Workspace
+    :param concurrency: Number of concurrent group calls to plan for.
+    :type concurrency: int
+    :param image_detail: Image detail to plan for ("auto", "low" or "high").
+    :type image_detail: str
+    """
+    def __init__(self,
+                 workspace: Workspace = DEFAULT_WORKSPACE,
+                 concurrency: int = GROUP_CONCURRENCY,
+                 image_detail: str = IMAGE_DETAIL) -> None:
+        self.workspace = workspace
+        self.concurrency = concurrency
+        self.image_detail = image_detail
+        self.model_names = stage_model_names()
+        self.router = ModelRouter()
+        self.deduplicator = SlideDeduplicator(enabled=DEDUP_SLIDES)
+        self.prompt_builder = PromptBuilder()
+
+    def plan(self) -> dict:
+        """
+        Group the slides and estimate the run.
+
+        :return: Per-call and per-stage estimates, the expected wall time for several
+                 concurrency levels and the totals for every image detail.
+        :rtype: dict
+        """
+        page_grouper = PageGrouper(self.workspace)
+        page_grouper.run()
+
+        # Deduplicate, route and build the prompts once, the image detail only changes the image tokens
+        groups = []
+        with LectureArtifact(self.workspace.artifact_path) as artifact:
+            collapsed, _ = collapse_lecture(artifact, self.deduplicator, self.image_detail)
+            for group, pages_list in sorted(page_grouper.groups.items()):
+                pages = artifact.page_sizes(pages_list)
+                kept, _ = split_collapsed(pages, collapsed)
+                # Groups collapsed entirely into other groups need no call
+                if not kept:
+                    continue
+                stage = self.router.route_sizes(kept).stage
+                messages = self.prompt_builder.build(stage, group_text(kept))
+                images = [(width, height) for _, _, _, width, height in kept] if stage == GROUP_MULTIMODAL_STAGE else []
+                image_tokens = {
+                    detail: sum(estimate_image_tokens(width, height, detail) for width, height in images)
+                    for detail in {self.image_detail, "high", "low"}
+                }
+                groups.append((group, len(pages), len(images), stage,
+                               self.prompt_builder.text_tokens(messages), image_tokens))
+
+        calls = self._plan_calls(groups, self.image_detail)
+        plan = self._summarize(calls, self.image_detail, self.concurrency)
+        plan["wall_time_by_concurrency"] = {
+            str(level): self.wall_time(calls, level) for level in sorted({*PLAN_CONCURRENCY_LEVELS, self.concurrency})
+        }
+        plan["image_detail_alternatives"] = {}
+        for detail in ("high", "low"):
+            alternative = self._summarize(self._plan_calls(groups, detail), detail, self.concurrency)
+            plan["image_detail_alternatives"][detail] = alternative["totals"]
+        return plan
+
+    def _plan_calls(self, groups: list, image_detail: str) -> list[CallPlan]:
+        calls = []
+        for group, page_count, images, stage, text_tokens, image_tokens in groups:
+            calls.append(self._call(stage, group, page_count, images, text_tokens, image_tokens[image_detail]))
+
+        # The summary reads all group outputs, the mindmap reads the summary
+        group_output = sum(call.output_tokens for call in calls)
+        summary_prefix = self.prompt_builder.text_tokens(self.prompt_builder.build(SUMMARY_STAGE, ""))
+        calls.append(self._call(SUMMARY_STAGE, None, 0, 0, summary_prefix + group_output, 0))
+        mindmap_prefix = self.prompt_builder.text_tokens(self.prompt_builder.build(MINDMAP_STAGE, ""))
+        calls.append(self._call(MINDMAP_STAGE, None, 0, 0, mindmap_prefix + calls[-1].output_tokens, 0))
+        return calls
+
+    def _call(self, stage: str, group_id: int | None, pages: int, images: int,
+              text_tokens: int, image_tokens: int) -> CallPlan:
+        model = self.model_names[stage]
+        output_tokens = PLAN_OUTPUT_TOKENS[stage]
+        input_tokens = text_tokens + image_tokens
+        latency = (PLAN_LATENCY_BASE_S + input_tokens / PLAN_INPUT_TOKENS_PER_S
+                   + output_tokens / PLAN_OUTPUT_TOKENS_PER_S)
+        return CallPlan(stage, model, group_id, pages, images, text_tokens, image_tokens,
+                        output_tokens, latency, self.cost(model, input_tokens, output_tokens))
+
+    @staticmethod
+    def cost(model: str, input_tokens: int, output_tokens: int) -> float | None:
+        """Cost in USD of a call, or None if MODEL_PRICES_PER_1M has no price for the model."""
+        if model not in MODEL_PRICES_PER_1M:
+            return None
+        input_price, output_price = MODEL_PRICES_PER_1M[model]
+        return (input_tokens * input_price + output_tokens * output_price) / 1_000_000
+
+    @staticmethod
+    def wall_time(calls: list[CallPlan], concurrency: int) -> float:
+        """
+        Expected wall time of a run in seconds.
+
+        Group calls are assigned in group order to the first free of `concurrency`
+        workers (like the agent's thread pool); summary and mindmap run afterwards.
+        """
+        workers = [0.0] * max(1, concurrency)
+        sequential = 0.0
+        for call in calls:
+            if call.group_id is None:
+                sequential += call.latency_s
+                continue
+            heapq.heappush(workers, heapq.heappop(workers) + call.latency_s)
+        return max(workers) + sequential
+
+    def _summarize(self, calls: list[CallPlan], image_detail: str, concurrency: int) -> dict:
+        stages = {}
+        for call in calls:
+            stage = stages.setdefault(call.stage, {
+                "model": call.model, "calls": 0, "images": 0, "input_tokens": 0,
+                "image_tokens": 0, "output_tokens": 0, "latency_s": 0.0, "cost_usd": 0.0
+            })
+            stage["calls"] += 1
+            stage["images"] += call.images
+            stage["input_tokens"] += call.input_tokens
+            stage["image_tokens"] += call.image_tokens
+            stage["output_tokens"] += call.output_tokens
+            stage["latency_s"] += call.latency_s
+            stage["cost_usd"] = None if stage["cost_usd"] is None or call.cost_usd is None \
+                else stage["cost_usd"] + call.cost_usd
+
+        costs = [stage["cost_usd"] for stage in stages.values()]
+        totals = {
+            "calls": len(calls),
+            "images": sum(call.images for call in calls),
+            "input_tokens": sum(call.input_tokens for call in calls),
+            "image_tokens": sum(call.image_tokens for call in calls),
+            "output_tokens": sum(call.output_tokens for call in calls),
+            "cost_usd": None if None in costs else sum(costs),
+            "wall_time_s": self.wall_time(calls, concurrency)
+        }
+        return {
+            "image_detail": image_detail,
+            "concurrency": concurrency,
+            "groups": [{**asdict(call), "input_tokens": call.input_tokens} for call in calls if call.group_id is not None],
+            "stages": stages,
+            "totals": totals
+        }
+
+    @staticmethod
+    def print_plan(plan: dict) -> None:
+        """Print the per-group and per-stage tables of a plan."""
+        print(f"{'group':>6}{'pages':>7}{'imgs':>6}  {'stage':<18}{'text tok':>9}{'img tok':>9}{'out tok':>9}{'est s':>7}")
+        for group in plan["groups"]:
+            print(f"{group['group_id']:>6}{group['pages']:>7}{group['images'] or '-':>6}  {group['stage']:<18}"
+                  f"{group['text_tokens']:>9}{group['image_tokens']:>9}{group['output_tokens']:>9}{group['latency_s']:>7.1f}")
+        print()
+        print(f"{'stage':<18}{'model':<28}{'calls':>6}{'in tok':>9}{'out tok':>9}{'cost $':>9}")
+        for name, stage in plan["stages"].items():
+            cost = "n/a" if stage["cost_usd"] is None else f"{stage['cost_usd']:.4f}"
+            print(f"{name:<18}{stage['model']:<28}{stage['calls']:>6}{stage['input_tokens']:>9}"
+                  f"{stage['output_tokens']:>9}{cost:>9}")
+
+        totals = plan["totals"]
+        cost = "n/a" if totals["cost_usd"] is None else f"${totals['cost_usd']:.4f}"
+        print(f"Total: {totals['calls']} calls, {totals['input_tokens']} input tokens "
+              f"({totals['image_tokens']} for {totals['images']} images, detail={plan['image_detail']}), "
+              f"{totals['output_tokens']} output tokens, {cost}")
+        print("Wall time by concurrency: " + ", ".join(
+            f"{level}: {seconds:.0f}s" for level, seconds in plan["wall_time_by_concurrency"].items()))
+        for detail, alternative in plan["image_detail_alternatives"].items():
+            cost = "n/a" if alternative["cost_usd"] is None else f"${alternative['cost_usd']:.4f}"
+            print(f"With image detail {detail}: {alternative['input_tokens']} input tokens, {cost}, "
+                  f"{alternative['wall_time_s']:.0f}s at concurrency {plan['concurrency']}")
+
+    @staticmethod
+    def save(plan: dict, path: Path) -> None:
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(plan, f, ensure_ascii=False, indent=2)
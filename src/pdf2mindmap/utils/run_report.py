@@ -0,0 +1,176 @@
+# Standard library imports
+import json
+from dataclasses import dataclass, field, asdict
+from pathlib import Path
+
+
+@dataclass
+class CallRecord:
+    """Latency and token usage of one model invocation."""
+    stage: str
+    model: str
+    latency_s: float
+    input_tokens: int = 0
+    output_tokens: int = 0
+    cached_tokens: int = 0
+    prefix_cacheable: bool = True
+    images_sent: int = 0
+    images_skipped: int = 0
+    saved_image_tokens: int = 0
+    pages_deduplicated: int = 0
+    dedup_images_saved: int = 0
+    dedup_saved_tokens: int = 0
+
+
+@dataclass
+class RunReport:
+    """
+    Collects one CallRecord per model invocation of a LectureAgent run.
+
+    The report aggregates latency and token usage per stage, the share of input tokens
+    served from the provider's prompt cache (None if no call of the stage had a prefix long
+    enough for caching and nothing was cached) and how many images (and their estimated
+    input tokens) the model router and the slide deduplication kept away from the models. http_pool holds the
+    utilization of the shared HTTP connection pool at the end of the run, memory the
+    peak RSS per stage (see :class: MemoryMonitor).
+    """
+    calls: list[CallRecord] = field(default_factory=list)
+    http_pool: dict = field(default_factory=dict)
+    memory: dict = field(default_factory=dict)
+
+    def record(self, stage: str, model: str, response, latency_s: float, **extra) -> CallRecord:
+        """
+        Add a model invocation to the report.
+
+        :param stage: Pipeline stage that issued the call.
+        :param model: Name of the model that served the call.
+        :param response: The AIMessage returned by the model (its usage_metadata is read if present).
+        :param latency_s: Wall time of the call in seconds.
+        :param extra: Additional CallRecord fields (prefix_cacheable, images_sent, images_skipped, saved_image_tokens,
+                      pages_deduplicated, dedup_images_saved, dedup_saved_tokens).
+        :return: The created record.
+        :rtype: CallRecord
+        """
+        usage = getattr(response, "usage_metadata", None) or {}
+        input_details = usage.get("input_token_details") or {}
+        call = CallRecord(
+            stage=stage,
+            model=model,
+            latency_s=latency_s,
+            input_tokens=usage.get("input_tokens", 0),
+            output_tokens=usage.get("output_tokens", 0),
+            cached_tokens=input_details.get("cache_read", 0) or 0,
+            **extra
+        )
+        self.calls.append(call)
+        return call
+
+    def summary(self) -> dict:
+        """
+        Aggregate all calls per stage.
+
+        :return: Per-stage totals and run-wide totals.
+        :rtype: dict
+        """
+        stages = {}
+        for call in self.calls:
+            stage = stages.setdefault(call.stage, {
+                "model": call.model,
+                "calls": 0,
+                "latency_s": 0.0,
+                "input_tokens": 0,
+                "output_tokens": 0,
+                "cached_tokens": 0,
+                "prefix_cacheable": False,
+                "images_sent": 0,
+                "images_skipped": 0,
+                "saved_image_tokens": 0,
+                "pages_deduplicated": 0,
+                "dedup_images_saved": 0,
+                "dedup_saved_tokens": 0,
+            })
+            stage["calls"] += 1
+            stage["latency_s"] += call.latency_s
+            stage["input_tokens"] += call.input_tokens
+            stage["output_tokens"] += call.output_tokens
+            stage["cached_tokens"] += call.cached_tokens
+            stage["prefix_cacheable"] = stage["prefix_cacheable"] or call.prefix_cacheable
+            stage["images_sent"] += call.images_sent
+            stage["images_skipped"] += call.images_skipped
+            stage["saved_image_tokens"] += call.saved_image_tokens
+            stage["pages_deduplicated"] += call.pages_deduplicated
+            stage["dedup_images_saved"] += call.dedup_images_saved
+            stage["dedup_saved_tokens"] += call.dedup_saved_tokens
+
+        for stage in stages.values():
+            stage["avg_latency_s"] = stage["latency_s"] / stage["calls"]
+            stage["cached_ratio"] = self._cached_ratio(stage["cached_tokens"], stage["input_tokens"],
+                                                       stage["prefix_cacheable"])
+
+        totals = {
+            "calls": len(self.calls),
+            "latency_s": sum(c.latency_s for c in self.calls),
+            "input_tokens": sum(c.input_tokens for c in self.calls),
+            "output_tokens": sum(c.output_tokens for c in self.calls),
+            "cached_tokens": sum(c.cached_tokens for c in self.calls),
+            "images_skipped": sum(c.images_skipped for c in self.calls),
+            "saved_image_tokens": sum(c.saved_image_tokens for c in self.calls),
+            "pages_deduplicated": sum(c.pages_deduplicated for c in self.calls),
+            "dedup_images_saved": sum(c.dedup_images_saved for c in self.calls),
+            "dedup_saved_tokens": sum(c.dedup_saved_tokens for c in self.calls),
+        }
+        totals["cached_ratio"] = self._cached_ratio(totals["cached_tokens"], totals["input_tokens"],
+                                                    any(c.prefix_cacheable for c in self.calls))
+        return {"stages": stages, "totals": totals}
+
+    @staticmethod
+    def _cached_ratio(cached_tokens: int, input_tokens: int, cacheable: bool) -> float | None:
+        """Share of cached input tokens, None if caching could not apply (prefixes below PROMPT_CACHE_MIN_TOKENS)."""
+        if not cacheable and not cached_tokens:
+            return None
+        return cached_tokens / input_tokens if input_tokens else 0.0
+
+    @staticmethod
+    def _format_ratio(ratio: float | None) -> str:
+        return "n/a" if ratio is None else f"{ratio:.0%}"
+
+    def print_report(self) -> None:
+        """Print a compact per-stage table of the run."""
+        summary = self.summary()
+        print(f"{'stage':<18}{'model':<28}{'calls':>6}{'avg s':>8}{'in tok':>9}{'out tok':>9}{'cached':>8}{'img skip':>9}{'tok saved':>10}")
+        for name, stage in summary["stages"].items():
+            print(f"{name:<18}{stage['model']:<28}{stage['calls']:>6}{stage['avg_latency_s']:>8.2f}"
+                  f"{stage['input_tokens']:>9}{stage['output_tokens']:>9}{self._format_ratio(stage['cached_ratio']):>8}"
+                  f"{stage['images_skipped']:>9}{stage['saved_image_tokens']:>10}")
+        totals = summary["totals"]
+        if totals["cached_ratio"] is None:
+            caching = "prompt caching n/a (prefixes below the provider minimum)"
+        else:
+            caching = f"{totals['cached_ratio']:.0%} of input tokens cached"
+        print(f"Total: {totals['calls']} calls, {totals['latency_s']:.1f}s model time, {caching}, "
+              f"{totals['images_skipped']} images / ~{totals['saved_image_tokens']} input tokens saved by routing")
+        print(f"Slide dedup: {totals['pages_deduplicated']} pages collapsed, "
+              f"{totals['dedup_images_saved']} images / ~{totals['dedup_saved_tokens']} input tokens saved")
+        if self.http_pool:
+            pool = self.http_pool
+            idle = "" if pool["idle_connections"] is None else f"{pool['idle_connections']} idle, "
+            versions = ", ".join(f"{count} {version}" for version, count in sorted(pool["http_versions"].items()))
+            print(f"HTTP pool: {pool['requests']} requests, peak {pool['peak_in_flight']} in flight over "
+                  f"{pool['connections_opened']}/{pool['max_connections']} opened connections, "
+                  f"{idle}responses {versions or 'none'} (HTTP/2 available: {pool['http2_available']}), "
+                  f"{pool['compressed_bytes_saved']} bytes saved by compression")
+        if self.memory:
+            stages = ", ".join(f"{s['stage']} {s['peak_rss_mb']:.0f}" for s in self.memory["stages"])
+            print(f"Peak RSS (MiB): {stages}")
+            if self.memory["budget_mb"] is not None:
+                state = "kept" if self.memory["within_budget"] else "EXCEEDED"
+                print(f"Memory budget of {self.memory['budget_mb']:.0f} MiB {state}")
+
+    def save(self, path: Path) -> None:
+        """Write the summary and all raw call records as JSON to path."""
+        data = self.summary()
+        data["http_pool"] = self.http_pool
+        data["memory"] = self.memory
+        data["calls"] = [asdict(c) for c in self.calls]
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False, indent=2)
@@ -0,0 +1,215 @@
+# Standard library imports
+import re
+from dataclasses import dataclass, field
+from typing import Iterable
+
+# Local application imports
+from src.pdf2mindmap.utils.image_hash import image_dhash, hamming_distance
+from src.pdf2mindmap.utils.lecture_artifact import LectureArtifact
+from src.pdf2mindmap.utils.prompt_builder import slide_text
+from src.pdf2mindmap.utils.token_estimates import estimate_text_tokens, estimate_image_tokens
+from src.pdf2mindmap.utils.constants import (
+    DEDUP_SHINGLE_SIZE,
+    DEDUP_MAX_HASH_DISTANCE,
+    DEDUP_MAX_HASH_DISTANCE_NO_TEXT,
+    DEDUP_MIN_TEXT_OVERLAP
+)
+
+
+def text_shingles(text: str, size: int = DEDUP_SHINGLE_SIZE) -> set[tuple[str, ...]]:
+    """
+    Set of word shingles (overlapping word n-grams) of a slide text.
+
+    :param text: Markdown text of the slide.
+    :type text: str
+    :param size: Number of words per shingle.
+    :type size: int
+    :return: The shingles; texts shorter than size words form a single shingle.
+    :rtype: set[tuple[str, ...]]
+    """
+    words = re.findall(r'\w+', text.lower())
+    if len(words) <= size:
+        return {tuple(words)} if words else set()
+    return {tuple(words[i:i + size]) for i in range(len(words) - size + 1)}
+
+
+@dataclass
+class SlideSignature:
+    """Image hash and text shingles of one slide."""
+    slide_id: str
+    image_hash: int
+    shingles: set = field(default_factory=set)
+
+
+@dataclass
+class DedupResult:
+    """Slides kept for prompting and, for every dropped slide, the kept slide that covers it."""
+    kept: list = field(default_factory=list)
+    collapsed: dict = field(default_factory=dict)
+
+
+class SlideDeduplicator():
+    """
+    Detects build-up sequences and repeated slides of a lecture.
+
+    Lecture decks export animations as several pages that each add a bit to the
+    previous one. A slide is a build-up step of the next slide if both look alike
+    (dHash distance of the rendered PNGs) and nearly all of its text shingles appear on
+    the next slide; such sequences are collapsed to their final frame, which shows
+    everything. Slides repeating an earlier kept slide (near-identical
+    image and text) are dropped as well. Slides without text are only collapsed if
+    their images are almost identical.
+
+    The agent runs :meth:`collapse_hashed` over the whole deck in page order (see
+    :func:`collapse_lecture`), with the image hashes stored during the conversion, before
+    the slide groups are prompted, so build-up sequences that cross a group boundary are
+    collapsed as well; only the hash and shingles of every slide are kept in memory.
+
+    :param max_hash_distance: Maximum dHash distance of two slides with text.
+    :type max_hash_distance: int
+    :param max_hash_distance_no_text: Maximum dHash distance of two slides without text.
+    :type max_hash_distance_no_text: int
+    :param min_text_overlap: Minimum share of the earlier slide's shingles found on the later slide.
+    :type min_text_overlap: float
+    :param enabled: If False, all slides are kept.
+    :type enabled: bool
+    """
+    def __init__(self,
+                 max_hash_distance: int = DEDUP_MAX_HASH_DISTANCE,
+                 max_hash_distance_no_text: int = DEDUP_MAX_HASH_DISTANCE_NO_TEXT,
+                 min_text_overlap: float = DEDUP_MIN_TEXT_OVERLAP,
+                 enabled: bool = True) -> None:
+        self.max_hash_distance = max_hash_distance
+        self.max_hash_distance_no_text = max_hash_distance_no_text
+        self.min_text_overlap = min_text_overlap
+        self.enabled = enabled
+
+    def deduplicate(self, pages: list[tuple[str, str, bytes]]) -> DedupResult:
+        """
+        Collapse build-up sequences and repeated slides of a list of pages.
+
+        :param pages: List of (slide_id, markdown_text, png_bytes) in page order.
+        :type pages: list[tuple[str, str, bytes]]
+        :return: Kept pages in page order and a mapping from dropped to kept slide ids.
+        :rtype: DedupResult
+        """
+        collapsed = self.collapse(pages)
+        return DedupResult([page for page in pages if page[0] not in collapsed], collapsed)
+
+    def collapse(self, pages: Iterable[tuple[str, str, bytes]]) -> dict[str, str]:
+        """
+        Find the dropped slides of a sequence of pages.
+
+        Pages are consumed one by one, so they can be streamed from the lecture artifact.
+
+        :param pages: (slide_id, markdown_text, png_bytes) in page order.
+        :type pages: Iterable[tuple[str, str, bytes]]
+        :return: Mapping from every dropped slide id to the kept slide id covering it.
+        :rtype: dict[str, str]
+        """
+        return self.collapse_hashed((slide_id, md_text, image_dhash(png)) for slide_id, md_text, png in pages)
+
+    def collapse_hashed(self, pages: Iterable[tuple[str, str, int]]) -> dict[str, str]:
+        """
+        Like :meth:`collapse`, for pages whose images were already hashed (see :meth:`LectureArtifact.page_hashes`).
+
+        :param pages: (slide_id, markdown_text, image_hash) in page order.
+        :type pages: Iterable[tuple[str, str, int]]
+        :return: Mapping from every dropped slide id to the kept slide id covering it.
+        :rtype: dict[str, str]
+        """
+        if not self.enabled:
+            return {}
+
+        kept = []  # signatures of the kept slides
+        collapsed = {}
+        for slide_id, md_text, image_hash in pages:
+            signature = SlideSignature(slide_id, image_hash, text_shingles(md_text))
+
+            # The previous kept slide is an earlier frame of this one: keep the later frame
+            if kept and self.is_build_up(kept[-1], signature):
+                previous_id = kept.pop().slide_id
+                for dropped_id, target_id in collapsed.items():
+                    if target_id == previous_id:
+                        collapsed[dropped_id] = slide_id
+                collapsed[previous_id] = slide_id
+                kept.append(signature)
+                continue
+
+            repeated = next((s for s in kept if self.is_repeat(s, signature)), None)
+            if repeated is not None:
+                collapsed[slide_id] = repeated.slide_id
+                continue
+            kept.append(signature)
+
+        return collapsed
+
+    def is_build_up(self, earlier: SlideSignature, later: SlideSignature) -> bool:
+        """True if later looks like earlier and contains (nearly) all of its text."""
+        if not self._images_match(earlier, later):
+            return False
+        if not earlier.shingles:
+            return True
+        overlap = len(earlier.shingles & later.shingles) / len(earlier.shingles)
+        return overlap >= self.min_text_overlap
+
+    def is_repeat(self, first: SlideSignature, other: SlideSignature) -> bool:
+        """True if both slides have near-identical images and texts."""
+        if hamming_distance(first.image_hash, other.image_hash) > self.max_hash_distance_no_text:
+            return False
+        union = first.shingles | other.shingles
+        if not union:
+            return True
+        return len(first.shingles & other.shingles) / len(union) >= self.min_text_overlap
+
+    def _images_match(self, a: SlideSignature, b: SlideSignature) -> bool:
+        has_text = a.shingles or b.shingles
+        limit = self.max_hash_distance if has_text else self.max_hash_distance_no_text
+        return hamming_distance(a.image_hash, b.image_hash) <= limit
+
+
+def collapse_lecture(artifact: LectureArtifact, deduplicator: SlideDeduplicator,
+                     image_detail: str) -> tuple[dict[str, str], dict[str, tuple[int, int]]]:
+    """
+    Collapse build-up sequences and repeated slides of a whole lecture in page order.
+
+    Only the markdown and the stored image hashes and dimensions are read from the
+    lecture artifact, never the images themselves, so the pass does not call PyMuPDF
+    (which is not thread-safe) outside the PDF conversion. Used by the agent and the run
+    planner, so both send (or plan) exactly the same slides.
+
+    :param artifact: Lecture artifact with the converted pages.
+    :type artifact: LectureArtifact
+    :param deduplicator: The deduplicator to use.
+    :type deduplicator: SlideDeduplicator
+    :param image_detail: Image detail the image tokens are estimated for.
+    :type image_detail: str
+    :return: Mapping from dropped to kept slide ids and the estimated (text, image)
+             input tokens of every slide.
+    :rtype: tuple[dict[str, str], dict[str, tuple[int, int]]]
+    """
+    slide_tokens = {}
+    pages = []
+    for slide_id, md_text, image_hash, width, height in artifact.page_hashes():
+        slide_tokens[slide_id] = (estimate_text_tokens(slide_text(slide_id, md_text)),
+                                  estimate_image_tokens(width, height, image_detail))
+        pages.append((slide_id, md_text, image_hash))
+
+    collapsed = deduplicator.collapse_hashed(pages)
+    return collapsed, slide_tokens
+
+
+def split_collapsed(pages: list[tuple], collapsed: dict[str, str]) -> tuple[list[tuple], dict[str, str]]:
+    """
+    Split the pages of a slide group into the kept pages and the group's collapsed slides.
+
+    :param pages: Tuples starting with the slide_id, e.g. (slide_id, markdown_text, png_bytes),
+                  of the group in page order.
+    :type pages: list[tuple]
+    :param collapsed: Collapsed slides of the lecture from :func:`collapse_lecture`.
+    :type collapsed: dict[str, str]
+    :return: The kept pages and the group's dropped slide ids mapped to the kept slide ids.
+    :rtype: tuple[list, dict[str, str]]
+    """
+    kept = [page for page in pages if page[0] not in collapsed]
+    return kept, {page[0]: collapsed[page[0]] for page in pages if page[0] in collapsed}
@@ -0,0 +1,71 @@
+# Standard library imports
+import math
+import struct
+
+"""Rough, dependency-free token estimates for prompt text and slide images."""
+
+# OpenAI-style image accounting: images are scaled to fit into 2048x2048, then the
+# shortest side is scaled to 768px and the image is billed per 512px tile.
+IMAGE_BASE_TOKENS = 85
+IMAGE_TILE_TOKENS = 170
+CHARS_PER_TOKEN = 4
+
+
+def estimate_text_tokens(text: str) -> int:
+    """
+    Estimate the number of tokens of a text using the common ~4 characters per token rule.
+
+    :param text: Prompt text.
+    :type text: str
+    :return: Estimated token count.
+    :rtype: int
+    """
+    return math.ceil(len(text) / CHARS_PER_TOKEN)
+
+
+def png_dimensions(png: bytes) -> tuple[int, int]:
+    """
+    Read width and height of a PNG image from its IHDR chunk without decoding the image.
+
+    :param png: The PNG image.
+    :type png: bytes
+    :return: (width, height) in pixels.
+    :rtype: tuple[int, int]
+    :raises ValueError: If the data is not a PNG image.
+    """
+    header = png[:24]
+    if header[:8] != b"\x89PNG\r\n\x1a\n":
+        raise ValueError("Image is not a PNG")
+    width, height = struct.unpack(">II", header[16:24])
+    return width, height
+
+
+def estimate_image_tokens(width: int, height: int, detail: str = "high") -> int:
+    """
+    Estimate the input tokens a provider bills for one image.
+
+    :param width: Image width in pixels.
+    :type width: int
+    :param height: Image height in pixels.
+    :type height: int
+    :param detail: "low" (fixed base cost) or "high"/"auto" (tile based cost).
+    :type detail: str
+    :return: Estimated token count.
+    :rtype: int
+    """
+    if detail == "low":
+        return IMAGE_BASE_TOKENS
+
+    scale = min(1.0, 2048 / max(width, height))
+    width, height = width * scale, height * scale
+    scale = min(1.0, 768 / min(width, height))
+    width, height = width * scale, height * scale
+
+    tiles = math.ceil(width / 512) * math.ceil(height / 512)
+    return IMAGE_BASE_TOKENS + IMAGE_TILE_TOKENS * tiles
+
+
+def estimate_png_tokens(png: bytes, detail: str = "high") -> int:
+    """Estimate the input tokens of a PNG slide image (see :func:`estimate_image_tokens`)."""
+    width, height = png_dimensions(png)
+    return estimate_image_tokens(width, height, detail)
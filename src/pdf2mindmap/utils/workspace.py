@@ -0,0 +1,56 @@
+# Standard library imports
+from dataclasses import dataclass
+from pathlib import Path
+
+# Local application imports
+from src.pdf2mindmap.utils.constants import (
+    LECTURE_PATH,
+    ARTIFACT_PATH,
+    SUMMARY_PATH,
+    NODES_EDGES_PATH,
+    RUN_REPORT_PATH,
+    OCR_REPORT_PATH,
+    PLAN_PATH
+)
+
+
+@dataclass(frozen=True)
+class Workspace:
+    """
+    All input and output paths of one pipeline run.
+
+    The default workspace is the resources directory used by the summarize command.
+    :meth:`at` creates an isolated workspace below another directory, e.g. one per
+    job of the HTTP service, so several runs can execute side by side.
+    """
+    lecture_path: Path = LECTURE_PATH
+    artifact_path: Path = ARTIFACT_PATH
+    summary_path: Path = SUMMARY_PATH
+    nodes_edges_path: Path = NODES_EDGES_PATH
+    run_report_path: Path = RUN_REPORT_PATH
+    ocr_report_path: Path = OCR_REPORT_PATH
+    plan_path: Path = PLAN_PATH
+
+    @classmethod
+    def at(cls, root: Path) -> "Workspace":
+        """
+        Create a workspace whose files live directly in root, named like in the resources directory.
+
+        :param root: Directory of the workspace.
+        :type root: pathlib.Path
+        :return: The workspace (the directory is created by :func:`directory_reset`).
+        :rtype: Workspace
+        """
+        root = Path(root)
+        return cls(
+            lecture_path=root / LECTURE_PATH.name,
+            artifact_path=root / ARTIFACT_PATH.name,
+            summary_path=root / SUMMARY_PATH.name,
+            nodes_edges_path=root / NODES_EDGES_PATH.name,
+            run_report_path=root / RUN_REPORT_PATH.name,
+            ocr_report_path=root / OCR_REPORT_PATH.name,
+            plan_path=root / PLAN_PATH.name
+        )
+
+
+DEFAULT_WORKSPACE = Workspace()
@@ -0,0 +1,27 @@
+# Standard library imports
+import random
+
+# Third-party imports
+import pymupdf
+import pytest
+
+
+@pytest.fixture
+def make_png():
+    """
+    Factory for small grayscale slide PNGs.
+
+    make_png(width, height, boxes=[(x0, y0, x1, y1), ...], noise=False) returns a white
+    image with black boxes, or random noise that compresses badly (like a photo).
+    """
+    def make(width: int = 320, height: int = 240, boxes=(), noise: bool = False, seed: int = 0) -> bytes:
+        if noise:
+            samples = random.Random(seed).randbytes(width * height)
+            pix = pymupdf.Pixmap(pymupdf.csGRAY, width, height, samples, False)
+        else:
+            pix = pymupdf.Pixmap(pymupdf.csGRAY, pymupdf.IRect(0, 0, width, height), False)
+            pix.set_rect(pix.irect, (255,))
+            for box in boxes:
+                pix.set_rect(pymupdf.IRect(box), (0,))
+        return pix.tobytes("png")
+    return make
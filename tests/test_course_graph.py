@@ -0,0 +1,73 @@
+# Standard library imports
+import os
+
+# Third-party imports
+import numpy as np
+
+# Local application imports
+from src.pdf2mindmap.utils.course_graph import CourseGraph
+
+VOCABULARY = ["grundlagen", "sortieren", "suchen", "graphen"]
+
+
+def embed(labels: list[str]) -> np.ndarray:
+    """Deterministic embedding: one axis per vocabulary word, identical labels are identical vectors."""
+    vectors = np.zeros((len(labels), len(VOCABULARY)), dtype=np.float32)
+    for row, label in enumerate(labels):
+        vectors[row, VOCABULARY.index(label.lower())] = 1.0
+    return vectors
+
+
+def no_embed(labels: list[str]) -> np.ndarray:
+    raise AssertionError(f"embeddings of {labels} should have been loaded, not recomputed")
+
+
+def mindmap(*labels: str) -> dict:
+    nodes = [{"id": f"n{i}", "label": label} for i, label in enumerate(labels)]
+    edges = [{"from": "n0", "to": node["id"], "label": ""} for node in nodes[1:]]
+    return {"nodes": nodes, "edges": edges}
+
+
+def test_nodes_of_the_same_lecture_are_not_merged():
+    graph = CourseGraph(threshold=0.9, embed=embed)
+
+    stats = graph.add_lecture("lecture-01", mindmap("Grundlagen", "Sortieren", "sortieren"))
+    assert (stats.new_nodes, stats.merged_nodes) == (3, 0)
+
+    stats = graph.add_lecture("lecture-02", mindmap("Grundlagen", "Sortieren", "Graphen"))
+    assert (stats.new_nodes, stats.merged_nodes) == (1, 2)
+    assert graph.nodes[0]["lectures"] == ["lecture-01", "lecture-02"]
+    assert len(graph.nodes) == len(graph.index) == 4
+
+
+def test_save_and_load_round_trip(tmp_path):
+    graph = CourseGraph(embed=embed)
+    graph.add_lecture("lecture-01", mindmap("Grundlagen", "Suchen"))
+    graph.save(tmp_path / "graph.json", tmp_path / "embeddings.npy")
+
+    assert sorted(os.listdir(tmp_path)) == ["embeddings.npy", "graph.json"]
+    loaded = CourseGraph.load(tmp_path / "graph.json", tmp_path / "embeddings.npy",
+                              embed=no_embed)
+    assert loaded.nodes == graph.nodes
+    assert loaded.edges == graph.edges
+    np.testing.assert_array_equal(loaded.index.vectors, graph.index.vectors)
+
+
+def test_load_recomputes_missing_or_stale_embeddings(tmp_path):
+    graph = CourseGraph(embed=embed)
+    graph.add_lecture("lecture-01", mindmap("Grundlagen", "Suchen"))
+    graph.save(tmp_path / "graph.json", tmp_path / "embeddings.npy")
+
+    # Missing embeddings file
+    loaded = CourseGraph.load(tmp_path / "graph.json", tmp_path / "missing.npy", embed=embed)
+    np.testing.assert_array_equal(loaded.index.vectors, graph.index.vectors)
+
+    # Embeddings of an older graph version, e.g. after an interrupted save
+    np.save(tmp_path / "embeddings.npy", graph.index.vectors[:1])
+    loaded = CourseGraph.load(tmp_path / "graph.json", tmp_path / "embeddings.npy", embed=embed)
+    np.testing.assert_array_equal(loaded.index.vectors, graph.index.vectors)
+
+
+def test_load_without_graph_returns_empty_graph(tmp_path):
+    graph = CourseGraph.load(tmp_path / "graph.json", tmp_path / "embeddings.npy", embed=embed)
+    assert graph.nodes == [] and len(graph.index) == 0
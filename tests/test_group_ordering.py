@@ -0,0 +1,66 @@
+# Standard library imports
+import random
+
+# Third-party imports
+import pytest
+from langchain_core.messages import AIMessage
+
+# Local application imports
+from src.pdf2mindmap.utils.directory_reset import directory_reset
+from src.pdf2mindmap.utils.lecture_artifact import LectureArtifact
+from src.pdf2mindmap.utils.workspace import Workspace
+from src.pdf2mindmap.utils.constants import STAGE_MODELS
+
+
+class RecordingModel():
+    """Chat model stand-in that records every request."""
+    def __init__(self, content: str = "# Zusammenfassung") -> None:
+        self.content = content
+        self.requests = []
+
+    def invoke(self, messages):
+        self.requests.append(messages)
+        return AIMessage(content=self.content)
+
+
+def test_groups_are_read_in_group_id_order(tmp_path):
+    with LectureArtifact(tmp_path / "lecture.sqlite") as artifact:
+        for group_id in [3, 0, 2, 1]:
+            artifact.put_group(group_id, [group_id + 1], {}, [{"group": group_id}])
+
+        assert [group["group_id"] for group in artifact.groups()] == [0, 1, 2, 3]
+        assert artifact.groups()[2]["notes"] == [{"group": 2}]
+
+
+def test_summary_prompt_does_not_depend_on_completion_order(tmp_path, make_png):
+    pytest.importorskip("hdbscan")
+    pytest.importorskip("sentence_transformers")
+    from src.pdf2mindmap.main.lecture_agent import LectureAgent
+
+    prompts = []
+    for seed in range(3):
+        workspace = Workspace.at(tmp_path / str(seed))
+        directory_reset(workspace)
+        completion_order = list(range(6))
+        random.Random(seed).shuffle(completion_order)
+        with LectureArtifact(workspace.artifact_path) as artifact:
+            artifact.put_page(1, "page-01", "Folie", make_png())
+            for group_id in completion_order:
+                artifact.put_group(group_id, [group_id + 1], {}, [{"summary_bullets": [f"Gruppe {group_id}"]}])
+
+        model = RecordingModel()
+        agent = LectureAgent(models={stage: model for stage in STAGE_MODELS}, workspace=workspace)
+        agent.summarize()
+        agent.artifact.close()
+        prompts.append(model.requests[0])
+
+    assert prompts[0] == prompts[1] == prompts[2]
+    assert prompts[0][1]["content"][0]["text"].index("Gruppe 0") < prompts[0][1]["content"][0]["text"].index("Gruppe 5")
+
+
+def test_consecutive_cluster_labels_form_groups_in_page_order():
+    pytest.importorskip("hdbscan")
+    pytest.importorskip("sentence_transformers")
+    from src.pdf2mindmap.utils.page_grouper import PageGrouper
+
+    assert PageGrouper().chunk_to_dict([1, 1, 2, 2, 1]) == {0: [1, 2], 1: [3, 4], 2: [5]}
@@ -0,0 +1,49 @@
+# Standard library imports
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# Third-party imports
+import httpx
+
+# Local application imports
+from src.pdf2mindmap.utils.http_pool import PooledTransport
+
+
+class OkHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        self.send_response(200)
+        self.send_header("Content-Length", "2")
+        self.end_headers()
+        self.wfile.write(b"ok")
+
+    def log_message(self, *args):
+        pass
+
+
+def test_pool_counts_requests_and_opened_connections():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), OkHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    traced = []
+    try:
+        transport = PooledTransport()
+        with httpx.Client(transport=transport) as client:
+            url = f"http://127.0.0.1:{server.server_port}/"
+            for _ in range(3):
+                assert client.get(url, extensions={"trace": lambda name, info: traced.append(name)}).text == "ok"
+            stats = transport.stats()
+    finally:
+        server.shutdown()
+
+    assert stats["requests"] == 3
+    assert stats["http_versions"] == {"HTTP/1.1": 3}
+    assert stats["connections_opened"] == 1  # keep-alive connection is reused
+    assert "connection.connect_tcp.complete" in traced  # the caller's own trace still runs
+
+
+def test_stats_degrade_without_pool_internals():
+    transport = PooledTransport()
+    transport._pool = object()
+    stats = transport.stats()
+    assert stats["open_connections"] is None and stats["idle_connections"] is None
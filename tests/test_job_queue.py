@@ -0,0 +1,52 @@
+# Standard library imports
+import threading
+
+# Local application imports
+from src.pdf2mindmap.utils.job_queue import JobQueue
+
+PDF = b"%PDF-1.7 test"
+
+
+def finish(jobs: JobQueue, count: int) -> list:
+    """Submit count jobs and wait until all of them have finished."""
+    submitted = [jobs.submit(PDF) for _ in range(count)]
+    jobs.pending.join()
+    return submitted
+
+
+def test_finished_jobs_expire_with_their_workspace(tmp_path):
+    jobs = JobQueue(lambda job, progress: None, tmp_path, workers=1, max_queued=4, ttl=60.0, max_finished=10)
+    jobs.start()
+    job, = finish(jobs, 1)
+    job_dir = job.workspace.lecture_path.parent
+    assert job.status == "done" and job_dir.exists()
+
+    assert jobs.prune(now=job.finished_at + 59.0) == []
+    assert jobs.prune(now=job.finished_at + 60.0) == [job.id]
+    assert jobs.get(job.id) is None
+    assert not job_dir.exists()
+
+
+def test_only_the_newest_finished_jobs_are_kept(tmp_path):
+    jobs = JobQueue(lambda job, progress: None, tmp_path, workers=1, max_queued=4, ttl=3600.0, max_finished=2)
+    jobs.start()
+    submitted = finish(jobs, 3)
+    jobs.prune()
+
+    kept = [job for job in submitted if jobs.get(job.id) is not None]
+    assert kept == submitted[1:]
+    assert sorted(path.name for path in tmp_path.iterdir()) == sorted(job.id for job in kept)
+
+
+def test_running_jobs_are_never_pruned(tmp_path):
+    release = threading.Event()
+    jobs = JobQueue(lambda job, progress: release.wait(), tmp_path, workers=1, max_queued=4, ttl=0.0, max_finished=0)
+    jobs.start()
+    job = jobs.submit(PDF)
+
+    assert jobs.prune() == []
+    assert jobs.get(job.id) is job
+    release.set()
+    jobs.pending.join()
+    jobs.prune()
+    assert jobs.get(job.id) is None
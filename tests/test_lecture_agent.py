@@ -0,0 +1,59 @@
+# Third-party imports
+import pytest
+
+# Local application imports
+from src.pdf2mindmap.utils.directory_reset import directory_reset
+from src.pdf2mindmap.utils.lecture_artifact import LectureArtifact
+from src.pdf2mindmap.utils.workspace import Workspace
+from src.pdf2mindmap.utils.constants import STAGE_MODELS, GROUP_TEXT_STAGE, GROUP_MULTIMODAL_STAGE
+
+pytest.importorskip("hdbscan")
+pytest.importorskip("sentence_transformers")
+
+TEXT = "Sortierverfahren vergleichen Laufzeit und Speicherbedarf. " * 8
+
+
+def fake_agent(workspace: Workspace):
+    from src.pdf2mindmap.main.lecture_agent import LectureAgent
+    from src.pdf2mindmap.utils.fake_chat_model import FakeChatModel
+
+    fake = FakeChatModel(base_latency_s=0.0, latency_per_1k_tokens_s=0.0, latency_per_image_s=0.0)
+    return LectureAgent(models={stage: fake for stage in STAGE_MODELS}, workspace=workspace)
+
+
+def test_single_slide_usage_goes_to_the_report(tmp_path, make_png, capsys):
+    workspace = Workspace.at(tmp_path)
+    directory_reset(workspace)
+    with LectureArtifact(workspace.artifact_path) as artifact:
+        for number in range(1, 3):
+            artifact.put_page(number, f"page-0{number}", f"Folie {number} {TEXT}", make_png())
+
+    agent = fake_agent(workspace)
+    agent.single_slide_summary()
+    agent.artifact.close()
+
+    assert capsys.readouterr().out == ""
+    assert [(call.stage, call.images_sent) for call in agent.report.calls] == [(GROUP_MULTIMODAL_STAGE, 1)] * 2
+    assert all(call.input_tokens > 0 and call.output_tokens > 0 for call in agent.report.calls)
+
+
+def test_images_are_only_loaded_for_multimodal_groups(tmp_path, make_png):
+    workspace = Workspace.at(tmp_path)
+    directory_reset(workspace)
+    with LectureArtifact(workspace.artifact_path) as artifact:
+        artifact.put_page(1, "page-01", f"Einleitung {TEXT}", make_png(boxes=[(20, 20, 300, 40)]))
+        artifact.put_page(2, "page-02", f"Agenda {TEXT}", make_png(boxes=[(20, 20, 300, 60)]))
+        artifact.put_page(3, "page-03", "Diagramm", make_png(noise=True))
+
+    agent = fake_agent(workspace)
+    loaded = []
+    images = agent.artifact.images
+    agent.artifact.images = lambda pages: loaded.append(pages) or images(pages)
+    text_group = agent._summarize_group(0, [2, 1], {}, {"page-01": (1, 100), "page-02": (1, 100)})
+    visual_group = agent._summarize_group(1, [3], {}, {"page-03": (1, 100)})
+    agent.artifact.close()
+
+    assert loaded == [[3]]
+    assert text_group["notes"] and visual_group["notes"]
+    assert [(call.stage, call.images_sent, call.saved_image_tokens) for call in agent.report.calls] == \
+        [(GROUP_TEXT_STAGE, 0, 200), (GROUP_MULTIMODAL_STAGE, 1, 0)]
@@ -0,0 +1,127 @@
+# Standard library imports
+import json
+import sqlite3
+import threading
+
+# Third-party imports
+import numpy as np
+import pytest
+
+# Local application imports
+from src.pdf2mindmap.utils.directory_reset import directory_reset
+from src.pdf2mindmap.utils.lecture_artifact import LectureArtifact, LAYOUT_OUTPUT, NODES_EDGES_OUTPUT
+from src.pdf2mindmap.utils.workspace import Workspace
+
+MINDMAP = {
+    "nodes": [{"id": "root", "label": "Sortieren"}, {"id": "a", "label": "Quicksort"}],
+    "edges": [{"from": "root", "to": "a", "label": ""}]
+}
+
+
+def write_pages(artifact: LectureArtifact, make_png, count: int) -> list[bytes]:
+    pngs = [make_png(boxes=[(10 * page, 10, 10 * page + 20, 40)]) for page in range(1, count + 1)]
+    for page, png in enumerate(pngs, start=1):
+        artifact.put_page(page, f"page-{page:02d}", png=png)
+        artifact.put_page(page, f"page-{page:02d}", markdown=f"# Slide {page}\n")
+    artifact.commit()
+    return pngs
+
+
+def test_round_trip(tmp_path, make_png):
+    path = tmp_path / "lecture.sqlite"
+    with LectureArtifact(path) as artifact:
+        pngs = write_pages(artifact, make_png, 3)
+        artifact.put_embeddings(np.eye(3))
+        artifact.put_group(0, [1, 2], {"page-02": "page-01"}, [{"title": "Sortieren"}])
+        artifact.put_mindmap(json.dumps(MINDMAP))
+
+    with LectureArtifact(path, read_only=True) as artifact:
+        assert artifact.page_count() == 3
+        assert artifact.page(2) == ("page-02", "# Slide 2\n", pngs[1])
+        assert artifact.pages([3, 1]) == [("page-01", "# Slide 1\n", pngs[0]), ("page-03", "# Slide 3\n", pngs[2])]
+        assert artifact.markdowns() == {1: "# Slide 1\n", 2: "# Slide 2\n", 3: "# Slide 3\n"}
+        assert artifact.page_sizes([2]) == [("page-02", "# Slide 2\n", len(pngs[1]), 320, 240)]
+        assert artifact.images([3, 2]) == [pngs[1], pngs[2]]
+        np.testing.assert_array_equal(artifact.embeddings(), np.eye(3, dtype=np.float32))
+        assert artifact.groups() == [{"group_id": 0, "pages": [1, 2], "collapsed": {"page-02": "page-01"},
+                                      "notes": [{"title": "Sortieren"}]}]
+        data, layout = artifact.mindmap()
+        assert data == MINDMAP
+        assert set(layout["positions"]) == {"root", "a"}
+
+
+def test_missing_pages_raise(tmp_path, make_png):
+    with LectureArtifact(tmp_path / "lecture.sqlite") as artifact:
+        with pytest.raises(RuntimeError, match="contains no pages"):
+            artifact.pages()
+
+        write_pages(artifact, make_png, 2)
+        with pytest.raises(RuntimeError, match=r"missing pages \[4, 5\]"):
+            artifact.pages([1, 4, 5])
+        with pytest.raises(RuntimeError, match="contains no pages"):
+            artifact.page(7)
+
+        # A page whose image was never rendered
+        artifact.put_page(3, "page-03", markdown="# Slide 3\n")
+        with pytest.raises(RuntimeError, match="no markdown or image for page-03"):
+            artifact.page(3)
+
+
+def test_read_only_artifact_never_writes(tmp_path):
+    path = tmp_path / "lecture.sqlite"
+    with LectureArtifact(path) as artifact:
+        artifact.put_output(NODES_EDGES_OUTPUT, json.dumps(MINDMAP))
+
+    with LectureArtifact(path, read_only=True) as artifact:
+        # The stale layout is computed in memory only
+        data, layout = artifact.mindmap()
+        assert data == MINDMAP and "root" in layout["positions"]
+        assert artifact.output(LAYOUT_OUTPUT) is None
+        with pytest.raises(sqlite3.OperationalError, match="readonly"):
+            artifact.put_output("summary", "# Summary")
+
+    with pytest.raises(sqlite3.OperationalError):
+        LectureArtifact(tmp_path / "missing.sqlite", read_only=True)
+
+
+def test_concurrent_put_group_with_a_reader(tmp_path, make_png):
+    path = tmp_path / "lecture.sqlite"
+    writer = LectureArtifact(path)
+    write_pages(writer, make_png, 4)
+    reader = LectureArtifact(path, read_only=True)
+
+    errors = []
+
+    def put_groups(first: int) -> None:
+        try:
+            for group in range(first, first + 25):
+                writer.put_group(group, [group % 4 + 1], {}, [{"title": f"Group {group}"}])
+                # The reader sees committed groups and is never locked out by the writer
+                assert len(reader.groups()) >= 1
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=put_groups, args=(first,)) for first in range(0, 100, 25)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+    assert [group["group_id"] for group in reader.groups()] == list(range(100))
+    assert reader.groups()[42]["notes"] == [{"title": "Group 42"}]
+    reader.close()
+    writer.close()
+
+
+def test_directory_reset_removes_the_wal_files(tmp_path):
+    workspace = Workspace.at(tmp_path)
+    artifact = LectureArtifact(workspace.artifact_path)
+    artifact.put_output("summary", "# Summary")
+    suffixes = ("", "-wal", "-shm")
+    assert all(workspace.artifact_path.with_name(workspace.artifact_path.name + s).exists() for s in suffixes)
+
+    # Reset while a connection still holds the WAL, e.g. after a crashed run
+    directory_reset(workspace)
+    assert list(tmp_path.iterdir()) == []
+    artifact.close()
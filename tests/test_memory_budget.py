@@ -0,0 +1,55 @@
+# Standard library imports
+import re
+import subprocess
+import sys
+import threading
+from pathlib import Path
+
+# Local application imports
+from src.pdf2mindmap.utils.memory_budget import MemoryMonitor, NullMemoryMonitor, create_memory_monitor
+
+BUDGET_MB = 400
+# Enough synthetic scans that the eager conversion, whose RSS grows by several MiB per page, exceeds BUDGET_MB
+PAGES = 90
+PACKAGE_ROOT = Path(__file__).resolve().parents[1]
+
+
+def start_conversion(*args: str) -> subprocess.Popen:
+    """
+    Convert a synthetic scan with memory_budget's main in a fresh process.
+
+    The budget is process RSS, so the conversion must not share a process with pytest.
+    main writes the scan with write_synthetic_scan, converts it with PdfConverter inside
+    a MemoryMonitor stage, prints the peak and fails if it exceeds the budget.
+    """
+    return subprocess.Popen(
+        [sys.executable, "-m", "src.pdf2mindmap.utils.memory_budget",
+         "--pages", str(PAGES), "--budget", str(BUDGET_MB), *args],
+        cwd=PACKAGE_ROOT, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True
+    )
+
+
+def peak_rss_mb(output: str) -> int:
+    return int(re.search(r"convert: peak (\d+) MiB", output).group(1))
+
+
+def test_large_scan_converts_within_budget_only_when_streaming():
+    streaming, eager = start_conversion(), start_conversion("--eager")
+    streaming_output, _ = streaming.communicate(timeout=900)
+    eager_output, _ = eager.communicate(timeout=900)
+
+    assert streaming.returncode == 0, streaming_output
+    assert peak_rss_mb(streaming_output) <= BUDGET_MB
+    # The same PDF converted without the streaming mode does not fit into the budget
+    assert eager.returncode != 0, eager_output
+    assert peak_rss_mb(eager_output) > BUDGET_MB
+
+
+def test_no_budget_means_no_measurement():
+    monitor = create_memory_monitor(None)
+    threads = threading.active_count()
+    with monitor.stage("convert"):
+        assert threading.active_count() == threads
+    assert isinstance(monitor, NullMemoryMonitor)
+    assert monitor.summary() == {}
+    assert isinstance(create_memory_monitor(BUDGET_MB), MemoryMonitor)
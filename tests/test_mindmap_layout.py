@@ -0,0 +1,76 @@
+# Standard library imports
+import json
+
+# Local application imports
+from src.pdf2mindmap.utils.mindmap_layout import (
+    compute_layout,
+    visible_subgraph,
+    write_layout,
+    load_mindmap,
+    LEVEL_SPACING,
+    SIBLING_SPACING
+)
+
+MINDMAP = {
+    "nodes": [{"id": node_id, "label": node_id.upper()} for node_id in ["root", "a", "b", "a1", "a2", "b1", "x"]],
+    "edges": [
+        {"from": "root", "to": "a"}, {"from": "root", "to": "b"},
+        {"from": "a", "to": "a1"}, {"from": "a", "to": "a2"},
+        {"from": "b", "to": "b1"},
+        {"from": "a1", "to": "a1"},  # self loop is ignored
+        {"from": "a2", "to": "missing"},  # edge to an unknown node is ignored
+    ]
+}
+
+
+def test_layout_is_a_left_to_right_tree():
+    layout = compute_layout(MINDMAP)
+
+    assert layout["roots"] == ["root", "x"]
+    assert layout["children"]["root"] == ["a", "b"]
+    assert layout["parent"]["a2"] == "a"
+    assert layout["depth"] == {"root": 0, "a": 1, "b": 1, "a1": 2, "a2": 2, "b1": 2, "x": 0}
+
+    positions = layout["positions"]
+    # Leaves are stacked in rows, parents are centered on their children
+    assert [positions[leaf][1] for leaf in ["a1", "a2", "b1", "x"]] == [0, SIBLING_SPACING, 2 * SIBLING_SPACING, 3 * SIBLING_SPACING]
+    assert positions["a"] == [LEVEL_SPACING, SIBLING_SPACING / 2]
+    assert positions["root"][1] == (positions["a"][1] + positions["b"][1]) / 2
+
+
+def test_cycles_fall_back_to_the_first_node_as_root():
+    layout = compute_layout({"nodes": [{"id": "p", "label": "P"}, {"id": "q", "label": "Q"}],
+                             "edges": [{"from": "p", "to": "q"}, {"from": "q", "to": "p"}]})
+
+    assert layout["roots"] == ["p"]
+    assert layout["depth"] == {"p": 0, "q": 1}
+
+
+def test_collapsed_view_only_contains_visible_branches():
+    layout = compute_layout(MINDMAP)
+
+    nodes, edges = visible_subgraph(MINDMAP, layout, set(), depth=0)
+    assert [node["id"] for node in nodes] == ["root", "x"]
+    assert edges == []
+
+    nodes, edges = visible_subgraph(MINDMAP, layout, set(), depth=1)
+    assert [node["id"] for node in nodes] == ["root", "a", "b", "x"]
+
+    nodes, edges = visible_subgraph(MINDMAP, layout, {"a"}, depth=1)
+    assert [node["id"] for node in nodes] == ["root", "a", "b", "a1", "a2", "x"]
+    assert {"from": "b", "to": "b1"} not in edges
+    assert {"from": "a", "to": "a2"} in edges
+
+
+def test_stale_layout_is_recomputed(tmp_path):
+    nodes_edges_path = tmp_path / "nodes_edges.json"
+    layout_path = tmp_path / "layout.json"
+    nodes_edges_path.write_text(json.dumps(MINDMAP), encoding="utf-8")
+    write_layout(nodes_edges_path, layout_path)
+
+    changed = {"nodes": MINDMAP["nodes"][:2], "edges": MINDMAP["edges"][:1]}
+    nodes_edges_path.write_text(json.dumps(changed), encoding="utf-8")
+    data, layout = load_mindmap(nodes_edges_path, layout_path)
+
+    assert data == changed
+    assert set(layout["positions"]) == {"root", "a"}
@@ -0,0 +1,113 @@
+# Standard library imports
+import gzip
+import json
+
+# Third-party imports
+import httpx
+import pytest
+
+# Local application imports
+from src.pdf2mindmap.utils.http_pool import PooledTransport
+from src.pdf2mindmap.utils.mock_llm_server import MockLLMServer, MockServerConfig
+from src.pdf2mindmap.utils.directory_reset import directory_reset
+from src.pdf2mindmap.utils.lecture_artifact import LectureArtifact
+from src.pdf2mindmap.utils.workspace import Workspace
+from src.pdf2mindmap.utils.prompts import SUMMARY_PROMPT
+from src.pdf2mindmap.utils.constants import SUMMARY_STAGE, MINDMAP_STAGE
+
+TEXT = "Sortierverfahren vergleichen Laufzeit und Speicherbedarf. " * 8
+REQUEST = {
+    "model": "mock",
+    "messages": [
+        {"role": "system", "content": SUMMARY_PROMPT},
+        {"role": "user", "content": [{"type": "text", "text": TEXT}]}
+    ]
+}
+
+
+@pytest.fixture
+def mock_server():
+    """Start a mock server without latency, yield a factory taking MockServerConfig fields."""
+    servers = []
+
+    def start(**config) -> MockLLMServer:
+        config = MockServerConfig(**{"latency_median_s": 0.0, "latency_per_image_s": 0.0, **config})
+        servers.append(MockLLMServer(config, port=0).start())
+        return servers[-1]
+
+    yield start
+    for server in servers:
+        server.stop()
+
+
+def post(server: MockLLMServer, client: httpx.Client | None = None, **kwargs) -> httpx.Response:
+    client = client or httpx.Client()
+    kwargs.setdefault("json", REQUEST)
+    return client.post(f"{server.base_url}/chat/completions", **kwargs)
+
+
+def test_usage_reports_cached_prefix_tokens(mock_server):
+    server = mock_server(cache_min_prefix_tokens=1)
+
+    first = post(server).json()
+    second = post(server).json()
+
+    assert first["usage"]["prompt_tokens"] > 0 and first["usage"]["completion_tokens"] > 0
+    assert first["usage"]["prompt_tokens_details"]["cached_tokens"] == 0
+    assert 0 < second["usage"]["prompt_tokens_details"]["cached_tokens"] < second["usage"]["prompt_tokens"]
+    assert first["choices"][0]["message"]["content"].startswith("# ")
+
+
+def test_injected_errors_and_rate_limit(mock_server):
+    failing = mock_server(error_rate=1.0)
+    assert post(failing).status_code == 500
+
+    limited = mock_server(rate_limit_rpm=2)
+    assert [post(limited).status_code for _ in range(3)] == [200, 200, 429]
+    assert post(limited).headers["Retry-After"] == "1"
+
+
+def test_gzip_request_bodies(mock_server):
+    server = mock_server()
+    body = gzip.compress(json.dumps(REQUEST).encode("utf-8"))
+    response = post(server, content=body, json=None,
+                    headers={"Content-Encoding": "gzip", "Content-Type": "application/json"})
+    assert response.status_code == 200
+
+    # The pooled transport compresses large bodies itself
+    transport = PooledTransport(compress=True, compress_min_bytes=0)
+    with httpx.Client(transport=transport) as client:
+        assert post(server, client).status_code == 200
+    assert transport.stats()["compressed_bytes_saved"] > 0
+
+
+def test_lecture_agent_runs_against_the_mock_server(tmp_path, make_png, mock_server):
+    pytest.importorskip("hdbscan")
+    pytest.importorskip("sentence_transformers")
+    from src.pdf2mindmap.main.lecture_agent import LectureAgent
+
+    server = mock_server(cache_min_prefix_tokens=1)
+    workspace = Workspace.at(tmp_path)
+    directory_reset(workspace)
+    with LectureArtifact(workspace.artifact_path) as artifact:
+        for number in range(1, 7):
+            artifact.put_page(number, f"page-0{number}", f"Folie {number} {TEXT}",
+                              make_png(boxes=[(20, 20, 300, 20 + 10 * number)]))
+
+    reports = []
+    for _ in range(2):
+        agent = LectureAgent(base_url=server.base_url, workspace=workspace, group_concurrency=1)
+        agent.run()
+        reports.append(agent.report)
+
+    first, second = (report.summary() for report in reports)
+    assert first["stages"][SUMMARY_STAGE]["calls"] == first["stages"][MINDMAP_STAGE]["calls"] == 1
+    assert first["totals"]["calls"] == len(reports[0].calls) == second["totals"]["calls"]
+    assert all(call.input_tokens > 0 and call.output_tokens > 0 for call in reports[0].calls)
+    # Every prefix is new in the first run but was seen by the server before the second
+    assert reports[0].calls[0].cached_tokens == 0
+    assert all(call.cached_tokens > 0 for call in reports[1].calls)
+    assert second["totals"]["cached_ratio"] > first["totals"]["cached_ratio"]
+    assert workspace.nodes_edges_path.exists() and workspace.summary_path.exists()
+    # The mock server only speaks HTTP/1.1
+    assert set(reports[1].http_pool["http_versions"]) == {"HTTP/1.1"}
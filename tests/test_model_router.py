@@ -0,0 +1,84 @@
+# Third-party imports
+import pytest
+
+# Local application imports
+from src.pdf2mindmap.utils.model_router import ModelRouter, is_openai_model
+from src.pdf2mindmap.utils.constants import GROUP_TEXT_STAGE, GROUP_MULTIMODAL_STAGE
+
+LONG_TEXT = "Ein Absatz mit ausreichend extrahiertem Text. " * 10
+
+
+def test_text_slides_go_to_text_model(make_png):
+    router = ModelRouter(min_text_chars=200, max_png_density=0.2)
+    pages = [("page-01", LONG_TEXT, make_png(boxes=[(20, 20, 300, 40)])),
+             ("page-02", LONG_TEXT, make_png())]
+
+    decision = router.route(pages)
+
+    assert decision.stage == GROUP_TEXT_STAGE
+    assert decision.visual_pages == []
+
+
+def test_little_text_routes_group_to_multimodal_model(make_png):
+    router = ModelRouter(min_text_chars=200, max_png_density=0.2)
+    pages = [("page-01", LONG_TEXT, make_png()), ("page-02", "Diagramm", make_png())]
+
+    decision = router.route(pages)
+
+    assert decision.stage == GROUP_MULTIMODAL_STAGE
+    assert decision.visual_pages == ["page-02"]
+
+
+def test_dense_png_routes_group_to_multimodal_model(make_png):
+    router = ModelRouter(min_text_chars=200, max_png_density=0.2)
+    photo = make_png(noise=True)
+    assert router.png_density(photo) > 0.2
+    assert router.png_density(make_png()) < 0.2
+
+    decision = router.route([("page-01", LONG_TEXT, make_png()), ("page-02", LONG_TEXT, photo)])
+
+    assert decision.stage == GROUP_MULTIMODAL_STAGE
+    assert decision.visual_pages == ["page-02"]
+
+
+def test_routing_by_png_size_matches_routing_by_png(make_png):
+    router = ModelRouter(min_text_chars=200, max_png_density=0.2)
+    for pages in ([("page-01", LONG_TEXT, make_png())],
+                  [("page-01", LONG_TEXT, make_png()), ("page-02", LONG_TEXT, make_png(noise=True))]):
+        sizes = [(slide_id, md_text, len(png), 320, 240) for slide_id, md_text, png in pages]
+        assert router.route_sizes(sizes) == router.route(pages)
+
+
+def test_thresholds_are_configurable(make_png):
+    photo = make_png(noise=True)
+    assert not ModelRouter(min_text_chars=5, max_png_density=10.0).is_visual_page("Diagramm", photo)
+    assert ModelRouter(min_text_chars=50, max_png_density=10.0).is_visual_page("Diagramm", photo)
+
+
+def test_disabled_router_always_sends_images(make_png):
+    decision = ModelRouter(enabled=False).route([("page-01", LONG_TEXT, make_png())])
+
+    assert decision.stage == GROUP_MULTIMODAL_STAGE
+
+
+def test_only_openai_models_are_detected_as_openai():
+    assert is_openai_model("gpt-4.1-mini-2025-04-14")
+    assert is_openai_model("openai:my-finetune")
+    assert is_openai_model("o3-mini")
+    assert not is_openai_model("claude-sonnet-4-5")
+    assert not is_openai_model("anthropic:claude-sonnet-4-5")
+    assert not is_openai_model("mistral-large-latest")
+
+
+def test_shared_http_client_is_only_passed_to_openai_models(monkeypatch):
+    pytest.importorskip("hdbscan")
+    pytest.importorskip("sentence_transformers")
+    from src.pdf2mindmap.main import lecture_agent
+
+    calls = {}
+    monkeypatch.setattr(lecture_agent, "init_chat_model", lambda name, **kwargs: calls.setdefault(name, kwargs))
+    monkeypatch.setenv("PDF2MINDMAP_SUMMARY_MODEL", "claude-sonnet-4-5")
+    lecture_agent.init_stage_models()
+
+    assert "http_client" not in calls["claude-sonnet-4-5"]
+    assert all("http_client" in kwargs for name, kwargs in calls.items() if name.startswith("gpt-"))
@@ -0,0 +1,45 @@
+# Third-party imports
+import pymupdf
+import pytest
+
+# Local application imports
+from src.pdf2mindmap.utils.ocr import OcrStage, page_image_hash
+from src.pdf2mindmap.utils.constants import OCR_WORKER_MEMORY_MB
+
+
+def tesseract_available() -> bool:
+    try:
+        pymupdf.get_tessdata()
+        return True
+    except RuntimeError:
+        return False
+
+
+def test_memory_budget_limits_ocr_processes(tmp_path, monkeypatch):
+    monkeypatch.setattr("src.pdf2mindmap.utils.ocr.current_rss_mb", lambda: 100.0)
+
+    assert OcrStage(tmp_path / "scan.pdf", workers=8).worker_count(pages=3) == 3
+    assert OcrStage(tmp_path / "scan.pdf", workers=8,
+                    memory_budget_mb=100 + 2.5 * OCR_WORKER_MEMORY_MB).worker_count(pages=20) == 2
+    # Not even one process fits: OCR runs in-process
+    assert OcrStage(tmp_path / "scan.pdf", workers=8, memory_budget_mb=150).worker_count(pages=20) == 0
+
+
+@pytest.mark.skipif(not tesseract_available(), reason="Tesseract is not installed")
+@pytest.mark.parametrize("memory_budget_mb", [None, 1])
+def test_rendered_text_image_is_ocred(tmp_path, memory_budget_mb):
+    # Render a line of text into an image and store it as a scanned page without a text layer
+    source = pymupdf.open()
+    source.new_page(width=600, height=200).insert_text((40, 110), "Sorting Algorithms", fontsize=40)
+    image = source[0].get_pixmap(dpi=200).tobytes("png")
+    scan = pymupdf.open()
+    scan.new_page(width=600, height=200).insert_image(pymupdf.Rect(0, 0, 600, 200), stream=image)
+    scan.save(tmp_path / "scan.pdf")
+    assert scan[0].get_text().strip() == ""
+
+    stage = OcrStage(tmp_path / "scan.pdf", cache_dir=tmp_path / "cache", language="eng",
+                     memory_budget_mb=memory_budget_mb)
+    texts = stage.run({0: page_image_hash(scan[0], 72)})
+
+    assert "Sorting" in texts[0] and "Algorithms" in texts[0]
+    assert stage.summary()["cache_hits"] == 0
@@ -0,0 +1,32 @@
+# Third-party imports
+from langchain_core.messages import AIMessage
+
+# Local application imports
+from src.pdf2mindmap.utils.prompt_builder import PromptBuilder, PREFIXES
+from src.pdf2mindmap.utils.run_report import RunReport
+from src.pdf2mindmap.utils.constants import GROUP_MULTIMODAL_STAGE, SUMMARY_STAGE
+
+
+def test_system_prefix_is_identical_across_requests():
+    builder = PromptBuilder()
+
+    first = builder.build(GROUP_MULTIMODAL_STAGE, "SLIDE_ID: page-01", ["data:image/png;base64,AA"], "low")
+    second = builder.build(GROUP_MULTIMODAL_STAGE, "SLIDE_ID: page-02")
+
+    assert first[0] == second[0] == {"role": "system", "content": PREFIXES[GROUP_MULTIMODAL_STAGE]}
+    assert first[1]["content"][1]["image_url"] == {"url": "data:image/png;base64,AA", "detail": "low"}
+
+
+def test_short_prefixes_are_not_cacheable():
+    assert not PromptBuilder().cacheable(SUMMARY_STAGE)
+    assert PromptBuilder({SUMMARY_STAGE: "word " * 5000}).cacheable(SUMMARY_STAGE)
+
+
+def test_report_shows_no_cache_ratio_for_uncacheable_prefixes():
+    response = AIMessage(content="", usage_metadata={"input_tokens": 100, "output_tokens": 10, "total_tokens": 110})
+    report = RunReport()
+    report.record(SUMMARY_STAGE, "model", response, 1.0, prefix_cacheable=False)
+    assert report.summary()["totals"]["cached_ratio"] is None
+
+    report.record(SUMMARY_STAGE, "model", response, 1.0, prefix_cacheable=True)
+    assert report.summary()["totals"]["cached_ratio"] == 0.0
@@ -0,0 +1,95 @@
+# Standard library imports
+import json
+import sys
+
+# Third-party imports
+import pymupdf
+import pytest
+
+# Local application imports
+from src.pdf2mindmap.utils.directory_reset import directory_reset
+from src.pdf2mindmap.utils.lecture_artifact import LectureArtifact, SUMMARY_OUTPUT
+from src.pdf2mindmap.utils.token_estimates import estimate_png_tokens
+from src.pdf2mindmap.utils.workspace import Workspace, DEFAULT_WORKSPACE
+from src.pdf2mindmap.utils.constants import (
+    STAGE_MODELS,
+    LECTURE_PATH,
+    GROUP_TEXT_STAGE,
+    GROUP_MULTIMODAL_STAGE
+)
+
+pytest.importorskip("hdbscan")
+pytest.importorskip("sentence_transformers")
+
+TEXT = "Sortierverfahren vergleichen Laufzeit und Speicherbedarf. " * 8
+
+
+def write_fixture_artifact(workspace: Workspace, make_png) -> bytes:
+    """Text slides, a build-up sequence and image-only slides; returns the PNG of the image slides."""
+    diagram = make_png(noise=True)
+    pages = [
+        ("Einleitung " + TEXT, make_png(boxes=[(20, 20, 300, 40)])),
+        ("Agenda " + TEXT, make_png(boxes=[(20, 20, 300, 60)])),
+        ("Quicksort\nPivot waehlen", make_png(boxes=[(20, 20, 300, 40), (40, 80, 280, 100)])),
+        ("Quicksort\nPivot waehlen\nPartitionieren", make_png(boxes=[(20, 20, 300, 40), (40, 80, 280, 100), (40, 120, 280, 140)])),
+        ("Diagramm", diagram),
+        ("", make_png(noise=True, seed=1)),
+    ]
+    directory_reset(workspace)
+    with LectureArtifact(workspace.artifact_path) as artifact:
+        for number, (text, png) in enumerate(pages, start=1):
+            artifact.put_page(number, f"page-0{number}", text, png)
+    return diagram
+
+
+def test_planned_input_tokens_match_the_agent_requests(tmp_path, make_png):
+    from src.pdf2mindmap.main.lecture_agent import LectureAgent
+    from src.pdf2mindmap.utils.fake_chat_model import FakeChatModel
+    from src.pdf2mindmap.utils.run_planner import RunPlanner
+
+    workspace = Workspace.at(tmp_path)
+    diagram = write_fixture_artifact(workspace, make_png)
+
+    plan = RunPlanner(workspace, concurrency=1, image_detail="high").plan()
+
+    # The fake model bills every image at a flat rate: the estimate for the fixture slides
+    fake = FakeChatModel(base_latency_s=0.0, latency_per_1k_tokens_s=0.0, latency_per_image_s=0.0,
+                         image_tokens=estimate_png_tokens(diagram, "high"))
+    agent = LectureAgent(models={stage: fake for stage in STAGE_MODELS}, workspace=workspace,
+                         group_concurrency=1, image_detail="high")
+    agent.run()
+
+    group_calls = [call for call in agent.report.calls if call.stage in (GROUP_TEXT_STAGE, GROUP_MULTIMODAL_STAGE)]
+    assert [(group["stage"], group["images"]) for group in plan["groups"]] == \
+        [(call.stage, call.images_sent) for call in group_calls]
+    assert [group["input_tokens"] for group in plan["groups"]] == [call.input_tokens for call in group_calls]
+
+
+def test_plan_keeps_previous_outputs_and_calls_no_model(tmp_path, monkeypatch):
+    from src.pdf2mindmap.main import __main__ as cli
+    from src.pdf2mindmap.main import lecture_agent
+
+    # Relative resource paths resolve below tmp_path
+    monkeypatch.chdir(tmp_path)
+    directory_reset(DEFAULT_WORKSPACE)
+    doc = pymupdf.open()
+    for number in range(3):
+        doc.new_page().insert_text((72, 72), f"Folie {number}: {TEXT}", fontsize=11)
+    doc.save(LECTURE_PATH)
+    DEFAULT_WORKSPACE.summary_path.write_text("# Vorherige Zusammenfassung", encoding="utf-8")
+    with LectureArtifact(DEFAULT_WORKSPACE.artifact_path) as artifact:
+        artifact.put_output(SUMMARY_OUTPUT, "# Vorherige Zusammenfassung")
+    previous_artifact = DEFAULT_WORKSPACE.artifact_path.read_bytes()
+
+    def no_model(*args, **kwargs):
+        raise AssertionError("--plan must not create or call any model")
+
+    monkeypatch.setattr(lecture_agent, "init_chat_model", no_model)
+    monkeypatch.setattr(cli, "LectureAgent", no_model)
+    monkeypatch.setattr(sys, "argv", ["summarize", "--plan"])
+    cli.main()
+
+    assert DEFAULT_WORKSPACE.summary_path.read_text(encoding="utf-8") == "# Vorherige Zusammenfassung"
+    assert DEFAULT_WORKSPACE.artifact_path.read_bytes() == previous_artifact
+    plan = json.loads(DEFAULT_WORKSPACE.plan_path.read_text(encoding="utf-8"))
+    assert sum(group["pages"] for group in plan["groups"]) <= 3 and plan["totals"]["calls"] >= 3
@@ -0,0 +1,127 @@
+# Third-party imports
+import pytest
+from langchain_core.messages import AIMessage
+
+# Local application imports
+from src.pdf2mindmap.utils import image_hash
+from src.pdf2mindmap.utils.directory_reset import directory_reset
+from src.pdf2mindmap.utils.lecture_artifact import LectureArtifact
+from src.pdf2mindmap.utils.workspace import Workspace
+from src.pdf2mindmap.utils.constants import STAGE_MODELS
+from src.pdf2mindmap.utils.slide_dedup import (
+    SlideDeduplicator,
+    SlideSignature,
+    collapse_lecture,
+    image_dhash,
+    text_shingles
+)
+
+TITLE_BOX = (20, 20, 300, 50)
+BULLET_BOXES = [(40, 80 + 40 * row, 280, 100 + 40 * row) for row in range(4)]
+BULLETS = ["Erster Punkt der Folie", "Zweiter Punkt der Folie", "Dritter Punkt der Folie", "Vierter Punkt der Folie"]
+
+
+def build_up_frame(make_png, steps: int) -> tuple[str, bytes]:
+    """Frame of an animated slide that shows the title and the first steps bullets."""
+    text = "Sortierverfahren im Vergleich\n" + "\n".join(BULLETS[:steps])
+    return text, make_png(boxes=[TITLE_BOX, *BULLET_BOXES[:steps]])
+
+
+def signature(slide_id: str, text: str, png: bytes) -> SlideSignature:
+    return SlideSignature(slide_id, image_dhash(png), text_shingles(text))
+
+
+def test_build_up_step_is_detected(make_png):
+    deduplicator = SlideDeduplicator()
+    earlier = signature("page-01", *build_up_frame(make_png, 3))
+    later = signature("page-02", *build_up_frame(make_png, 4))
+
+    assert deduplicator.is_build_up(earlier, later)
+    # The final frame is not a build-up step of an earlier one
+    assert not deduplicator.is_build_up(later, earlier)
+
+
+def test_different_slides_are_neither_build_up_nor_repeat(make_png):
+    deduplicator = SlideDeduplicator()
+    slide = signature("page-01", *build_up_frame(make_png, 4))
+    photo = signature("page-02", "Graphen und Baeume", make_png(noise=True))
+
+    assert not deduplicator.is_build_up(slide, photo)
+    assert not deduplicator.is_repeat(slide, photo)
+
+
+def test_repeat_needs_identical_image_and_text(make_png):
+    deduplicator = SlideDeduplicator()
+    text, png = build_up_frame(make_png, 4)
+    first = signature("page-01", text, png)
+
+    assert deduplicator.is_repeat(first, signature("page-09", text, png))
+    assert not deduplicator.is_repeat(first, signature("page-09", "Ganz anderer Inhalt der Folie", png))
+
+
+def test_collapse_keeps_the_final_frame_and_streams_pages(make_png):
+    frames = [("page-0%d" % steps, *build_up_frame(make_png, steps)) for steps in range(1, 5)]
+    other = ("page-05", "Graphen und Baeume", make_png(noise=True))
+
+    collapsed = SlideDeduplicator().collapse(iter(frames + [other]))
+
+    assert collapsed == {"page-01": "page-04", "page-02": "page-04", "page-03": "page-04"}
+    assert SlideDeduplicator(enabled=False).collapse(iter(frames)) == {}
+
+
+def test_lecture_is_collapsed_from_stored_hashes_without_pymupdf(tmp_path, make_png, monkeypatch):
+    workspace = Workspace.at(tmp_path)
+    directory_reset(workspace)
+    with LectureArtifact(workspace.artifact_path) as artifact:
+        for number in range(1, 5):
+            text, png = build_up_frame(make_png, number)
+            artifact.put_page(number, f"page-0{number}", text, png)
+        stored = artifact.page_hashes([4])
+    assert stored[0][2] == image_dhash(build_up_frame(make_png, 4)[1])
+
+    # The LLM stage runs outside the service's conversion lock: PyMuPDF must not be used there
+    def no_pymupdf(*args, **kwargs):
+        raise AssertionError("PyMuPDF is not thread-safe and only used during the conversion")
+
+    monkeypatch.setattr(image_hash.pymupdf, "Pixmap", no_pymupdf)
+    with LectureArtifact(workspace.artifact_path) as artifact:
+        collapsed, slide_tokens = collapse_lecture(artifact, SlideDeduplicator(), "high")
+
+    assert collapsed == {"page-01": "page-04", "page-02": "page-04", "page-03": "page-04"}
+    assert set(slide_tokens) == {"page-01", "page-02", "page-03", "page-04"}
+
+
+def test_build_up_across_group_boundary_is_collapsed(tmp_path, make_png, monkeypatch):
+    pytest.importorskip("hdbscan")
+    pytest.importorskip("sentence_transformers")
+    from src.pdf2mindmap.main.lecture_agent import LectureAgent
+
+    workspace = Workspace.at(tmp_path)
+    directory_reset(workspace)
+    with LectureArtifact(workspace.artifact_path) as artifact:
+        for number in range(1, 5):
+            text, png = build_up_frame(make_png, number)
+            artifact.put_page(number, f"page-0{number}", text, png)
+        artifact.put_page(5, "page-05", "Graphen und Baeume " * 40, make_png(boxes=[TITLE_BOX]))
+    monkeypatch.setattr(image_hash.pymupdf, "Pixmap", None)
+
+    requests = []
+
+    class Model():
+        def invoke(self, messages):
+            requests.append(messages)
+            return AIMessage(content='{"summary_bullets": []}')
+
+    agent = LectureAgent(models={stage: Model() for stage in STAGE_MODELS}, workspace=workspace)
+    collapsed, slide_tokens = collapse_lecture(agent.artifact, agent.deduplicator, agent.image_detail)
+    first = agent._summarize_group(0, [1, 2], collapsed, slide_tokens)
+    second = agent._summarize_group(1, [3, 4, 5], collapsed, slide_tokens)
+    agent.artifact.close()
+
+    # The first group only held earlier frames of page-04, so it needs no call
+    assert first["collapsed"] == {"page-01": "page-04", "page-02": "page-04"} and first["notes"] == []
+    assert second["collapsed"] == {"page-03": "page-04"}
+    assert len(requests) == 1
+    prompt = requests[0][1]["content"][0]["text"]
+    assert "SLIDE_ID: page-04" in prompt and "SLIDE_ID: page-05" in prompt and "page-03" not in prompt
+    assert agent.report.calls[0].pages_deduplicated == 3
@@ -0,0 +1,58 @@
+# Standard library imports
+import json
+from pathlib import Path
+
+# Third-party imports
+import pytest
+
+# Local application imports
+from src.pdf2mindmap.utils.directory_reset import directory_reset
+from src.pdf2mindmap.utils.lecture_artifact import LectureArtifact, SUMMARY_OUTPUT
+from src.pdf2mindmap.utils.workspace import DEFAULT_WORKSPACE
+
+AppTest = pytest.importorskip("streamlit.testing.v1").AppTest
+pytest.importorskip("yfiles_graphs_for_streamlit")
+
+SCRIPT = Path(__file__).parents[1] / "src" / "pdf2mindmap" / "main" / "streamlit_mindmap.py"
+NO_MINDMAP = "No mindmap yet — run the pipeline first"
+MINDMAP = {
+    "nodes": [{"id": "root", "label": "Sortieren"}, {"id": "a", "label": "Quicksort"}],
+    "edges": [{"from": "root", "to": "a", "label": ""}]
+}
+
+
+@pytest.fixture
+def workspace(tmp_path, monkeypatch):
+    """Empty default workspace; the viewer's relative resource paths resolve below tmp_path."""
+    monkeypatch.chdir(tmp_path)
+    directory_reset(DEFAULT_WORKSPACE)
+    return DEFAULT_WORKSPACE
+
+
+def run_viewer() -> "AppTest":
+    app = AppTest.from_file(str(SCRIPT), default_timeout=30)
+    app.run()
+    assert not app.exception
+    return app
+
+
+def test_viewer_without_artifact_asks_for_a_run(workspace):
+    app = run_viewer()
+    assert [info.value for info in app.info] == [NO_MINDMAP]
+
+
+def test_viewer_without_mindmap_asks_for_a_run(workspace):
+    with LectureArtifact(workspace.artifact_path) as artifact:
+        artifact.put_output(SUMMARY_OUTPUT, "# Zusammenfassung")
+
+    app = run_viewer()
+    assert [info.value for info in app.info] == [NO_MINDMAP]
+
+
+def test_viewer_shows_the_mindmap(workspace):
+    with LectureArtifact(workspace.artifact_path) as artifact:
+        artifact.put_mindmap(json.dumps(MINDMAP))
+
+    app = run_viewer()
+    assert not app.info
+    assert app.caption[0].value == "Showing 2 of 2 nodes"